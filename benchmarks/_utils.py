@@ -0,0 +1,28 @@
+"""Helpers shared by the benchmarks. Run a benchmark from the repository root, ex. ``python -m benchmarks.bench_lru``."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import time
+from typing import Callable, List
+
+SRC = pathlib.Path(__file__).resolve().parent.parent / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+
+def best_of(func: Callable[[], object], *, repeat: int = 5) -> float:
+    """Returns the fastest of `repeat` runs of `func`, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def print_table(headers: List[str], rows: List[List[object]]) -> None:
+    widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *rows)]
+    for row in (headers, ["-" * width for width in widths], *rows):
+        print("  ".join(str(cell).rjust(width) for cell, width in zip(row, widths)))
@@ -0,0 +1,95 @@
+"""Compares the hit latency of :func:`kens_utils.danny_caches.cache` key modes against the old key builder.
+
+Usage: ``python -m benchmarks.bench_cache_keys [--calls 100000]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from typing import Any, Callable, Dict
+
+from ._utils import best_of, print_table
+
+from kens_utils import danny_caches
+
+
+def old_make_key(func: Callable[..., Any]) -> Callable[..., str]:
+    """The previous key builder, which defined its repr helper and the prefix on every call."""
+
+    def _make_key(args: tuple, kwargs: Dict[str, Any]) -> str:
+        def _true_repr(o):
+            if o.__class__.__repr__ is object.__repr__:
+                return f'<{o.__class__.__module__}.{o.__class__.__name__}>'
+            return repr(o)
+
+        key = [f'{func.__module__}.{func.__name__}']
+        key.extend(_true_repr(o) for o in args)
+        for k, v in kwargs.items():
+            if k == 'connection' or k == 'pool':
+                continue
+            key.append(_true_repr(k))
+            key.append(_true_repr(v))
+        return ':'.join(key)
+
+    return _make_key
+
+
+class Cog:
+    pass
+
+
+async def fetch(self: Cog, guild_id: int, user_id: int, *, fresh: bool = False) -> int:
+    return guild_id
+
+
+async def run(calls: int) -> None:
+    cog = Cog()
+    args = (cog, 123456789012345678, 876543210987654321)
+    kwargs = {"fresh": False}
+
+    # the old decorator is the new one with the old key builder patched in
+    old = danny_caches.cache()(fetch)
+    old_key = old_make_key(fetch)
+    old_cache = old.cache
+
+    def old_wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = old_key(args, kwargs)
+        try:
+            return old_cache[key]
+        except KeyError:
+            old_cache[key] = task = asyncio.ensure_future(fetch(*args, **kwargs))
+            return task
+
+    variants = {
+        "old string keys": old_wrapper,
+        "string keys": danny_caches.cache()(fetch),
+        "hashable_keys=True": danny_caches.cache(hashable_keys=True)(fetch),
+        "key=": danny_caches.cache(key=lambda self, guild_id, user_id, **_: (guild_id, user_id))(fetch),
+    }
+
+    rows = []
+    baseline = None
+    for name, wrapper in variants.items():
+        await wrapper(*args, **kwargs)  # warm the cache, every call below is a hit
+
+        def hits(wrapper: Callable[..., Any] = wrapper) -> None:
+            for _ in range(calls):
+                wrapper(*args, **kwargs)
+
+        latency = best_of(hits) / calls * 1e9
+        baseline = baseline or latency
+        rows.append([name, f"{latency:,.0f}", f"{baseline / latency:.1f}x"])
+
+    print_table(["variant", "ns/hit", "speedup"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compares :class:`kens_utils.umbra_async_config.Config` modes and :class:`SQLiteConfig` on configs of realistic sizes.
+
+Usage: ``python -m benchmarks.bench_config [--sizes 10000 100000] [--puts 100]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import pathlib
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from ._utils import best_of, print_table
+
+from kens_utils.umbra_async_config import Config, SQLiteConfig
+
+
+def guild_settings(i: int) -> Dict[str, Any]:
+    return {"prefix": "!", "log_channel": 10**17 + i, "blacklisted": i % 7 == 0, "roles": [i, i + 1, i + 2]}
+
+
+async def bench_mode(
+    directory: pathlib.Path, size: int, puts: int, name: str, factory: Callable[..., Any], **options: Any
+) -> List[Any]:
+    path = directory / f"{name}-{size}.json"
+    config = factory(path, **options)
+    await config.put_many({i: guild_settings(i) for i in range(size)})
+
+    start = time.perf_counter()
+    for i in range(puts):
+        await config.put(i, guild_settings(i + size))
+    put_time = (time.perf_counter() - start) / puts
+    await config.close()
+
+    # what a command does right after startup: open the config and read an entry
+    load_time = best_of(lambda: factory(path, **options).get(size // 2), repeat=3)
+
+    return [size, name, f"{put_time * 1e3:.3f}", f"{load_time * 1e3:.1f}"]
+
+
+async def run(sizes: List[int], puts: int) -> None:
+    modes: Dict[str, Tuple[Callable[..., Any], Dict[str, Any]]] = {
+        "json": (Config, {}),
+        "wal": (Config, {"wal": True}),
+        "sqlite": (SQLiteConfig, {}),
+    }
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            for name, (factory, options) in modes.items():
+                rows.append(await bench_mode(pathlib.Path(directory), size, puts, name, factory, **options))
+
+    print_table(["keys", "mode", "ms/put", f"open + first get ms (after {puts} puts)"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--puts", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes, args.puts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Compares the :class:`kens_utils.umbra_async_config.Config` serializers: dump/load time, file size and peak memory.
+
+``json (old)`` is the previous dump, which serialized a copy of the whole dict with discord.py's helpers.
+
+Usage: ``python -m benchmarks.bench_config_serializers [--sizes 10000 100000]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import pathlib
+import tempfile
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from ._utils import best_of, print_table
+
+from discord.utils import _to_json as to_json
+
+from kens_utils.cache_backends import JSON_SERIALIZER, Serializer
+from kens_utils import umbra_async_config
+from kens_utils.umbra_async_config import Config
+
+from .bench_config import guild_settings
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def old_dump(config: Config[Any]) -> None:
+    with config.path.open("w", encoding="utf-8") as f:
+        f.write(to_json(config._db.copy()))
+
+
+async def run(sizes: List[int]) -> None:
+    serializers: Dict[str, Optional[Serializer]] = {
+        "json": JSON_SERIALIZER,
+        "orjson": umbra_async_config.ORJSON_SERIALIZER,
+        "msgpack": umbra_async_config.MSGPACK_SERIALIZER,
+        "binary": umbra_async_config.BINARY_SERIALIZER,
+    }
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            data = {str(i): guild_settings(i) for i in range(size)}
+            for name, serializer in {"json (old)": JSON_SERIALIZER, **serializers}.items():
+                if serializer is None:
+                    rows.append([size, name, "not installed", "", "", "", "", ""])
+                    continue
+
+                path = pathlib.Path(directory) / f"{name}-{size}"
+                config: Config[Any] = Config(path, serializer=serializer)
+                config._db = data
+                dump: Callable[[], Any] = functools.partial(old_dump, config) if name == "json (old)" else config._dump
+
+                dump_time = best_of(dump, repeat=3)
+                dump_peak = peak_memory(dump)
+                load_time = best_of(config.load_from_file, repeat=3)
+                load_peak = peak_memory(config.load_from_file)
+                rows.append(
+                    [
+                        size,
+                        name,
+                        f"{dump_time * 1e3:.1f}",
+                        f"{load_time * 1e3:.1f}",
+                        f"{path.stat().st_size / 2**20:.2f}",
+                        f"{dump_peak / 2**20:.2f}",
+                        f"{load_peak / 2**20:.2f}",
+                    ]
+                )
+
+    print_table(["keys", "serializer", "dump ms", "load ms", "file MiB", "dump peak MiB", "load peak MiB"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Measures what importing :mod:`kens_utils.constants` and first using its tables costs: time and resident memory.
+
+Every run is a fresh interpreter that imports discord.py first (the rest of the package needs it anyway),
+so only the module itself and its tables are measured. Times are the fastest run's, memory is VmRSS (Linux).
+
+Usage: ``python -m benchmarks.bench_constants [--repeat 5]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List
+
+from ._utils import SRC, print_table
+
+TABLES = [
+    "emojidict",
+    "permission_proper_names",
+    "permission_descriptions",
+    "user_flag_descriptions",
+    "misc_flag_descriptions",
+    "guild_features",
+    "http_codes",
+    "CODEBLOCK_LANGUAGES",
+    "CodeblockLanguage",
+]
+
+CHILD = """
+import json, sys, time
+import discord.app_commands
+
+def rss():
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith("VmRSS:"))
+
+result = {}
+start_rss = rss()
+start = time.perf_counter()
+import kens_utils.constants as constants
+result["import"] = time.perf_counter() - start
+result["import_rss"] = rss() - start_rss
+
+for name in sys.argv[1:]:
+    start = time.perf_counter()
+    getattr(constants, name)
+    result[name] = time.perf_counter() - start
+result["tables_rss"] = rss() - start_rss
+print(json.dumps(result))
+"""
+
+
+def measure() -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as directory:
+        result = subprocess.run(
+            [sys.executable, "-c", CHILD, *TABLES],
+            cwd=directory,
+            env={**os.environ, "PYTHONPATH": str(SRC)},
+            stdout=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.repeat)]
+    best = {key: min(run[key] for run in runs) for key in runs[0]}
+
+    rows: List[List[object]] = [["import kens_utils.constants", f"{best['import'] * 1e3:.2f}", best["import_rss"]]]
+    rows += [[f"  first use of {name}", f"{best[name] * 1e3:.2f}", ""] for name in TABLES]
+    rows.append(["  total, every table used", f"{sum(best[key] for key in ['import', *TABLES]) * 1e3:.2f}", best["tables_rss"]])
+    print_table(["", "ms", "RSS KiB"], rows)
+
+
+if __name__ == "__main__":
+    main()
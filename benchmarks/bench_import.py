@@ -0,0 +1,84 @@
+"""Measures how long importing parts of :mod:`kens_utils` takes, with ``python -X importtime``.
+
+Every statement runs in a fresh interpreter, the time reported is the fastest run's total for the imports the
+statement made (``from kens_utils import *`` imports every submodule, like the package used to).
+Exits with status 1 if ``import kens_utils`` takes longer than ``--threshold-ms``, so it can guard against
+a submodule being imported eagerly again.
+
+Usage: ``python -m benchmarks.bench_import [--repeat 5] [--threshold-ms 50]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from typing import List, Tuple
+
+from ._utils import SRC, print_table
+
+STATEMENTS = [
+    "import kens_utils",
+    "from kens_utils import LRUCache",
+    "from kens_utils import Config",
+    "from kens_utils import ContextU",
+    "from kens_utils import *",
+]
+
+MARKER = "-- bench_import --"
+
+
+def import_time(statement: str) -> Tuple[float, int]:
+    """Returns the time (in seconds) the imports made by `statement` took, and how many modules it imported."""
+    code = f"import sys; sys.stderr.write({MARKER!r} + '\\n'); sys.stderr.flush(); {statement}"
+    # a scratch directory, so files the imports create don't end up in the repository
+    with tempfile.TemporaryDirectory() as directory:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=directory,
+            env={**os.environ, "PYTHONPATH": str(SRC)},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+    lines = result.stderr.splitlines()
+    lines = lines[lines.index(MARKER) + 1 :]
+
+    total = modules = 0
+    for line in lines:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules += 1
+        # nested imports are indented by two more spaces than the import that made them
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total / 1e6, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    rows: List[List[object]] = []
+    timings = {}
+    for statement in STATEMENTS:
+        runs = [import_time(statement) for _ in range(args.repeat)]
+        seconds, modules = min(runs)
+        timings[statement] = seconds
+        rows.append([statement, f"{seconds * 1e3:.1f}", modules])
+
+    print_table(["statement", "ms", "modules"], rows)
+
+    elapsed = timings[STATEMENTS[0]] * 1e3
+    if elapsed > args.threshold_ms:
+        sys.exit(f"{STATEMENTS[0]!r} took {elapsed:.1f} ms, over the {args.threshold_ms:g} ms threshold")
+
+
+if __name__ == "__main__":
+    main()
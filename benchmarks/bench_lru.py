@@ -0,0 +1,87 @@
+"""Compares get/set throughput of :class:`kens_utils.mysty_lru.LRUCache` against the old deque-based version.
+
+Usage: ``python -m benchmarks.bench_lru [--sizes 1000 10000 100000] [--ops 20000]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from collections import deque
+from typing import Any, Dict, List
+
+from ._utils import best_of, print_table
+
+from kens_utils.mysty_lru import LRUCache
+
+
+class DequeLRUCache:
+    """The previous implementation, which removes keys from a deque (O(n)) on every access."""
+
+    def __init__(self, max_size: int = 100) -> None:
+        self._max_size = max_size
+        self._keys: deque = deque()
+        self._cache: Dict[Any, Any] = {}
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if key in self._cache:
+            self._keys.remove(key)
+        elif len(self._cache) == self._max_size:
+            del self._cache[self._keys.popleft()]
+        self._cache[key] = value
+        self._keys.append(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key not in self._cache:
+            return default
+        self._keys.remove(key)
+        self._keys.append(key)
+        return self._cache[key]
+
+
+def bench(cls: type, size: int, ops: int) -> Dict[str, float]:
+    cache = cls(size)
+    for i in range(size):
+        cache[i] = i
+    keys: List[int] = [random.randrange(size) for _ in range(ops)]
+    new_keys = range(size, size + ops)
+
+    def gets() -> None:
+        get = cache.get
+        for key in keys:
+            get(key)
+
+    def sets() -> None:
+        for key in keys:
+            cache[key] = key
+
+    def evicting_sets() -> None:
+        for key in new_keys:
+            cache[key] = key
+
+    return {
+        "get": ops / best_of(gets, repeat=3),
+        "set": ops / best_of(sets, repeat=3),
+        "set+evict": ops / best_of(evicting_sets, repeat=1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--ops", type=int, default=20_000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    rows = []
+    for size in args.sizes:
+        old = bench(DequeLRUCache, size, args.ops)
+        new = bench(LRUCache, size, args.ops)
+        for op in old:
+            rows.append([size, op, f"{old[op]:,.0f}", f"{new[op]:,.0f}", f"{new[op] / old[op]:.1f}x"])
+
+    print_table(["entries", "operation", "deque ops/s", "LRUCache ops/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
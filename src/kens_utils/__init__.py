@@ -13,32 +13,226 @@ except NameError:
 else:
     __path__ = extend_path(__path__, __name__)
 
-from .constants import * # logger
-from .logger import *
-from .tree import *
-from .help_command import *
-
-from .checks import * # context
-from .paginatorv1 import * # context
-from .paginatorv2 import * # context
-from .command import * # context, views, danny_formats
-from .requests_http import * # constants
-from .context import * # requests
-from .enums import *
-from .converters import *
-from .bot import *
-from .cog import *
-from .loops import * # cog
-
-from .danny_caches import * # context
-from .danny_formats import * # context
-from .danny_pages import * # context
-from .danny_time import * # context
-from .mysty_lru import * # context
-from .umbra_async_config import * # context
-from .umbra_ui import * # context, views
-
-from .views import *
-from .viewsv2 import *
-from .methods import *
-from .colors import *
+import importlib
+import types
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+# Submodules are only imported when one of their names is first accessed (PEP 562), so importing a single
+# helper doesn't pay for discord.py, the paginators and the constants tables. A name exported by several
+# submodules resolves to the last one listed, like the star imports this replaces.
+# tests/test_lazy_imports.py checks that this table matches each submodule's __all__.
+_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    'constants': (
+        'emojidict', 'LOADING_EMOJI', 'permission_proper_names', 'CodeblockLanguage', 'CODEBLOCK_LANGUAGES',
+        'http_codes', 'HTTPCode', 'CURRENCY_SYMBOL', 'CURRENCY_NAME', 'RE_EMOJI', 'RE_URL', 'RE_INVITE', 'RE_GIFT',
+        'RE_HEX', 'RE_SNOWFLAKE', 'RE_DCTIMESTAMP', 'DISCORD_EPOCH', 'TRUSTED_USERS', 'GUILDS', 'guild_features',
+        'USE_DEFER_EMOJI', 'formatter', 'Snowflake', 'permission_descriptions', 'misc_flag_descriptions',
+        'user_flag_descriptions', 'DISCORD_FILE_SIZE_LIMIT',
+    ),
+    'settings': (
+        'Settings', 'get_settings', 'init',
+    ),
+    'logger': (
+        'requests_handler', 'requests_logger',
+    ),
+    'tree': (
+        'MentionableTree',
+    ),
+    'help_command': (
+        'BaseView', 'CogSelecter', 'CommandSelecter', 'GoBack', 'GoHome', 'Help', 'HelpCog', 'HelpCommand', 'HelpGroup',
+        'HelpView', 'Stop', 'grouper',
+    ),
+    'checks': (
+        'is_owner', 'is_trusted', 'Cooldown', 'is_support_server', 'check_permissions', 'check_bot_permissions',
+        'has_permissions', 'bot_has_permissions', 'has_guild_permissions', 'bot_has_guild_permissions',
+        'has_permissions_or_dm', 'hybrid_permissions_check', 'bot_hybrid_permissions_check', 'is_manager', 'is_mod',
+        'is_admin', 'is_in_guilds', 'disable_command',
+    ),
+    'paginatorv1': (
+        'BaseButtonPaginator', 'ButtonPaginator', 'ThreeButtonPaginator', 'FiveButtonPaginator', 'GoToPageButton',
+        'GoToPageModal', 'create_paginator', 'generate_pages',
+    ),
+    'paginatorv2': (
+        'BaseButtonPaginatorV2', 'ButtonPaginatorV2', 'ThreeButtonPaginatorV2', 'FiveButtonPaginatorV2',
+        'create_paginator_v2', 'generate_pages_v2',
+    ),
+    'command': (
+        'PromptSelect', 'PromptView', 'AutoComplete', 'CommandU', 'GroupU', 'HybridCommandU', 'HybridGroupU', 'command',
+        'hybrid_command', 'group', 'hybrid_group',
+    ),
+    'requests_http': (
+        'BufferedResponse', 'CachedResponse', 'CircuitBreaker', 'CircuitOpenError', 'DEFAULT_CIRCUIT_BREAKER',
+        'DEFAULT_HTTP_METRICS', 'DEFAULT_HTTP_CACHE', 'DEFAULT_RATE_LIMITER', 'DEFAULT_RETRY_POLICY', 'HTTPCache',
+        'HTTPMetrics', 'Histogram', 'RateLimitBucket', 'RateLimiter', 'RequestResult', 'ResponseTooLargeError',
+        'RetryBudget', 'RetryPolicy', 'SessionPool', 'download_file', 'gather_requests', 'get_session_pool',
+        'iter_response_chunks', 'parse_retry_after', 'set_session_pool', 'stream_response', '_delete', '_get', '_patch',
+        '_post', '_put',
+    ),
+    'context': (
+        'ConfirmationView', 'ContextU', 'GuildContextU', 'DMContextU', 'prompt',
+    ),
+    'enums': (
+        'EnumU', 'RequestType', 'CircuitState', 'IntegrationType',
+    ),
+    'converters': (
+        'can_execute_action', 'MemberID', 'BannedMember', 'EmojiConverter', 'EnumBaseConverter',
+    ),
+    'bot': (
+        'BotU',
+    ),
+    'cog': (
+        'CogU',
+    ),
+    'loops': (
+        'MaybeManagedLoop', 'loop',
+    ),
+    'cache_backends': (
+        'CacheBackend', 'JSON_SERIALIZER', 'PICKLE_SERIALIZER', 'SQLiteBackend', 'Serializer',
+    ),
+    'danny_caches': (
+        'CacheProtocol', 'ExpiringCache', 'Strategy', 'cache',
+    ),
+    'danny_formats': (
+        'plural', 'human_join', 'TabularData', 'format_dt', 'tick',
+    ),
+    'danny_pages': (
+        'NumberedPageModal', 'RoboPages', 'FieldPageSource', 'TextPageSource', 'SimplePageSource', 'SimplePages',
+    ),
+    'danny_time': (
+        'ShortTime', 'RelativeDelta', 'HumanTime', 'Time', 'FutureTime', 'BadTimeTransform', 'TimeTransformer',
+        'FriendlyTimeResult', 'UserFriendlyTime', 'human_timedelta', 'format_relative',
+    ),
+    'mysty_lru': (
+        'LRUCache',
+    ),
+    'umbra_async_config': (
+        'BINARY_SERIALIZER', 'Config', 'DEFAULT_SERIALIZER', 'MSGPACK_SERIALIZER', 'ORJSON_SERIALIZER', 'SQLiteConfig',
+        'ShardedConfig', 'flush_all',
+    ),
+    'umbra_ui': (
+        'UmbraBaseView', 'UmbraConfirmationView', 'UmbraSelfDeleteView',
+    ),
+    'views': (
+        'URLButton', 'CustomBaseView', 'CustomBaseSelect', 'CustomBaseModal', 'SendModalView',
+    ),
+    'viewsv2': (
+        'CustomBaseViewV2', 'SendModalRowV2',
+    ),
+    'methods': (
+        'makeembed', 'makeembed_bot', 'makeembed_failedaction', 'makeembed_partialaction', 'makeembed_successfulaction',
+        'dctimestamp', 'dchyperlink', 'parse_discord_snowflake', 'snowflake_timestamp', 'utcnow', 'get_any_key',
+        'create_codeblock', '_autocomplete', 'generic_autocomplete', 'merge_permissions', 'generate_transaction_id',
+        'oauth_url', 'get_max_file_upload_limit', 'string_io', 'list_to_occurance_dict', 'send_modal_hybrid',
+        'get_copyable_slash_command_format',
+    ),
+    'colors': (
+        'danny_red', 'danny_green',
+    ),
+}
+
+_LAZY_ATTRIBUTES: Dict[str, str] = {name: module for module, names in _EXPORTS.items() for name in names}
+
+# exported names that are also submodules (command), importing the submodule binds it over the name
+_SHADOWED: Tuple[str, ...] = tuple(name for name in _EXPORTS if name in _LAZY_ATTRIBUTES)
+
+# Written out so type checkers can read it, tests/test_lazy_imports.py checks it against _EXPORTS. The submodules
+# are included, they used to be reachable through the star imports too.
+# fmt: off
+__all__ = (
+    'emojidict', 'LOADING_EMOJI', 'permission_proper_names', 'CodeblockLanguage', 'CODEBLOCK_LANGUAGES', 'http_codes',
+    'HTTPCode', 'CURRENCY_SYMBOL', 'CURRENCY_NAME', 'RE_EMOJI', 'RE_URL', 'RE_INVITE', 'RE_GIFT', 'RE_HEX',
+    'RE_SNOWFLAKE', 'RE_DCTIMESTAMP', 'DISCORD_EPOCH', 'TRUSTED_USERS', 'GUILDS', 'guild_features', 'USE_DEFER_EMOJI',
+    'formatter', 'Snowflake', 'permission_descriptions', 'misc_flag_descriptions', 'user_flag_descriptions',
+    'DISCORD_FILE_SIZE_LIMIT', 'Settings', 'get_settings', 'init', 'requests_handler', 'requests_logger',
+    'MentionableTree', 'BaseView', 'CogSelecter', 'CommandSelecter', 'GoBack', 'GoHome', 'Help', 'HelpCog',
+    'HelpCommand', 'HelpGroup', 'HelpView', 'Stop', 'grouper', 'is_owner', 'is_trusted', 'Cooldown',
+    'is_support_server', 'check_permissions', 'check_bot_permissions', 'has_permissions', 'bot_has_permissions',
+    'has_guild_permissions', 'bot_has_guild_permissions', 'has_permissions_or_dm', 'hybrid_permissions_check',
+    'bot_hybrid_permissions_check', 'is_manager', 'is_mod', 'is_admin', 'is_in_guilds', 'disable_command',
+    'BaseButtonPaginator', 'ButtonPaginator', 'ThreeButtonPaginator', 'FiveButtonPaginator', 'GoToPageButton',
+    'GoToPageModal', 'create_paginator', 'generate_pages', 'BaseButtonPaginatorV2', 'ButtonPaginatorV2',
+    'ThreeButtonPaginatorV2', 'FiveButtonPaginatorV2', 'create_paginator_v2', 'generate_pages_v2', 'PromptSelect',
+    'PromptView', 'AutoComplete', 'CommandU', 'GroupU', 'HybridCommandU', 'HybridGroupU', 'command', 'hybrid_command',
+    'group', 'hybrid_group', 'BufferedResponse', 'CachedResponse', 'CircuitBreaker', 'CircuitOpenError',
+    'DEFAULT_CIRCUIT_BREAKER', 'DEFAULT_HTTP_METRICS', 'DEFAULT_HTTP_CACHE', 'DEFAULT_RATE_LIMITER',
+    'DEFAULT_RETRY_POLICY', 'HTTPCache', 'HTTPMetrics', 'Histogram', 'RateLimitBucket', 'RateLimiter', 'RequestResult',
+    'ResponseTooLargeError', 'RetryBudget', 'RetryPolicy', 'SessionPool', 'download_file', 'gather_requests',
+    'get_session_pool', 'iter_response_chunks', 'parse_retry_after', 'set_session_pool', 'stream_response', '_delete',
+    '_get', '_patch', '_post', '_put', 'ConfirmationView', 'ContextU', 'GuildContextU', 'DMContextU', 'prompt',
+    'EnumU', 'RequestType', 'CircuitState', 'IntegrationType', 'can_execute_action', 'MemberID', 'BannedMember',
+    'EmojiConverter', 'EnumBaseConverter', 'BotU', 'CogU', 'MaybeManagedLoop', 'loop', 'CacheBackend',
+    'JSON_SERIALIZER', 'PICKLE_SERIALIZER', 'SQLiteBackend', 'Serializer', 'CacheProtocol', 'ExpiringCache',
+    'Strategy', 'cache', 'plural', 'human_join', 'TabularData', 'format_dt', 'tick', 'NumberedPageModal', 'RoboPages',
+    'FieldPageSource', 'TextPageSource', 'SimplePageSource', 'SimplePages', 'ShortTime', 'RelativeDelta', 'HumanTime',
+    'Time', 'FutureTime', 'BadTimeTransform', 'TimeTransformer', 'FriendlyTimeResult', 'UserFriendlyTime',
+    'human_timedelta', 'format_relative', 'LRUCache', 'BINARY_SERIALIZER', 'Config', 'DEFAULT_SERIALIZER',
+    'MSGPACK_SERIALIZER', 'ORJSON_SERIALIZER', 'SQLiteConfig', 'ShardedConfig', 'flush_all', 'UmbraBaseView',
+    'UmbraConfirmationView', 'UmbraSelfDeleteView', 'URLButton', 'CustomBaseView', 'CustomBaseSelect',
+    'CustomBaseModal', 'SendModalView', 'CustomBaseViewV2', 'SendModalRowV2', 'makeembed', 'makeembed_bot',
+    'makeembed_failedaction', 'makeembed_partialaction', 'makeembed_successfulaction', 'dctimestamp', 'dchyperlink',
+    'parse_discord_snowflake', 'snowflake_timestamp', 'utcnow', 'get_any_key', 'create_codeblock', '_autocomplete',
+    'generic_autocomplete', 'merge_permissions', 'generate_transaction_id', 'oauth_url', 'get_max_file_upload_limit',
+    'string_io', 'list_to_occurance_dict', 'send_modal_hybrid', 'get_copyable_slash_command_format', 'danny_red',
+    'danny_green',
+    # submodules
+    'constants', 'settings', 'logger', 'tree', 'help_command', 'checks', 'paginatorv1', 'paginatorv2', 'requests_http',
+    'context', 'enums', 'converters', 'bot', 'cog', 'loops', 'cache_backends', 'danny_caches', 'danny_formats',
+    'danny_pages', 'danny_time', 'mysty_lru', 'umbra_async_config', 'umbra_ui', 'views', 'viewsv2', 'methods',
+    'colors',
+)
+# fmt: on
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    elif name in _EXPORTS:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    namespace = globals()
+    for shadowed in _SHADOWED:
+        if isinstance(namespace.get(shadowed), types.ModuleType):
+            del namespace[shadowed]
+    namespace[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *_EXPORTS})
+
+
+if TYPE_CHECKING:
+    from .constants import *
+    from .settings import *
+    from .logger import *
+    from .tree import *
+    from .help_command import *
+
+    from .checks import *
+    from .paginatorv1 import *
+    from .paginatorv2 import *
+    from .command import *
+    from .requests_http import *
+    from .context import *
+    from .enums import *
+    from .converters import *
+    from .bot import *
+    from .cog import *
+    from .loops import *
+
+    from .cache_backends import *
+    from .danny_caches import *
+    from .danny_formats import *
+    from .danny_pages import *
+    from .danny_time import *
+    from .mysty_lru import *
+    from .umbra_async_config import *
+    from .umbra_ui import *
+
+    from .views import *
+    from .viewsv2 import *
+    from .methods import *
+    from .colors import *
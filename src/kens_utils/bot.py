@@ -41,7 +41,9 @@ from discord.utils import deprecated
 
 from .methods import makeembed_failedaction
 from .context import ContextU
+from .requests_http import SessionPool, set_session_pool
 from .tree import MentionableTree
+from .umbra_async_config import flush_all as flush_configs
 import weakref  # Library's way of storing user cache
 
 # fmt: off
@@ -75,12 +77,16 @@ class BotU(AutoShardedBot):
 
     _user_cache: weakref.WeakValueDictionary[int, User]  # similar to library approach
 
+    session_pool: SessionPool
+    """The pool of long-lived HTTP sessions used by :func:`_request` (and :class:`CogU`'s request methods)."""
+
     def __init__(
         self,
         *args,
         translator_cls: Optional[Translator] = None,
         translator_args: List = [],
         translator_kwargs: Dict = {},
+        session_pool_options: Optional[Dict[str, Any]] = None,
         **kwargs,
     ) -> None:
         if kwargs.get("cls", None):
@@ -111,6 +117,9 @@ class BotU(AutoShardedBot):
 
         self._user_cache = weakref.WeakValueDictionary()
 
+        # sessions are only created once a request is made, so this is safe to do outside of the loop
+        self.session_pool = SessionPool(**(session_pool_options or {}))
+
         self._listener_funcs = [
             #     (_cache_update_on_message, 'on_message'),
             (self._cache_update_on_interaction, 'on_interaction'),
@@ -132,6 +141,9 @@ class BotU(AutoShardedBot):
 
         :meta private:
         """
+        await self.session_pool.open()
+        set_session_pool(self.session_pool)
+
         if not self.owner_ids:
             assert self.application is not None
             if self.application.team:
@@ -147,6 +159,19 @@ class BotU(AutoShardedBot):
 
         await self.get_or_fetch_application_emojis()
 
+    async def close(self) -> None:
+        """|coro|
+        Closes the connection to Discord, then closes every session in :attr:`session_pool`
+        and flushes the pending changes of every :class:`Config`.
+
+        :meta private:
+        """
+        try:
+            await super().close()
+        finally:
+            await self.session_pool.close()
+            await flush_configs()
+
     @property
     def avatar_url(self) -> str:
         """
@@ -0,0 +1,320 @@
+"""Backends that let :func:`danny_caches.cache` share cached results between processes.
+
+The decorator keeps caching tasks in-process as usual, a backend is only consulted when that in-process
+cache misses: the result is read from the backend if another process already computed it, or computed and
+written to it otherwise. Invalidations are applied to the backend and broadcast to every other process
+using it, which drop the matching entries from their in-process caches.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import contextlib
+import logging
+import pathlib
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from discord.utils import _from_json as from_json, _to_json as to_json
+
+# fmt: off
+__all__ = (
+    'CacheBackend',
+    'JSON_SERIALIZER',
+    'PICKLE_SERIALIZER',
+    'SQLiteBackend',
+    'Serializer',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+InvalidationCallback = Callable[[str, str, Any], None]
+
+
+class Serializer(NamedTuple):
+    """How a backend turns cached results into bytes and back."""
+
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+PICKLE_SERIALIZER = Serializer(pickle.dumps, pickle.loads)
+"""Serializes any picklable result. Only use it with files that untrusted processes can't write to."""
+
+JSON_SERIALIZER = Serializer(lambda obj: to_json(obj).encode(), from_json)
+"""Serializes JSON-compatible results, using ``orjson`` if it is installed."""
+
+
+class CacheBackend(abc.ABC):
+    """The interface of a backend shared by several processes.
+
+    Every cached function uses its own namespace, which its keys start with. Entries are written along with
+    the tokens of their arguments (see :meth:`token`), of the reprs of their arguments (see :meth:`repr_token`)
+    and of their tags (see :meth:`tag_token`), so they can be found again by an invalidation:
+    ``(namespace, "key", key)`` drops a single entry, ``(namespace, "arg", value)`` the entries with that argument,
+    ``(namespace, "tag", tag)`` the entries with that tag and ``(namespace, "containing", value)`` the entries with
+    that argument as well as those with an argument whose repr starts with the string.
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: List[InvalidationCallback] = []
+
+    @staticmethod
+    def token(namespace: str, value: Any) -> str:
+        """Returns the token of an argument or tag `value` of an entry in `namespace`."""
+        return f"{namespace}\x1f{value!r}"
+
+    @staticmethod
+    def tag_token(namespace: str, tag: Any) -> str:
+        """Returns the token of a tag `tag` of an entry in `namespace`."""
+        return f"{namespace}\x1f<tag {tag!r}>"
+
+    @staticmethod
+    def repr_token(namespace: str, text: str) -> str:
+        """Returns the token of the repr `text` of an argument of an entry in `namespace`.
+
+        The repr comes last, so the tokens of the reprs starting with a prefix are the tokens starting with
+        ``repr_token(namespace, prefix)``.
+        """
+        return f"{namespace}\x1f<repr>{text}"
+
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        """Registers `callback`, called with ``(namespace, kind, value)`` for every invalidation made by another process."""
+        self._callbacks.append(callback)
+
+    def _dispatch(self, namespace: str, kind: str, value: Any) -> None:
+        for callback in self._callbacks:
+            try:
+                callback(namespace, kind, value)
+            except Exception:
+                _log.exception("Ignoring exception in cache invalidation callback %r", callback)
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> Any:
+        """Returns the result stored for `key`, raises :exc:`KeyError` if it is missing or expired."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: Any, *, ttl: Optional[float] = None, tokens: Iterable[str] = ()) -> None:
+        """Stores `value` for `key`, for `ttl` seconds (forever if ``None``)."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def invalidate(self, namespace: str, kind: str, value: Any) -> None:
+        """Drops the matching entries and broadcasts the invalidation to the other processes.
+
+        This doesn't block, but the entries must be gone by the time this backend is asked for them again.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Releases the backend's resources."""
+
+
+class SQLiteBackend(CacheBackend):
+    """A backend stored in a SQLite database, which every process on the machine opens.
+
+    Results are serialized with `serializer` and written in WAL mode, so readers don't block the writer.
+    Invalidations are appended to a table that every process polls every `poll_interval` seconds
+    (starting with the first time the backend is used from a running event loop). Within an event loop they are
+    written from a thread, which :meth:`get`, :meth:`set` and :meth:`close` wait for.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`pathlib.Path`]
+        The database file, created if it doesn't exist.
+    serializer: :class:`Serializer`
+        Defaults to :data:`PICKLE_SERIALIZER`.
+    poll_interval: :class:`float`
+        How often (in seconds) to look for invalidations made by other processes.
+    """
+
+    # invalidations are only kept long enough for every process to poll them
+    INVALIDATION_RETENTION: float = 300.0
+
+    def __init__(
+        self,
+        path: Union[str, pathlib.Path],
+        *,
+        serializer: Serializer = PICKLE_SERIALIZER,
+        poll_interval: float = 0.5,
+    ) -> None:
+        super().__init__()
+        self.path: pathlib.Path = pathlib.Path(path)
+        self.serializer: Serializer = serializer
+        self.poll_interval: float = poll_interval
+
+        # identifies this backend's own invalidations when polling
+        self._origin: str = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL);
+            CREATE TABLE IF NOT EXISTS tokens (token TEXT NOT NULL, key TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS tokens_token ON tokens (token);
+            CREATE INDEX IF NOT EXISTS tokens_key ON tokens (key);
+            CREATE TABLE IF NOT EXISTS invalidations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                origin TEXT NOT NULL,
+                namespace TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                value BLOB NOT NULL,
+                created_at REAL NOT NULL
+            );
+            """
+        )
+        self._last_invalidation: int = self._db.execute("SELECT COALESCE(MAX(id), 0) FROM invalidations").fetchone()[0]
+        self._poller: Optional[asyncio.Task[None]] = None
+        self._pending: Set[asyncio.Future[None]] = set()
+        self._closed: bool = False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={str(self.path)!r}>"
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            else:
+                self._db.execute("COMMIT")
+
+    def _ensure_polling(self) -> None:
+        if self._poller is None and not self._closed and self._callbacks:
+            self._poller = asyncio.get_running_loop().create_task(self._poll_forever())
+
+    async def _poll_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                invalidations = await asyncio.to_thread(self._poll)
+            except sqlite3.Error:
+                _log.exception("Failed to poll cache invalidations from %s", self.path)
+                continue
+
+            for namespace, kind, value in invalidations:
+                self._dispatch(namespace, kind, value)
+
+    def _poll(self) -> List[Tuple[str, str, Any]]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, origin, namespace, kind, value FROM invalidations WHERE id > ? ORDER BY id",
+                (self._last_invalidation,),
+            ).fetchall()
+
+        invalidations = []
+        for id_, origin, namespace, kind, value in rows:
+            self._last_invalidation = id_
+            if origin == self._origin:
+                continue
+            try:
+                invalidations.append((namespace, kind, self.serializer.loads(value)))
+            except Exception:
+                _log.exception("Ignoring cache invalidation %d of %s that can't be deserialized", id_, namespace)
+        return invalidations
+
+    async def _wait_for_invalidations(self) -> None:
+        if self._pending:
+            await asyncio.wait(self._pending)
+
+    def _get(self, key: str) -> Any:
+        with self._lock:
+            row = self._db.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            raise KeyError(key)
+        return self.serializer.loads(row[0])
+
+    async def get(self, key: str) -> Any:
+        self._ensure_polling()
+        await self._wait_for_invalidations()
+        return await asyncio.to_thread(self._get, key)
+
+    def _set(self, key: str, value: bytes, expires_at: Optional[float], tokens: List[str]) -> None:
+        with self._transaction() as db:
+            db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?)", (key, value, expires_at))
+            db.execute("DELETE FROM tokens WHERE key = ?", (key,))
+            db.executemany("INSERT INTO tokens VALUES (?, ?)", [(token, key) for token in tokens])
+            # expired entries are only dropped when something is written
+            now = time.time()
+            expired = "SELECT key FROM entries WHERE expires_at <= ?"
+            db.execute(f"DELETE FROM tokens WHERE key IN ({expired})", (now,))
+            db.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+
+    async def set(self, key: str, value: Any, *, ttl: Optional[float] = None, tokens: Iterable[str] = ()) -> None:
+        self._ensure_polling()
+        await self._wait_for_invalidations()
+        expires_at = time.time() + ttl if ttl is not None else None
+        await asyncio.to_thread(self._set, key, self.serializer.dumps(value), expires_at, list(tokens))
+
+    def _keys_for(self, db: sqlite3.Connection, namespace: str, kind: str, value: Any) -> Set[str]:
+        if kind == "key":
+            return {value}
+
+        token = self.tag_token(namespace, value) if kind == "tag" else self.token(namespace, value)
+        keys = {key for (key,) in db.execute("SELECT key FROM tokens WHERE token = ?", (token,))}
+        if kind == "containing" and isinstance(value, str):
+            # a range over the tokens index, the highest code point sorts after every continuation of the prefix
+            start = self.repr_token(namespace, value)
+            rows = db.execute("SELECT key FROM tokens WHERE token >= ? AND token < ?", (start, start + "\U0010ffff"))
+            keys.update(key for (key,) in rows)
+        return keys
+
+    def _invalidate(self, namespace: str, kind: str, value: Any, payload: Optional[bytes]) -> None:
+        now = time.time()
+        with self._transaction() as db:
+            keys = [(key,) for key in self._keys_for(db, namespace, kind, value)]
+            db.executemany("DELETE FROM entries WHERE key = ?", keys)
+            db.executemany("DELETE FROM tokens WHERE key = ?", keys)
+            if payload is not None:
+                db.execute(
+                    "INSERT INTO invalidations (origin, namespace, kind, value, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (self._origin, namespace, kind, payload, now),
+                )
+            db.execute("DELETE FROM invalidations WHERE created_at < ?", (now - self.INVALIDATION_RETENTION,))
+
+    def _invalidated(self, future: asyncio.Future[None]) -> None:
+        self._pending.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            _log.error("Failed to write a cache invalidation to %s", self.path, exc_info=future.exception())
+
+    def invalidate(self, namespace: str, kind: str, value: Any) -> None:
+        try:
+            payload: Optional[bytes] = self.serializer.dumps(value)
+        except Exception:
+            _log.exception("Can't serialize the invalidation of %r, other processes won't see it", value)
+            payload = None
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._invalidate(namespace, kind, value, payload)
+            return
+
+        future = loop.create_task(asyncio.to_thread(self._invalidate, namespace, kind, value, payload))
+        self._pending.add(future)
+        future.add_done_callback(self._invalidated)
+
+    async def close(self) -> None:
+        self._closed = True
+        await self._wait_for_invalidations()
+        if self._poller is not None:
+            self._poller.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._poller
+            self._poller = None
+        with self._lock:
+            self._db.close()
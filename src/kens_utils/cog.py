@@ -1,6 +1,6 @@
 from __future__ import annotations
 import logging
-from typing import Any, List, Optional, ParamSpec, TYPE_CHECKING, Type, TypeVar, Union
+from typing import Any, AsyncIterator, Iterable, List, Optional, ParamSpec, TYPE_CHECKING, Type, TypeVar, Union
 import uuid
 
 import aiohttp
@@ -9,7 +9,23 @@ from discord.ext.commands import Cog
 from discord.ext.tasks import Loop
 
 from .bot import BotU
-from .requests_http import _delete, _get, _patch, _post, _put
+from .requests_http import (
+    BufferedResponse,
+    CircuitBreaker,
+    HTTPCache,
+    RateLimiter,
+    RequestLike,
+    RequestResult,
+    RetryPolicy,
+    SessionPool,
+    _delete,
+    _get,
+    _patch,
+    _post,
+    _put,
+    gather_requests,
+    get_session_pool,
+)
 
 if TYPE_CHECKING:
     from .loops import MaybeManagedLoop
@@ -64,6 +80,22 @@ class CogU(Cog,):# metaclass=CogUMeta):
     brief: Optional[str]
     nsfw: bool
 
+    retry_policy: Optional[RetryPolicy] = None
+    """The :class:`RetryPolicy` used by this cog's request methods. If ``None``, :data:`DEFAULT_RETRY_POLICY` is used.
+    Can be overridden per request by passing `retry_policy`."""
+
+    rate_limiter: Optional[RateLimiter] = None
+    """The :class:`RateLimiter` used by this cog's request methods. If ``None``, the shared :data:`DEFAULT_RATE_LIMITER` is used.
+    Can be overridden per request by passing `rate_limiter`."""
+
+    circuit_breaker: Optional[CircuitBreaker] = None
+    """The :class:`CircuitBreaker` used by this cog's request methods. If ``None``, the shared :data:`DEFAULT_CIRCUIT_BREAKER` is used.
+    Can be overridden per request by passing `circuit_breaker`."""
+
+    http_cache: Union[bool, HTTPCache] = False
+    """Whether :meth:`_get` caches responses by default. ``True`` uses the shared :data:`DEFAULT_HTTP_CACHE`,
+    a :class:`HTTPCache` uses that cache. Can be overridden per request by passing `cache`."""
+
     def __init_subclass__(cls: Type[CogU], **kwargs: Any) -> None:
         """This is called when a subclass is created.
         Its purpose is to add parameters to the cog
@@ -133,38 +165,65 @@ class CogU(Cog,):# metaclass=CogUMeta):
     def logger(self):
         return logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
+    @property
+    def session_pool(self) -> SessionPool:
+        """The :class:`SessionPool` used by this cog's request methods.
+        This is the bot's :attr:`BotU.session_pool` if it has one, else the process-wide pool."""
+        pool = getattr(getattr(self, "bot", None), "session_pool", None)
+        if pool is None:
+            pool = get_session_pool()
+        return pool
+
+    def _apply_request_defaults(self, kwargs: dict) -> dict:
+        """Fills in this cog's defaults for the request methods, without overriding anything passed explicitly."""
+        kwargs.setdefault("pool", self.session_pool)
+        if self.retry_policy is not None:
+            kwargs.setdefault("retry_policy", self.retry_policy)
+        if self.rate_limiter is not None:
+            kwargs.setdefault("rate_limiter", self.rate_limiter)
+        if self.circuit_breaker is not None:
+            kwargs.setdefault("circuit_breaker", self.circuit_breaker)
+        return kwargs
+
     # def get_commands(self) -> List[CommandU[Self, ..., Any]]:
     #     return super().get_commands()
 
-    async def _get(self, *args, **kwargs) -> aiohttp.ClientResponse:
+    async def _get(self, *args, **kwargs) -> Union[aiohttp.ClientResponse, BufferedResponse]:
         """|coro|
         Performs a GET request on the given URL.
         This method is a wrapper for :meth:`aiohttp.ClientSession.get`."""
-        return await _get(*args, **kwargs)
+        if self.http_cache:
+            kwargs.setdefault("cache", self.http_cache)
+        return await _get(*args, **self._apply_request_defaults(kwargs))
 
-    async def _post(self,  *args, **kwargs) -> aiohttp.ClientResponse:
+    async def _post(self,  *args, **kwargs) -> Union[aiohttp.ClientResponse, BufferedResponse]:
         """|coro|
         Performs a POST request on the given URL.
         This method is a wrapper for :meth:`aiohttp.ClientSession.post`."""
-        return await _post(*args, **kwargs)
+        return await _post(*args, **self._apply_request_defaults(kwargs))
 
-    async def _patch(self, *args, **kwargs) -> aiohttp.ClientResponse:
+    async def _patch(self, *args, **kwargs) -> Union[aiohttp.ClientResponse, BufferedResponse]:
         """|coro|
         Performs a PATCH request on the given URL.
         This method is a wrapper for :meth:`aiohttp.ClientSession.patch`."""
-        return await _patch(*args, **kwargs)
+        return await _patch(*args, **self._apply_request_defaults(kwargs))
 
-    async def _put(self, *args, **kwargs) -> aiohttp.ClientResponse:
+    async def _put(self, *args, **kwargs) -> Union[aiohttp.ClientResponse, BufferedResponse]:
         """"|coro|
         Performs a PUT request on the given URL.
         This method is a wrapper for :meth:`aiohttp.ClientSession.put`."""
-        return await _put(*args, **kwargs)
+        return await _put(*args, **self._apply_request_defaults(kwargs))
 
-    async def _delete(self, *args, **kwargs) -> aiohttp.ClientResponse:
+    async def _delete(self, *args, **kwargs) -> Union[aiohttp.ClientResponse, BufferedResponse]:
         """|coro|
         Performs a DELETE request on the given URL.
         This method is a wrapper for :meth:`aiohttp.ClientSession.delete`."""
-        return await _delete( *args, **kwargs)
+        return await _delete(*args, **self._apply_request_defaults(kwargs))
+
+    def _gather_requests(self, requests: Iterable[RequestLike], **kwargs) -> AsyncIterator[RequestResult]:
+        """Makes many requests with bounded concurrency, yielding each result as it completes.
+        This method is a wrapper for :func:`gather_requests` that uses this cog's request defaults."""
+        return gather_requests(requests, **self._apply_request_defaults(kwargs))
 
     async def get_command_mention(self, command: Union[str, commands.Command]):
         """|coro|
@@ -9,6 +9,7 @@ from ..bot import BotU
 from ..cog import CogU
 from ..context import ContextU
 from ..methods import dctimestamp
+from ..requests_http import CircuitOpenError
 
 class ErrorHandler(CogU, hidden=True):
     bot: BotU
@@ -84,6 +85,9 @@ class ErrorHandler(CogU, hidden=True):
         elif isinstance(error, commands.TooManyArguments):
             message = "Too many arguments. Please try again."
 
+        elif isinstance(error, CircuitOpenError):
+            message = f"An external service this command relies on is currently unavailable. Please try again {dctimestamp(int(time.time()+error.retry_after)+1,'R')}."
+
         elif isinstance(error, commands.CheckFailure):
             message = "The check for this command failed. You most likely do not have permission to use this command or are using it in the wrong channel."
 
@@ -1,13 +1,16 @@
 from __future__ import annotations
 from collections import defaultdict as emojidictionary
 import datetime
+import functools
 import logging
-import os
+import marshal
+import pathlib
 import re
-from typing import Annotated, Dict, List, Literal, Union
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Dict, List, Literal, Mapping, Optional, Union
 
-from discord import app_commands
-import yaml
+from .settings import get_settings
 
 # fmt: off
 __all__ = (
@@ -42,2910 +45,143 @@ __all__ = (
 )
 # fmt: on
 
+_log = logging.getLogger(__name__)
+
 def constant_factory(value):
     return lambda: value
 
 DEFAULT_FOOTER_NAME = "@aidenpearce3066"
 """Default footer name with the bot owner's name. This is used when no other footer information is available.""" 
 
-emojidict: Annotated[emojidictionary, 
-"A dictionary that maps strings to emojis in the form `name`: `emoji_str`."
-] = emojidictionary(
-    constant_factory("\U00002753"),
-    {
-        "x": "<a:X_:1046808381266067547>",
-        "check": "<a:check_:1046808377373769810>",
-        "L": "\U0001f1f1",
-        "l": "\U0001f1f1",
-        "salute": "\U0001fae1",
-        "alarmclock": "\U000023f0",
-        "bot": "\U0001f916",
-        "caution": "\U000026a0\U0000fe0f",
-        "person": "\U0001f464",
-        "1st": "\U0001f947",
-        "2nd": "\U0001f948",
-        "3rd": "\U0001f949",
-        "1": "\U00000031\U0000fe0f\U000020e3",
-        "2": "\U00000032\U0000fe0f\U000020e3",
-        "3": "\U00000033\U0000fe0f\U000020e3",
-        "4": "\U00000034\U0000fe0f\U000020e3",
-        "5": "\U00000035\U0000fe0f\U000020e3",
-        "6": "\U00000036\U0000fe0f\U000020e3",
-        "7": "\U00000037\U0000fe0f\U000020e3",
-        "8": "\U00000038\U0000fe0f\U000020e3",
-        "9": "\U00000039\U0000fe0f\U000020e3",
-        "10": "\U0001f51f",
-        "game": "\U0001f3ae",
-        "thumbsup_": "<:upvote:1176051534950322246>",
-        "thumbsdown_": "<:downvote:1176051583381942342>",
-        "star_": "<:star:1176051612234555432>",
-        "notepad": "\U0001f4dd",
-        "i": "\U00002139\U0000fe0f",
-        #'left': '\U00002b05\U0000fe0f',
-        #'right': '\U000027a1\U0000fe0f',
-        "vote": "\U0001f5f3",
-        # global
-        "x2": "\U0000274c",
-        True: "<a:check_:1046808377373769810>",
-        "check2": "\U00002705",
-        #"L": "\U0001f1f1",
-        #"l": "\U0001f1f1",
-        #"salute": "\U0001fae1",
-        "no": "\U0001f6ab",
-        "numbers": "\U0001f522",
-        #"calendar": "\U0001f4c6",
-        #"notepad": "\U0001f5d2",
-        #"alarmclock": "\U000023f0",
-        #"timer": "\U000023f2",
-        "maybe": "\U0001f937",
-        False: "<a:X_:1046808381266067547>",
-        "pong": "\U0001f3d3",
-        "pencilpaper": "\U0001f4dd",
-        "red": "\U0001f534",
-        "yellow": "\U0001f7e1",
-        "green": "\U0001f7e2",
-        "blue": "\U0001f535",
-        "purple": "\U0001f7e3",
-        "gray": "",
-        "thinking": "<a:loading:1165843833343451196>",
-        "loading": "<a:loading:1191255723850596422>",
-        "postgres": "<:postgresql:1191255667575623780>",
-        "mail": "\U0001f4ea",
-        "building": "\U0001f3db",
-        "click": "\U0001f5b1",
-        "restart": "\U0001f504",
-        "notfunny": "\U0001f610",
-        # 1: "\U00000031"+"\U0000fe0f"+"\U000020e3",
-        2: "\U00000032" + "\U0000fe0f" + "\U000020e3",
-        3: "\U00000033" + "\U0000fe0f" + "\U000020e3",
-        4: "\U00000034" + "\U0000fe0f" + "\U000020e3",
-        5: "\U00000035" + "\U0000fe0f" + "\U000020e3",
-        "stop": "\U000023f9",
-        "playpause": "\U000023ef",
-        "play": "\U000025b6\U0000fe0f",
-        "pause": "\U000023f8",
-        "record": "\U000023fa",
-        "next": "\U000023ed\U0000fe0f",
-        "prev": "\U000023ee\U0000fe0f",
-        "fastforward": "\U000023e9\U0000fe0f",
-        "back": "\U000025c0\U0000fe0f",
-        "forward": "\U000025b6\U0000fe0f",  # same as play
-        "shuffle": "\U0001f500",
-        "filmframes": "\U0001f39e",
-        "badge": "<:badge:1188704607761858560>",
-        "grinning": "\U0001f600",
-        "smiley": "\U0001f603",
-        "smile": "\U0001f604",
-        "grin": "\U0001f601",
-        "laughing": "\U0001f606",
-        "satisfied": "\U0001f606",
-        "face_holding_back_tears": "\U0001f979",
-        "sweat_smile": "\U0001f605",
-        "joy": "\U0001f602",
-        "rofl": "\U0001f923",
-        "rolling_on_the_floor_laughing": "\U0001f923",
-        "smiling_face_with_tear": "\U0001f972",
-        "relaxed": "\u263a\ufe0f",
-        "blush": "\U0001f60a",
-        "innocent": "\U0001f607",
-        "slight_smile": "\U0001f642",
-        "slightly_smiling_face": "\U0001f642",
-        "upside_down": "\U0001f643",
-        "upside_down_face": "\U0001f643",
-        "wink": "\U0001f609",
-        "relieved": "\U0001f60c",
-        "heart_eyes": "\U0001f60d",
-        "smiling_face_with_3_hearts": "\U0001f970",
-        "kissing_heart": "\U0001f618",
-        "kissing": "\U0001f617",
-        "kissing_smiling_eyes": "\U0001f619",
-        "kissing_closed_eyes": "\U0001f61a",
-        "yum": "\U0001f60b",
-        "stuck_out_tongue": "\U0001f61b",
-        "stuck_out_tongue_closed_eyes": "\U0001f61d",
-        "stuck_out_tongue_winking_eye": "\U0001f61c",
-        "zany_face": "\U0001f92a",
-        "face_with_raised_eyebrow": "\U0001f928",
-        "face_with_monocle": "\U0001f9d0",
-        "nerd": "\U0001f913",
-        "nerd_face": "\U0001f913",
-        "sunglasses": "\U0001f60e",
-        "disguised_face": "\U0001f978",
-        "star_struck": "\U0001f929",
-        "partying_face": "\U0001f973",
-        "smirk": "\U0001f60f",
-        "unamused": "\U0001f612",
-        "disappointed": "\U0001f61e",
-        "pensive": "\U0001f614",
-        "worried": "\U0001f61f",
-        "confused": "\U0001f615",
-        "slight_frown": "\U0001f641",
-        "slightly_frowning_face": "\U0001f641",
-        "frowning2": "\u2639\ufe0f",
-        "white_frowning_face": "\u2639\ufe0f",
-        "persevere": "\U0001f623",
-        "confounded": "\U0001f616",
-        "tired_face": "\U0001f62b",
-        "weary": "\U0001f629",
-        "pleading_face": "\U0001f97a",
-        "cry": "\U0001f622",
-        "sob": "\U0001f62d",
-        "triumph": "\U0001f624",
-        "angry": "\U0001f620",
-        "rage": "\U0001f621",
-        "face_with_symbols_over_mouth": "\U0001f92c",
-        "exploding_head": "\U0001f92f",
-        "flushed": "\U0001f633",
-        "hot_face": "\U0001f975",
-        "cold_face": "\U0001f976",
-        "face_in_clouds": "\U0001f636\u200d\U0001f32b\ufe0f",
-        "scream": "\U0001f631",
-        "fearful": "\U0001f628",
-        "cold_sweat": "\U0001f630",
-        "disappointed_relieved": "\U0001f625",
-        "sweat": "\U0001f613",
-        "hugging": "\U0001f917",
-        "hugging_face": "\U0001f917",
-        # "thinking": "\U0001f914",
-        "thinking_face": "\U0001f914",
-        "face_with_peeking_eye": "\U0001fae3",
-        "face_with_hand_over_mouth": "\U0001f92d",
-        "face_with_open_eyes_and_hand_over_mouth": "\U0001fae2",
-        "saluting_face": "\U0001fae1",
-        "shushing_face": "\U0001f92b",
-        "melting_face": "\U0001fae0",
-        "lying_face": "\U0001f925",
-        "liar": "\U0001f925",
-        "no_mouth": "\U0001f636",
-        "dotted_line_face": "\U0001fae5",
-        "neutral_face": "\U0001f610",
-        "face_with_diagonal_mouth": "\U0001fae4",
-        "expressionless": "\U0001f611",
-        "grimacing": "\U0001f62c",
-        "rolling_eyes": "\U0001f644",
-        "face_with_rolling_eyes": "\U0001f644",
-        "hushed": "\U0001f62f",
-        "frowning": "\U0001f626",
-        "anguished": "\U0001f627",
-        "open_mouth": "\U0001f62e",
-        "astonished": "\U0001f632",
-        "yawning_face": "\U0001f971",
-        "sleeping": "\U0001f634",
-        "drooling_face": "\U0001f924",
-        "drool": "\U0001f924",
-        "sleepy": "\U0001f62a",
-        "face_exhaling": "\U0001f62e\u200d\U0001f4a8",
-        "dizzy_face": "\U0001f635",
-        "face_with_spiral_eyes": "\U0001f635\u200d\U0001f4ab",
-        "zipper_mouth": "\U0001f910",
-        "zipper_mouth_face": "\U0001f910",
-        "woozy_face": "\U0001f974",
-        "nauseated_face": "\U0001f922",
-        "sick": "\U0001f922",
-        "face_vomiting": "\U0001f92e",
-        "sneezing_face": "\U0001f927",
-        "sneeze": "\U0001f927",
-        "mask": "\U0001f637",
-        "thermometer_face": "\U0001f912",
-        "face_with_thermometer": "\U0001f912",
-        "head_bandage": "\U0001f915",
-        "face_with_head_bandage": "\U0001f915",
-        "money_mouth": "\U0001f911",
-        "money_mouth_face": "\U0001f911",
-        "cowboy": "\U0001f920",
-        "face_with_cowboy_hat": "\U0001f920",
-        "smiling_imp": "\U0001f608",
-        "imp": "\U0001f47f",
-        "japanese_ogre": "\U0001f479",
-        "japanese_goblin": "\U0001f47a",
-        "clown": "\U0001f921",
-        "clown_face": "\U0001f921",
-        "poop": "\U0001f4a9",
-        "shit": "\U0001f4a9",
-        "hankey": "\U0001f4a9",
-        "poo": "\U0001f4a9",
-        "ghost": "\U0001f47b",
-        "skull": "\U0001f480",
-        "skeleton": "\U0001f480",
-        "skull_crossbones": "\u2620\ufe0f",
-        "skull_and_crossbones": "\u2620\ufe0f",
-        "alien": "\U0001f47d",
-        "space_invader": "\U0001f47e",
-        "robot": "\U0001f916",
-        "robot_face": "\U0001f916",
-        "jack_o_lantern": "\U0001f383",
-        "smiley_cat": "\U0001f63a",
-        "smile_cat": "\U0001f638",
-        "joy_cat": "\U0001f639",
-        "heart_eyes_cat": "\U0001f63b",
-        "smirk_cat": "\U0001f63c",
-        "kissing_cat": "\U0001f63d",
-        "scream_cat": "\U0001f640",
-        "crying_cat_face": "\U0001f63f",
-        "pouting_cat": "\U0001f63e",
-        "heart_hands": "\U0001faf6",
-        "palms_up_together": "\U0001f932",
-        "open_hands": "\U0001f450",
-        "raised_hands": "\U0001f64c",
-        "clap": "\U0001f44f",
-        "handshake": "\U0001f91d",
-        "shaking_hands": "\U0001f91d",
-        "thumbsup": "\U0001f44d",
-        "+1": "\U0001f44d",
-        "thumbup": "\U0001f44d",
-        "thumbsdown": "\U0001f44e",
-        "-1": "\U0001f44e",
-        "thumbdown": "\U0001f44e",
-        "punch": "\U0001f44a",
-        "fist": "\u270a",
-        "left_facing_fist": "\U0001f91b",
-        "left_fist": "\U0001f91b",
-        "right_facing_fist": "\U0001f91c",
-        "right_fist": "\U0001f91c",
-        "fingers_crossed": "\U0001f91e",
-        "hand_with_index_and_middle_finger_crossed": "\U0001f91e",
-        "v": "\u270c\ufe0f",
-        "hand_with_index_finger_and_thumb_crossed": "\U0001faf0",
-        "love_you_gesture": "\U0001f91f",
-        "metal": "\U0001f918",
-        "sign_of_the_horns": "\U0001f918",
-        "ok_hand": "\U0001f44c",
-        "pinched_fingers": "\U0001f90c",
-        "pinching_hand": "\U0001f90f",
-        "palm_down_hand": "\U0001faf3",
-        "palm_up_hand": "\U0001faf4",
-        "point_left": "\U0001f448",
-        "point_right": "\U0001f449",
-        "point_up_2": "\U0001f446",
-        "point_down": "\U0001f447",
-        "point_up": "\u261d\ufe0f",
-        "raised_hand": "\u270b",
-        "raised_back_of_hand": "\U0001f91a",
-        "back_of_hand": "\U0001f91a",
-        "hand_splayed": "\U0001f590\ufe0f",
-        "raised_hand_with_fingers_splayed": "\U0001f590\ufe0f",
-        "vulcan": "\U0001f596",
-        "raised_hand_with_part_between_middle_and_ring_fingers": "\U0001f596",
-        "wave": "\U0001f44b",
-        "call_me": "\U0001f919",
-        "call_me_hand": "\U0001f919",
-        "leftwards_hand": "\U0001faf2",
-        "rightwards_hand": "\U0001faf1",
-        "muscle": "\U0001f4aa",
-        "mechanical_arm": "\U0001f9be",
-        "middle_finger": "\U0001f595",
-        "reversed_hand_with_middle_finger_extended": "\U0001f595",
-        "writing_hand": "\u270d\ufe0f",
-        "pray": "\U0001f64f",
-        "index_pointing_at_the_viewer": "\U0001faf5",
-        "foot": "\U0001f9b6",
-        "leg": "\U0001f9b5",
-        "mechanical_leg": "\U0001f9bf",
-        "lipstick": "\U0001f484",
-        "kiss": "\U0001f48b",
-        "lips": "\U0001f444",
-        "biting_lip": "\U0001fae6",
-        "tooth": "\U0001f9b7",
-        "tongue": "\U0001f445",
-        "ear": "\U0001f442",
-        "ear_with_hearing_aid": "\U0001f9bb",
-        "nose": "\U0001f443",
-        "footprints": "\U0001f463",
-        "eye": "\U0001f441\ufe0f",
-        "eyes": "\U0001f440",
-        "anatomical_heart": "\U0001fac0",
-        "lungs": "\U0001fac1",
-        "brain": "\U0001f9e0",
-        "speaking_head": "\U0001f5e3\ufe0f",
-        "speaking_head_in_silhouette": "\U0001f5e3\ufe0f",
-        "bust_in_silhouette": "\U0001f464",
-        "busts_in_silhouette": "\U0001f465",
-        "people_hugging": "\U0001fac2",
-        "baby": "\U0001f476",
-        "child": "\U0001f9d2",
-        "girl": "\U0001f467",
-        "boy": "\U0001f466",
-        "adult": "\U0001f9d1",
-        "woman": "\U0001f469",
-        "man": "\U0001f468",
-        "person_curly_hair": "\U0001f9d1\u200d\U0001f9b1",
-        "woman_curly_haired": "\U0001f469\u200d\U0001f9b1",
-        "man_curly_haired": "\U0001f468\u200d\U0001f9b1",
-        "person_red_hair": "\U0001f9d1\u200d\U0001f9b0",
-        "woman_red_haired": "\U0001f469\u200d\U0001f9b0",
-        "man_red_haired": "\U0001f468\u200d\U0001f9b0",
-        "blond_haired_person": "\U0001f471",
-        "person_with_blond_hair": "\U0001f471",
-        "blond_haired_woman": "\U0001f471\u200d\u2640\ufe0f",
-        "blond_haired_man": "\U0001f471\u200d\u2642\ufe0f",
-        "person_white_hair": "\U0001f9d1\u200d\U0001f9b3",
-        "woman_white_haired": "\U0001f469\u200d\U0001f9b3",
-        "man_white_haired": "\U0001f468\u200d\U0001f9b3",
-        "person_bald": "\U0001f9d1\u200d\U0001f9b2",
-        "woman_bald": "\U0001f469\u200d\U0001f9b2",
-        "man_bald": "\U0001f468\u200d\U0001f9b2",
-        "bearded_person": "\U0001f9d4",
-        "woman_beard": "\U0001f9d4\u200d\u2640\ufe0f",
-        "man_beard": "\U0001f9d4\u200d\u2642\ufe0f",
-        "older_adult": "\U0001f9d3",
-        "older_woman": "\U0001f475",
-        "grandma": "\U0001f475",
-        "older_man": "\U0001f474",
-        "man_with_chinese_cap": "\U0001f472",
-        "man_with_gua_pi_mao": "\U0001f472",
-        "person_wearing_turban": "\U0001f473",
-        "man_with_turban": "\U0001f473",
-        "woman_wearing_turban": "\U0001f473\u200d\u2640\ufe0f",
-        "man_wearing_turban": "\U0001f473\u200d\u2642\ufe0f",
-        "woman_with_headscarf": "\U0001f9d5",
-        "police_officer": "\U0001f46e",
-        "cop": "\U0001f46e",
-        "woman_police_officer": "\U0001f46e\u200d\u2640\ufe0f",
-        "man_police_officer": "\U0001f46e\u200d\u2642\ufe0f",
-        "construction_worker": "\U0001f477",
-        "woman_construction_worker": "\U0001f477\u200d\u2640\ufe0f",
-        "man_construction_worker": "\U0001f477\u200d\u2642\ufe0f",
-        "guard": "\U0001f482",
-        "guardsman": "\U0001f482",
-        "woman_guard": "\U0001f482\u200d\u2640\ufe0f",
-        "man_guard": "\U0001f482\u200d\u2642\ufe0f",
-        "detective": "\U0001f575\ufe0f",
-        "spy": "\U0001f575\ufe0f",
-        "sleuth_or_spy": "\U0001f575\ufe0f",
-        "woman_detective": "\U0001f575\ufe0f\u200d\u2640\ufe0f",
-        "man_detective": "\U0001f575\ufe0f\u200d\u2642\ufe0f",
-        "health_worker": "\U0001f9d1\u200d\u2695\ufe0f",
-        "woman_health_worker": "\U0001f469\u200d\u2695\ufe0f",
-        "man_health_worker": "\U0001f468\u200d\u2695\ufe0f",
-        "farmer": "\U0001f9d1\u200d\U0001f33e",
-        "woman_farmer": "\U0001f469\u200d\U0001f33e",
-        "man_farmer": "\U0001f468\u200d\U0001f33e",
-        "cook": "\U0001f9d1\u200d\U0001f373",
-        "woman_cook": "\U0001f469\u200d\U0001f373",
-        "man_cook": "\U0001f468\u200d\U0001f373",
-        "student": "\U0001f9d1\u200d\U0001f393",
-        "woman_student": "\U0001f469\u200d\U0001f393",
-        "man_student": "\U0001f468\u200d\U0001f393",
-        "singer": "\U0001f9d1\u200d\U0001f3a4",
-        "woman_singer": "\U0001f469\u200d\U0001f3a4",
-        "man_singer": "\U0001f468\u200d\U0001f3a4",
-        "teacher": "\U0001f9d1\u200d\U0001f3eb",
-        "woman_teacher": "\U0001f469\u200d\U0001f3eb",
-        "man_teacher": "\U0001f468\u200d\U0001f3eb",
-        "factory_worker": "\U0001f9d1\u200d\U0001f3ed",
-        "woman_factory_worker": "\U0001f469\u200d\U0001f3ed",
-        "man_factory_worker": "\U0001f468\u200d\U0001f3ed",
-        "technologist": "\U0001f9d1\u200d\U0001f4bb",
-        "woman_technologist": "\U0001f469\u200d\U0001f4bb",
-        "man_technologist": "\U0001f468\u200d\U0001f4bb",
-        "office_worker": "\U0001f9d1\u200d\U0001f4bc",
-        "woman_office_worker": "\U0001f469\u200d\U0001f4bc",
-        "man_office_worker": "\U0001f468\u200d\U0001f4bc",
-        "mechanic": "\U0001f9d1\u200d\U0001f527",
-        "woman_mechanic": "\U0001f469\u200d\U0001f527",
-        "man_mechanic": "\U0001f468\u200d\U0001f527",
-        "scientist": "\U0001f9d1\u200d\U0001f52c",
-        "woman_scientist": "\U0001f469\u200d\U0001f52c",
-        "man_scientist": "\U0001f468\u200d\U0001f52c",
-        "artist": "\U0001f9d1\u200d\U0001f3a8",
-        "woman_artist": "\U0001f469\u200d\U0001f3a8",
-        "man_artist": "\U0001f468\u200d\U0001f3a8",
-        "firefighter": "\U0001f9d1\u200d\U0001f692",
-        "woman_firefighter": "\U0001f469\u200d\U0001f692",
-        "man_firefighter": "\U0001f468\u200d\U0001f692",
-        "pilot": "\U0001f9d1\u200d\u2708\ufe0f",
-        "woman_pilot": "\U0001f469\u200d\u2708\ufe0f",
-        "man_pilot": "\U0001f468\u200d\u2708\ufe0f",
-        "astronaut": "\U0001f9d1\u200d\U0001f680",
-        "woman_astronaut": "\U0001f469\u200d\U0001f680",
-        "man_astronaut": "\U0001f468\u200d\U0001f680",
-        "judge": "\U0001f9d1\u200d\u2696\ufe0f",
-        "woman_judge": "\U0001f469\u200d\u2696\ufe0f",
-        "man_judge": "\U0001f468\u200d\u2696\ufe0f",
-        "person_with_veil": "\U0001f470",
-        "woman_with_veil": "\U0001f470\u200d\u2640\ufe0f",
-        "bride_with_veil": "\U0001f470\u200d\u2640\ufe0f",
-        "man_with_veil": "\U0001f470\u200d\u2642\ufe0f",
-        "person_in_tuxedo": "\U0001f935",
-        "woman_in_tuxedo": "\U0001f935\u200d\u2640\ufe0f",
-        "man_in_tuxedo": "\U0001f935\u200d\u2642\ufe0f",
-        "person_with_crown": "\U0001fac5",
-        "princess": "\U0001f478",
-        "prince": "\U0001f934",
-        "superhero": "\U0001f9b8",
-        "woman_superhero": "\U0001f9b8\u200d\u2640\ufe0f",
-        "man_superhero": "\U0001f9b8\u200d\u2642\ufe0f",
-        "supervillain": "\U0001f9b9",
-        "woman_supervillain": "\U0001f9b9\u200d\u2640\ufe0f",
-        "man_supervillain": "\U0001f9b9\u200d\u2642\ufe0f",
-        "ninja": "\U0001f977",
-        "mx_claus": "\U0001f9d1\u200d\U0001f384",
-        "mrs_claus": "\U0001f936",
-        "mother_christmas": "\U0001f936",
-        "santa": "\U0001f385",
-        "mage": "\U0001f9d9",
-        "woman_mage": "\U0001f9d9\u200d\u2640\ufe0f",
-        "man_mage": "\U0001f9d9\u200d\u2642\ufe0f",
-        "elf": "\U0001f9dd",
-        "woman_elf": "\U0001f9dd\u200d\u2640\ufe0f",
-        "man_elf": "\U0001f9dd\u200d\u2642\ufe0f",
-        "troll": "\U0001f9cc",
-        "vampire": "\U0001f9db",
-        "woman_vampire": "\U0001f9db\u200d\u2640\ufe0f",
-        "man_vampire": "\U0001f9db\u200d\u2642\ufe0f",
-        "zombie": "\U0001f9df",
-        "woman_zombie": "\U0001f9df\u200d\u2640\ufe0f",
-        "man_zombie": "\U0001f9df\u200d\u2642\ufe0f",
-        "genie": "\U0001f9de",
-        "woman_genie": "\U0001f9de\u200d\u2640\ufe0f",
-        "man_genie": "\U0001f9de\u200d\u2642\ufe0f",
-        "merperson": "\U0001f9dc",
-        "mermaid": "\U0001f9dc\u200d\u2640\ufe0f",
-        "merman": "\U0001f9dc\u200d\u2642\ufe0f",
-        "fairy": "\U0001f9da",
-        "woman_fairy": "\U0001f9da\u200d\u2640\ufe0f",
-        "man_fairy": "\U0001f9da\u200d\u2642\ufe0f",
-        "angel": "\U0001f47c",
-        "pregnant_person": "\U0001fac4",
-        "pregnant_woman": "\U0001f930",
-        "expecting_woman": "\U0001f930",
-        "pregnant_man": "\U0001fac3",
-        "breast_feeding": "\U0001f931",
-        "person_feeding_baby": "\U0001f9d1\u200d\U0001f37c",
-        "woman_feeding_baby": "\U0001f469\u200d\U0001f37c",
-        "man_feeding_baby": "\U0001f468\u200d\U0001f37c",
-        "person_bowing": "\U0001f647",
-        "bow": "\U0001f647",
-        "woman_bowing": "\U0001f647\u200d\u2640\ufe0f",
-        "man_bowing": "\U0001f647\u200d\u2642\ufe0f",
-        "person_tipping_hand": "\U0001f481",
-        "information_desk_person": "\U0001f481",
-        "woman_tipping_hand": "\U0001f481\u200d\u2640\ufe0f",
-        "man_tipping_hand": "\U0001f481\u200d\u2642\ufe0f",
-        "person_gesturing_no": "\U0001f645",
-        "no_good": "\U0001f645",
-        "woman_gesturing_no": "\U0001f645\u200d\u2640\ufe0f",
-        "man_gesturing_no": "\U0001f645\u200d\u2642\ufe0f",
-        "person_gesturing_ok": "\U0001f646",
-        "ok_woman": "\U0001f646",
-        "woman_gesturing_ok": "\U0001f646\u200d\u2640\ufe0f",
-        "man_gesturing_ok": "\U0001f646\u200d\u2642\ufe0f",
-        "person_raising_hand": "\U0001f64b",
-        "raising_hand": "\U0001f64b",
-        "woman_raising_hand": "\U0001f64b\u200d\u2640\ufe0f",
-        "man_raising_hand": "\U0001f64b\u200d\u2642\ufe0f",
-        "deaf_person": "\U0001f9cf",
-        "deaf_woman": "\U0001f9cf\u200d\u2640\ufe0f",
-        "deaf_man": "\U0001f9cf\u200d\u2642\ufe0f",
-        "person_facepalming": "\U0001f926",
-        "face_palm": "\U0001f926",
-        "facepalm": "\U0001f926",
-        "woman_facepalming": "\U0001f926\u200d\u2640\ufe0f",
-        "man_facepalming": "\U0001f926\u200d\u2642\ufe0f",
-        "person_shrugging": "\U0001f937",
-        "shrug": "\U0001f937",
-        "woman_shrugging": "\U0001f937\u200d\u2640\ufe0f",
-        "man_shrugging": "\U0001f937\u200d\u2642\ufe0f",
-        "person_pouting": "\U0001f64e",
-        "person_with_pouting_face": "\U0001f64e",
-        "woman_pouting": "\U0001f64e\u200d\u2640\ufe0f",
-        "man_pouting": "\U0001f64e\u200d\u2642\ufe0f",
-        "person_frowning": "\U0001f64d",
-        "woman_frowning": "\U0001f64d\u200d\u2640\ufe0f",
-        "man_frowning": "\U0001f64d\u200d\u2642\ufe0f",
-        "person_getting_haircut": "\U0001f487",
-        "haircut": "\U0001f487",
-        "woman_getting_haircut": "\U0001f487\u200d\u2640\ufe0f",
-        "man_getting_haircut": "\U0001f487\u200d\u2642\ufe0f",
-        "person_getting_massage": "\U0001f486",
-        "massage": "\U0001f486",
-        "woman_getting_face_massage": "\U0001f486\u200d\u2640\ufe0f",
-        "man_getting_face_massage": "\U0001f486\u200d\u2642\ufe0f",
-        "person_in_steamy_room": "\U0001f9d6",
-        "woman_in_steamy_room": "\U0001f9d6\u200d\u2640\ufe0f",
-        "man_in_steamy_room": "\U0001f9d6\u200d\u2642\ufe0f",
-        "nail_care": "\U0001f485",
-        "selfie": "\U0001f933",
-        "dancer": "\U0001f483",
-        "man_dancing": "\U0001f57a",
-        "male_dancer": "\U0001f57a",
-        "people_with_bunny_ears_partying": "\U0001f46f",
-        "dancers": "\U0001f46f",
-        "women_with_bunny_ears_partying": "\U0001f46f\u200d\u2640\ufe0f",
-        "men_with_bunny_ears_partying": "\U0001f46f\u200d\u2642\ufe0f",
-        "levitate": "\U0001f574\ufe0f",
-        "man_in_business_suit_levitating": "\U0001f574\ufe0f",
-        "person_in_manual_wheelchair": "\U0001f9d1\u200d\U0001f9bd",
-        "woman_in_manual_wheelchair": "\U0001f469\u200d\U0001f9bd",
-        "man_in_manual_wheelchair": "\U0001f468\u200d\U0001f9bd",
-        "person_in_motorized_wheelchair": "\U0001f9d1\u200d\U0001f9bc",
-        "woman_in_motorized_wheelchair": "\U0001f469\u200d\U0001f9bc",
-        "man_in_motorized_wheelchair": "\U0001f468\u200d\U0001f9bc",
-        "person_walking": "\U0001f6b6",
-        "walking": "\U0001f6b6",
-        "woman_walking": "\U0001f6b6\u200d\u2640\ufe0f",
-        "man_walking": "\U0001f6b6\u200d\u2642\ufe0f",
-        "person_with_probing_cane": "\U0001f9d1\u200d\U0001f9af",
-        "woman_with_probing_cane": "\U0001f469\u200d\U0001f9af",
-        "man_with_probing_cane": "\U0001f468\u200d\U0001f9af",
-        "person_kneeling": "\U0001f9ce",
-        "woman_kneeling": "\U0001f9ce\u200d\u2640\ufe0f",
-        "man_kneeling": "\U0001f9ce\u200d\u2642\ufe0f",
-        "person_running": "\U0001f3c3",
-        "runner": "\U0001f3c3",
-        "woman_running": "\U0001f3c3\u200d\u2640\ufe0f",
-        "man_running": "\U0001f3c3\u200d\u2642\ufe0f",
-        "person_standing": "\U0001f9cd",
-        "woman_standing": "\U0001f9cd\u200d\u2640\ufe0f",
-        "man_standing": "\U0001f9cd\u200d\u2642\ufe0f",
-        "people_holding_hands": "\U0001f9d1\u200d\U0001f91d\u200d\U0001f9d1",
-        "couple": "\U0001f46b",
-        "two_women_holding_hands": "\U0001f46d",
-        "two_men_holding_hands": "\U0001f46c",
-        "couple_with_heart": "\U0001f491",
-        "couple_with_heart_woman_man": "\U0001f469\u200d\u2764\ufe0f\u200d\U0001f468",
-        "couple_ww": "\U0001f469\u200d\u2764\ufe0f\u200d\U0001f469",
-        "couple_with_heart_ww": "\U0001f469\u200d\u2764\ufe0f\u200d\U0001f469",
-        "couple_mm": "\U0001f468\u200d\u2764\ufe0f\u200d\U0001f468",
-        "couple_with_heart_mm": "\U0001f468\u200d\u2764\ufe0f\u200d\U0001f468",
-        "couplekiss": "\U0001f48f",
-        "kiss_woman_man": "\U0001f469\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468",
-        "kiss_ww": "\U0001f469\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469",
-        "couplekiss_ww": "\U0001f469\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f469",
-        "kiss_mm": "\U0001f468\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468",
-        "couplekiss_mm": "\U0001f468\u200d\u2764\ufe0f\u200d\U0001f48b\u200d\U0001f468",
-        "family": "\U0001f46a",
-        "family_man_woman_boy": "\U0001f468\u200d\U0001f469\u200d\U0001f466",
-        "family_mwg": "\U0001f468\u200d\U0001f469\u200d\U0001f467",
-        "family_mwgb": "\U0001f468\u200d\U0001f469\u200d\U0001f467\u200d\U0001f466",
-        "family_mwbb": "\U0001f468\u200d\U0001f469\u200d\U0001f466\u200d\U0001f466",
-        "family_mwgg": "\U0001f468\u200d\U0001f469\u200d\U0001f467\u200d\U0001f467",
-        "family_wwb": "\U0001f469\u200d\U0001f469\u200d\U0001f466",
-        "family_wwg": "\U0001f469\u200d\U0001f469\u200d\U0001f467",
-        "family_wwgb": "\U0001f469\u200d\U0001f469\u200d\U0001f467\u200d\U0001f466",
-        "family_wwbb": "\U0001f469\u200d\U0001f469\u200d\U0001f466\u200d\U0001f466",
-        "family_wwgg": "\U0001f469\u200d\U0001f469\u200d\U0001f467\u200d\U0001f467",
-        "family_mmb": "\U0001f468\u200d\U0001f468\u200d\U0001f466",
-        "family_mmg": "\U0001f468\u200d\U0001f468\u200d\U0001f467",
-        "family_mmgb": "\U0001f468\u200d\U0001f468\u200d\U0001f467\u200d\U0001f466",
-        "family_mmbb": "\U0001f468\u200d\U0001f468\u200d\U0001f466\u200d\U0001f466",
-        "family_mmgg": "\U0001f468\u200d\U0001f468\u200d\U0001f467\u200d\U0001f467",
-        "family_woman_boy": "\U0001f469\u200d\U0001f466",
-        "family_woman_girl": "\U0001f469\u200d\U0001f467",
-        "family_woman_girl_boy": "\U0001f469\u200d\U0001f467\u200d\U0001f466",
-        "family_woman_boy_boy": "\U0001f469\u200d\U0001f466\u200d\U0001f466",
-        "family_woman_girl_girl": "\U0001f469\u200d\U0001f467\u200d\U0001f467",
-        "family_man_boy": "\U0001f468\u200d\U0001f466",
-        "family_man_girl": "\U0001f468\u200d\U0001f467",
-        "family_man_girl_boy": "\U0001f468\u200d\U0001f467\u200d\U0001f466",
-        "family_man_boy_boy": "\U0001f468\u200d\U0001f466\u200d\U0001f466",
-        "family_man_girl_girl": "\U0001f468\u200d\U0001f467\u200d\U0001f467",
-        "knot": "\U0001faa2",
-        "yarn": "\U0001f9f6",
-        "thread": "\U0001f9f5",
-        "sewing_needle": "\U0001faa1",
-        "coat": "\U0001f9e5",
-        "lab_coat": "\U0001f97c",
-        "safety_vest": "\U0001f9ba",
-        "womans_clothes": "\U0001f45a",
-        "shirt": "\U0001f455",
-        "jeans": "\U0001f456",
-        "briefs": "\U0001fa72",
-        "shorts": "\U0001fa73",
-        "necktie": "\U0001f454",
-        "dress": "\U0001f457",
-        "bikini": "\U0001f459",
-        "one_piece_swimsuit": "\U0001fa71",
-        "kimono": "\U0001f458",
-        "sari": "\U0001f97b",
-        "thong_sandal": "\U0001fa74",
-        "womans_flat_shoe": "\U0001f97f",
-        "high_heel": "\U0001f460",
-        "sandal": "\U0001f461",
-        "boot": "\U0001f462",
-        "mans_shoe": "\U0001f45e",
-        "athletic_shoe": "\U0001f45f",
-        "hiking_boot": "\U0001f97e",
-        "socks": "\U0001f9e6",
-        "gloves": "\U0001f9e4",
-        "scarf": "\U0001f9e3",
-        "tophat": "\U0001f3a9",
-        "billed_cap": "\U0001f9e2",
-        "womans_hat": "\U0001f452",
-        "mortar_board": "\U0001f393",
-        "helmet_with_cross": "\u26d1\ufe0f",
-        "helmet_with_white_cross": "\u26d1\ufe0f",
-        "military_helmet": "\U0001fa96",
-        "crown": "\U0001f451",
-        "ring": "\U0001f48d",
-        "pouch": "\U0001f45d",
-        "purse": "\U0001f45b",
-        "handbag": "\U0001f45c",
-        "briefcase": "\U0001f4bc",
-        "school_satchel": "\U0001f392",
-        "luggage": "\U0001f9f3",
-        "eyeglasses": "\U0001f453",
-        "dark_sunglasses": "\U0001f576\ufe0f",
-        "goggles": "\U0001f97d",
-        "closed_umbrella": "\U0001f302",
-        "dog": "\U0001f436",
-        "cat": "\U0001f431",
-        "mouse": "\U0001f42d",
-        "hamster": "\U0001f439",
-        "rabbit": "\U0001f430",
-        "fox": "\U0001f98a",
-        "fox_face": "\U0001f98a",
-        "bear": "\U0001f43b",
-        "panda_face": "\U0001f43c",
-        "polar_bear": "\U0001f43b\u200d\u2744\ufe0f",
-        "koala": "\U0001f428",
-        "tiger": "\U0001f42f",
-        "lion_face": "\U0001f981",
-        "lion": "\U0001f981",
-        "cow": "\U0001f42e",
-        "pig": "\U0001f437",
-        "pig_nose": "\U0001f43d",
-        "frog": "\U0001f438",
-        "monkey_face": "\U0001f435",
-        "see_no_evil": "\U0001f648",
-        "hear_no_evil": "\U0001f649",
-        "speak_no_evil": "\U0001f64a",
-        "monkey": "\U0001f412",
-        "chicken": "\U0001f414",
-        "penguin": "\U0001f427",
-        "bird": "\U0001f426",
-        "baby_chick": "\U0001f424",
-        "hatching_chick": "\U0001f423",
-        "hatched_chick": "\U0001f425",
-        "duck": "\U0001f986",
-        "eagle": "\U0001f985",
-        "owl": "\U0001f989",
-        "bat": "\U0001f987",
-        "wolf": "\U0001f43a",
-        "boar": "\U0001f417",
-        "horse": "\U0001f434",
-        "unicorn": "\U0001f984",
-        "unicorn_face": "\U0001f984",
-        "bee": "\U0001f41d",
-        "bug": "\U0001f41b",
-        "butterfly": "\U0001f98b",
-        "snail": "\U0001f40c",
-        "worm": "\U0001fab1",
-        "lady_beetle": "\U0001f41e",
-        "ant": "\U0001f41c",
-        "fly": "\U0001fab0",
-        "mosquito": "\U0001f99f",
-        "cockroach": "\U0001fab3",
-        "beetle": "\U0001fab2",
-        "cricket": "\U0001f997",
-        "spider": "\U0001f577\ufe0f",
-        "spider_web": "\U0001f578\ufe0f",
-        "scorpion": "\U0001f982",
-        "turtle": "\U0001f422",
-        "snake": "\U0001f40d",
-        "lizard": "\U0001f98e",
-        "t_rex": "\U0001f996",
-        "sauropod": "\U0001f995",
-        "octopus": "\U0001f419",
-        "squid": "\U0001f991",
-        "shrimp": "\U0001f990",
-        "lobster": "\U0001f99e",
-        "crab": "\U0001f980",
-        "blowfish": "\U0001f421",
-        "tropical_fish": "\U0001f420",
-        "fish": "\U0001f41f",
-        "seal": "\U0001f9ad",
-        "dolphin": "\U0001f42c",
-        "whale": "\U0001f433",
-        "whale2": "\U0001f40b",
-        "shark": "\U0001f988",
-        "crocodile": "\U0001f40a",
-        "tiger2": "\U0001f405",
-        "leopard": "\U0001f406",
-        "zebra": "\U0001f993",
-        "gorilla": "\U0001f98d",
-        "orangutan": "\U0001f9a7",
-        "elephant": "\U0001f418",
-        "mammoth": "\U0001f9a3",
-        "bison": "\U0001f9ac",
-        "hippopotamus": "\U0001f99b",
-        "rhino": "\U0001f98f",
-        "rhinoceros": "\U0001f98f",
-        "dromedary_camel": "\U0001f42a",
-        "camel": "\U0001f42b",
-        "giraffe": "\U0001f992",
-        "kangaroo": "\U0001f998",
-        "water_buffalo": "\U0001f403",
-        "ox": "\U0001f402",
-        "cow2": "\U0001f404",
-        "racehorse": "\U0001f40e",
-        "pig2": "\U0001f416",
-        "ram": "\U0001f40f",
-        "sheep": "\U0001f411",
-        "llama": "\U0001f999",
-        "goat": "\U0001f410",
-        "deer": "\U0001f98c",
-        "dog2": "\U0001f415",
-        "poodle": "\U0001f429",
-        "guide_dog": "\U0001f9ae",
-        "service_dog": "\U0001f415\u200d\U0001f9ba",
-        "cat2": "\U0001f408",
-        "black_cat": "\U0001f408\u200d\u2b1b",
-        "feather": "\U0001fab6",
-        "rooster": "\U0001f413",
-        "turkey": "\U0001f983",
-        "dodo": "\U0001f9a4",
-        "peacock": "\U0001f99a",
-        "parrot": "\U0001f99c",
-        "swan": "\U0001f9a2",
-        "flamingo": "\U0001f9a9",
-        "dove": "\U0001f54a\ufe0f",
-        "dove_of_peace": "\U0001f54a\ufe0f",
-        "rabbit2": "\U0001f407",
-        "raccoon": "\U0001f99d",
-        "skunk": "\U0001f9a8",
-        "badger": "\U0001f9a1",
-        "beaver": "\U0001f9ab",
-        "otter": "\U0001f9a6",
-        "sloth": "\U0001f9a5",
-        "mouse2": "\U0001f401",
-        "rat": "\U0001f400",
-        "chipmunk": "\U0001f43f\ufe0f",
-        "hedgehog": "\U0001f994",
-        "feet": "\U0001f43e",
-        "paw_prints": "\U0001f43e",
-        "dragon": "\U0001f409",
-        "dragon_face": "\U0001f432",
-        "cactus": "\U0001f335",
-        "christmas_tree": "\U0001f384",
-        "evergreen_tree": "\U0001f332",
-        "deciduous_tree": "\U0001f333",
-        "palm_tree": "\U0001f334",
-        "seedling": "\U0001f331",
-        "herb": "\U0001f33f",
-        "shamrock": "\u2618\ufe0f",
-        "four_leaf_clover": "\U0001f340",
-        "bamboo": "\U0001f38d",
-        "tanabata_tree": "\U0001f38b",
-        "leaves": "\U0001f343",
-        "fallen_leaf": "\U0001f342",
-        "maple_leaf": "\U0001f341",
-        "empty_nest": "\U0001fab9",
-        "nest_with_eggs": "\U0001faba",
-        "mushroom": "\U0001f344",
-        "shell": "\U0001f41a",
-        "coral": "\U0001fab8",
-        "rock": "\U0001faa8",
-        "wood": "\U0001fab5",
-        "ear_of_rice": "\U0001f33e",
-        "potted_plant": "\U0001fab4",
-        "bouquet": "\U0001f490",
-        "tulip": "\U0001f337",
-        "rose": "\U0001f339",
-        "wilted_rose": "\U0001f940",
-        "wilted_flower": "\U0001f940",
-        "lotus": "\U0001fab7",
-        "hibiscus": "\U0001f33a",
-        "cherry_blossom": "\U0001f338",
-        "blossom": "\U0001f33c",
-        "sunflower": "\U0001f33b",
-        "sun_with_face": "\U0001f31e",
-        "full_moon_with_face": "\U0001f31d",
-        "first_quarter_moon_with_face": "\U0001f31b",
-        "last_quarter_moon_with_face": "\U0001f31c",
-        "new_moon_with_face": "\U0001f31a",
-        "full_moon": "\U0001f315",
-        "waning_gibbous_moon": "\U0001f316",
-        "last_quarter_moon": "\U0001f317",
-        "waning_crescent_moon": "\U0001f318",
-        "new_moon": "\U0001f311",
-        "waxing_crescent_moon": "\U0001f312",
-        "first_quarter_moon": "\U0001f313",
-        "waxing_gibbous_moon": "\U0001f314",
-        "crescent_moon": "\U0001f319",
-        "earth_americas": "\U0001f30e",
-        "earth_africa": "\U0001f30d",
-        "earth_asia": "\U0001f30f",
-        "ringed_planet": "\U0001fa90",
-        "dizzy": "\U0001f4ab",
-        "star": "\u2b50",
-        "star2": "\U0001f31f",
-        "sparkles": "\u2728",
-        "zap": "\u26a1",
-        "comet": "\u2604\ufe0f",
-        "boom": "\U0001f4a5",
-        "fire": "\U0001f525",
-        "flame": "\U0001f525",
-        "cloud_tornado": "\U0001f32a\ufe0f",
-        "cloud_with_tornado": "\U0001f32a\ufe0f",
-        "rainbow": "\U0001f308",
-        "sunny": "\u2600\ufe0f",
-        "white_sun_small_cloud": "\U0001f324\ufe0f",
-        "white_sun_with_small_cloud": "\U0001f324\ufe0f",
-        "partly_sunny": "\u26c5",
-        "white_sun_cloud": "\U0001f325\ufe0f",
-        "white_sun_behind_cloud": "\U0001f325\ufe0f",
-        "cloud": "\u2601\ufe0f",
-        "white_sun_rain_cloud": "\U0001f326\ufe0f",
-        "white_sun_behind_cloud_with_rain": "\U0001f326\ufe0f",
-        "cloud_rain": "\U0001f327\ufe0f",
-        "cloud_with_rain": "\U0001f327\ufe0f",
-        "thunder_cloud_rain": "\u26c8\ufe0f",
-        "thunder_cloud_and_rain": "\u26c8\ufe0f",
-        "cloud_lightning": "\U0001f329\ufe0f",
-        "cloud_with_lightning": "\U0001f329\ufe0f",
-        "cloud_snow": "\U0001f328\ufe0f",
-        "cloud_with_snow": "\U0001f328\ufe0f",
-        "snowflake": "\u2744\ufe0f",
-        "snowman2": "\u2603\ufe0f",
-        "snowman": "\u26c4",
-        "wind_blowing_face": "\U0001f32c\ufe0f",
-        "dash": "\U0001f4a8",
-        "droplet": "\U0001f4a7",
-        "sweat_drops": "\U0001f4a6",
-        "bubbles": "\U0001fae7",
-        "umbrella": "\u2614",
-        "umbrella2": "\u2602\ufe0f",
-        "ocean": "\U0001f30a",
-        "fog": "\U0001f32b\ufe0f",
-        "green_apple": "\U0001f34f",
-        "apple": "\U0001f34e",
-        "pear": "\U0001f350",
-        "tangerine": "\U0001f34a",
-        "lemon": "\U0001f34b",
-        "banana": "\U0001f34c",
-        "watermelon": "\U0001f349",
-        "grapes": "\U0001f347",
-        "blueberries": "\U0001fad0",
-        "strawberry": "\U0001f353",
-        "melon": "\U0001f348",
-        "cherries": "\U0001f352",
-        "peach": "\U0001f351",
-        "mango": "\U0001f96d",
-        "pineapple": "\U0001f34d",
-        "coconut": "\U0001f965",
-        "kiwi": "\U0001f95d",
-        "kiwifruit": "\U0001f95d",
-        "tomato": "\U0001f345",
-        "eggplant": "\U0001f346",
-        "avocado": "\U0001f951",
-        "olive": "\U0001fad2",
-        "broccoli": "\U0001f966",
-        "leafy_green": "\U0001f96c",
-        "bell_pepper": "\U0001fad1",
-        "cucumber": "\U0001f952",
-        "hot_pepper": "\U0001f336\ufe0f",
-        "corn": "\U0001f33d",
-        "carrot": "\U0001f955",
-        "garlic": "\U0001f9c4",
-        "onion": "\U0001f9c5",
-        "potato": "\U0001f954",
-        "sweet_potato": "\U0001f360",
-        "croissant": "\U0001f950",
-        "bagel": "\U0001f96f",
-        "bread": "\U0001f35e",
-        "french_bread": "\U0001f956",
-        "baguette_bread": "\U0001f956",
-        "flatbread": "\U0001fad3",
-        "pretzel": "\U0001f968",
-        "cheese": "\U0001f9c0",
-        "cheese_wedge": "\U0001f9c0",
-        "egg": "\U0001f95a",
-        "cooking": "\U0001f373",
-        "butter": "\U0001f9c8",
-        "pancakes": "\U0001f95e",
-        "waffle": "\U0001f9c7",
-        "bacon": "\U0001f953",
-        "cut_of_meat": "\U0001f969",
-        "poultry_leg": "\U0001f357",
-        "meat_on_bone": "\U0001f356",
-        "bone": "\U0001f9b4",
-        "hotdog": "\U0001f32d",
-        "hot_dog": "\U0001f32d",
-        "hamburger": "\U0001f354",
-        "fries": "\U0001f35f",
-        "pizza": "\U0001f355",
-        "sandwich": "\U0001f96a",
-        "stuffed_flatbread": "\U0001f959",
-        "stuffed_pita": "\U0001f959",
-        "falafel": "\U0001f9c6",
-        "taco": "\U0001f32e",
-        "burrito": "\U0001f32f",
-        "tamale": "\U0001fad4",
-        "salad": "\U0001f957",
-        "green_salad": "\U0001f957",
-        "shallow_pan_of_food": "\U0001f958",
-        "paella": "\U0001f958",
-        "fondue": "\U0001fad5",
-        "canned_food": "\U0001f96b",
-        "jar": "\U0001fad9",
-        "spaghetti": "\U0001f35d",
-        "ramen": "\U0001f35c",
-        "stew": "\U0001f372",
-        "curry": "\U0001f35b",
-        "sushi": "\U0001f363",
-        "bento": "\U0001f371",
-        "dumpling": "\U0001f95f",
-        "oyster": "\U0001f9aa",
-        "fried_shrimp": "\U0001f364",
-        "rice_ball": "\U0001f359",
-        "rice": "\U0001f35a",
-        "rice_cracker": "\U0001f358",
-        "fish_cake": "\U0001f365",
-        "fortune_cookie": "\U0001f960",
-        "moon_cake": "\U0001f96e",
-        "oden": "\U0001f362",
-        "dango": "\U0001f361",
-        "shaved_ice": "\U0001f367",
-        "ice_cream": "\U0001f368",
-        "icecream": "\U0001f366",
-        "pie": "\U0001f967",
-        "cupcake": "\U0001f9c1",
-        "cake": "\U0001f370",
-        "birthday": "\U0001f382",
-        "custard": "\U0001f36e",
-        "pudding": "\U0001f36e",
-        "flan": "\U0001f36e",
-        "lollipop": "\U0001f36d",
-        "candy": "\U0001f36c",
-        "chocolate_bar": "\U0001f36b",
-        "popcorn": "\U0001f37f",
-        "doughnut": "\U0001f369",
-        "cookie": "\U0001f36a",
-        "chestnut": "\U0001f330",
-        "peanuts": "\U0001f95c",
-        "shelled_peanut": "\U0001f95c",
-        "beans": "\U0001fad8",
-        "honey_pot": "\U0001f36f",
-        "milk": "\U0001f95b",
-        "glass_of_milk": "\U0001f95b",
-        "pouring_liquid": "\U0001fad7",
-        "baby_bottle": "\U0001f37c",
-        "teapot": "\U0001fad6",
-        "coffee": "\u2615",
-        "tea": "\U0001f375",
-        "mate": "\U0001f9c9",
-        "beverage_box": "\U0001f9c3",
-        "cup_with_straw": "\U0001f964",
-        "bubble_tea": "\U0001f9cb",
-        "sake": "\U0001f376",
-        "beer": "\U0001f37a",
-        "beers": "\U0001f37b",
-        "champagne_glass": "\U0001f942",
-        "clinking_glass": "\U0001f942",
-        "wine_glass": "\U0001f377",
-        "tumbler_glass": "\U0001f943",
-        "whisky": "\U0001f943",
-        "cocktail": "\U0001f378",
-        "tropical_drink": "\U0001f379",
-        "champagne": "\U0001f37e",
-        "bottle_with_popping_cork": "\U0001f37e",
-        "ice_cube": "\U0001f9ca",
-        "spoon": "\U0001f944",
-        "fork_and_knife": "\U0001f374",
-        "fork_knife_plate": "\U0001f37d\ufe0f",
-        "fork_and_knife_with_plate": "\U0001f37d\ufe0f",
-        "bowl_with_spoon": "\U0001f963",
-        "takeout_box": "\U0001f961",
-        "chopsticks": "\U0001f962",
-        "salt": "\U0001f9c2",
-        "soccer": "\u26bd",
-        "basketball": "\U0001f3c0",
-        "football": "\U0001f3c8",
-        "baseball": "\u26be",
-        "softball": "\U0001f94e",
-        "tennis": "\U0001f3be",
-        "volleyball": "\U0001f3d0",
-        "rugby_football": "\U0001f3c9",
-        "flying_disc": "\U0001f94f",
-        "8ball": "\U0001f3b1",
-        "yo_yo": "\U0001fa80",
-        "ping_pong": "\U0001f3d3",
-        "table_tennis": "\U0001f3d3",
-        "badminton": "\U0001f3f8",
-        "hockey": "\U0001f3d2",
-        "field_hockey": "\U0001f3d1",
-        "lacrosse": "\U0001f94d",
-        "cricket_game": "\U0001f3cf",
-        "cricket_bat_ball": "\U0001f3cf",
-        "boomerang": "\U0001fa83",
-        "goal": "\U0001f945",
-        "goal_net": "\U0001f945",
-        "golf": "\u26f3",
-        "kite": "\U0001fa81",
-        "playground_slide": "\U0001f6dd",
-        "bow_and_arrow": "\U0001f3f9",
-        "archery": "\U0001f3f9",
-        "fishing_pole_and_fish": "\U0001f3a3",
-        "diving_mask": "\U0001f93f",
-        "boxing_glove": "\U0001f94a",
-        "boxing_gloves": "\U0001f94a",
-        "martial_arts_uniform": "\U0001f94b",
-        "karate_uniform": "\U0001f94b",
-        "running_shirt_with_sash": "\U0001f3bd",
-        "skateboard": "\U0001f6f9",
-        "roller_skate": "\U0001f6fc",
-        "sled": "\U0001f6f7",
-        "ice_skate": "\u26f8\ufe0f",
-        "curling_stone": "\U0001f94c",
-        "ski": "\U0001f3bf",
-        "skier": "\u26f7\ufe0f",
-        "snowboarder": "\U0001f3c2",
-        "parachute": "\U0001fa82",
-        "person_lifting_weights": "\U0001f3cb\ufe0f",
-        "lifter": "\U0001f3cb\ufe0f",
-        "weight_lifter": "\U0001f3cb\ufe0f",
-        "woman_lifting_weights": "\U0001f3cb\ufe0f\u200d\u2640\ufe0f",
-        "man_lifting_weights": "\U0001f3cb\ufe0f\u200d\u2642\ufe0f",
-        "people_wrestling": "\U0001f93c",
-        "wrestlers": "\U0001f93c",
-        "wrestling": "\U0001f93c",
-        "women_wrestling": "\U0001f93c\u200d\u2640\ufe0f",
-        "men_wrestling": "\U0001f93c\u200d\u2642\ufe0f",
-        "person_doing_cartwheel": "\U0001f938",
-        "cartwheel": "\U0001f938",
-        "woman_cartwheeling": "\U0001f938\u200d\u2640\ufe0f",
-        "man_cartwheeling": "\U0001f938\u200d\u2642\ufe0f",
-        "person_bouncing_ball": "\u26f9\ufe0f",
-        "basketball_player": "\u26f9\ufe0f",
-        "person_with_ball": "\u26f9\ufe0f",
-        "woman_bouncing_ball": "\u26f9\ufe0f\u200d\u2640\ufe0f",
-        "man_bouncing_ball": "\u26f9\ufe0f\u200d\u2642\ufe0f",
-        "person_fencing": "\U0001f93a",
-        "fencer": "\U0001f93a",
-        "fencing": "\U0001f93a",
-        "person_playing_handball": "\U0001f93e",
-        "handball": "\U0001f93e",
-        "woman_playing_handball": "\U0001f93e\u200d\u2640\ufe0f",
-        "man_playing_handball": "\U0001f93e\u200d\u2642\ufe0f",
-        "person_golfing": "\U0001f3cc\ufe0f",
-        "golfer": "\U0001f3cc\ufe0f",
-        "woman_golfing": "\U0001f3cc\ufe0f\u200d\u2640\ufe0f",
-        "man_golfing": "\U0001f3cc\ufe0f\u200d\u2642\ufe0f",
-        "horse_racing": "\U0001f3c7",
-        "person_in_lotus_position": "\U0001f9d8",
-        "woman_in_lotus_position": "\U0001f9d8\u200d\u2640\ufe0f",
-        "man_in_lotus_position": "\U0001f9d8\u200d\u2642\ufe0f",
-        "person_surfing": "\U0001f3c4",
-        "surfer": "\U0001f3c4",
-        "woman_surfing": "\U0001f3c4\u200d\u2640\ufe0f",
-        "man_surfing": "\U0001f3c4\u200d\u2642\ufe0f",
-        "person_swimming": "\U0001f3ca",
-        "swimmer": "\U0001f3ca",
-        "woman_swimming": "\U0001f3ca\u200d\u2640\ufe0f",
-        "man_swimming": "\U0001f3ca\u200d\u2642\ufe0f",
-        "person_playing_water_polo": "\U0001f93d",
-        "water_polo": "\U0001f93d",
-        "woman_playing_water_polo": "\U0001f93d\u200d\u2640\ufe0f",
-        "man_playing_water_polo": "\U0001f93d\u200d\u2642\ufe0f",
-        "person_rowing_boat": "\U0001f6a3",
-        "rowboat": "\U0001f6a3",
-        "woman_rowing_boat": "\U0001f6a3\u200d\u2640\ufe0f",
-        "man_rowing_boat": "\U0001f6a3\u200d\u2642\ufe0f",
-        "person_climbing": "\U0001f9d7",
-        "woman_climbing": "\U0001f9d7\u200d\u2640\ufe0f",
-        "man_climbing": "\U0001f9d7\u200d\u2642\ufe0f",
-        "person_mountain_biking": "\U0001f6b5",
-        "mountain_bicyclist": "\U0001f6b5",
-        "woman_mountain_biking": "\U0001f6b5\u200d\u2640\ufe0f",
-        "man_mountain_biking": "\U0001f6b5\u200d\u2642\ufe0f",
-        "person_biking": "\U0001f6b4",
-        "bicyclist": "\U0001f6b4",
-        "woman_biking": "\U0001f6b4\u200d\u2640\ufe0f",
-        "man_biking": "\U0001f6b4\u200d\u2642\ufe0f",
-        "trophy": "\U0001f3c6",
-        "first_place": "\U0001f947",
-        "first_place_medal": "\U0001f947",
-        "second_place": "\U0001f948",
-        "second_place_medal": "\U0001f948",
-        "third_place": "\U0001f949",
-        "third_place_medal": "\U0001f949",
-        "medal": "\U0001f3c5",
-        "sports_medal": "\U0001f3c5",
-        "military_medal": "\U0001f396\ufe0f",
-        "rosette": "\U0001f3f5\ufe0f",
-        "reminder_ribbon": "\U0001f397\ufe0f",
-        "ticket": "\U0001f3ab",
-        "tickets": "\U0001f39f\ufe0f",
-        "admission_tickets": "\U0001f39f\ufe0f",
-        "circus_tent": "\U0001f3aa",
-        "person_juggling": "\U0001f939",
-        "juggling": "\U0001f939",
-        "juggler": "\U0001f939",
-        "woman_juggling": "\U0001f939\u200d\u2640\ufe0f",
-        "man_juggling": "\U0001f939\u200d\u2642\ufe0f",
-        "performing_arts": "\U0001f3ad",
-        "ballet_shoes": "\U0001fa70",
-        "art": "\U0001f3a8",
-        "clapper": "\U0001f3ac",
-        "microphone": "\U0001f3a4",
-        "headphones": "\U0001f3a7",
-        "musical_score": "\U0001f3bc",
-        "musical_keyboard": "\U0001f3b9",
-        "drum": "\U0001f941",
-        "drum_with_drumsticks": "\U0001f941",
-        "long_drum": "\U0001fa98",
-        "saxophone": "\U0001f3b7",
-        "trumpet": "\U0001f3ba",
-        "accordion": "\U0001fa97",
-        "guitar": "\U0001f3b8",
-        "banjo": "\U0001fa95",
-        "violin": "\U0001f3bb",
-        "game_die": "\U0001f3b2",
-        "chess_pawn": "\u265f\ufe0f",
-        "dart": "\U0001f3af",
-        "bowling": "\U0001f3b3",
-        "video_game": "\U0001f3ae",
-        "slot_machine": "\U0001f3b0",
-        "jigsaw": "\U0001f9e9",
-        "red_car": "\U0001f697",
-        "taxi": "\U0001f695",
-        "blue_car": "\U0001f699",
-        "pickup_truck": "\U0001f6fb",
-        "bus": "\U0001f68c",
-        "trolleybus": "\U0001f68e",
-        "race_car": "\U0001f3ce\ufe0f",
-        "racing_car": "\U0001f3ce\ufe0f",
-        "police_car": "\U0001f693",
-        "ambulance": "\U0001f691",
-        "fire_engine": "\U0001f692",
-        "minibus": "\U0001f690",
-        "truck": "\U0001f69a",
-        "articulated_lorry": "\U0001f69b",
-        "tractor": "\U0001f69c",
-        "probing_cane": "\U0001f9af",
-        "crutch": "\U0001fa7c",
-        "manual_wheelchair": "\U0001f9bd",
-        "motorized_wheelchair": "\U0001f9bc",
-        "scooter": "\U0001f6f4",
-        "bike": "\U0001f6b2",
-        "motor_scooter": "\U0001f6f5",
-        "motorbike": "\U0001f6f5",
-        "motorcycle": "\U0001f3cd\ufe0f",
-        "racing_motorcycle": "\U0001f3cd\ufe0f",
-        "auto_rickshaw": "\U0001f6fa",
-        "wheel": "\U0001f6de",
-        "rotating_light": "\U0001f6a8",
-        "oncoming_police_car": "\U0001f694",
-        "oncoming_bus": "\U0001f68d",
-        "oncoming_automobile": "\U0001f698",
-        "oncoming_taxi": "\U0001f696",
-        "aerial_tramway": "\U0001f6a1",
-        "mountain_cableway": "\U0001f6a0",
-        "suspension_railway": "\U0001f69f",
-        "railway_car": "\U0001f683",
-        "train": "\U0001f68b",
-        "mountain_railway": "\U0001f69e",
-        "monorail": "\U0001f69d",
-        "bullettrain_side": "\U0001f684",
-        "bullettrain_front": "\U0001f685",
-        "light_rail": "\U0001f688",
-        "steam_locomotive": "\U0001f682",
-        "train2": "\U0001f686",
-        "metro": "\U0001f687",
-        "tram": "\U0001f68a",
-        "station": "\U0001f689",
-        "airplane": "\u2708\ufe0f",
-        "airplane_departure": "\U0001f6eb",
-        "airplane_arriving": "\U0001f6ec",
-        "airplane_small": "\U0001f6e9\ufe0f",
-        "small_airplane": "\U0001f6e9\ufe0f",
-        "seat": "\U0001f4ba",
-        "satellite_orbital": "\U0001f6f0\ufe0f",
-        "rocket": "\U0001f680",
-        "flying_saucer": "\U0001f6f8",
-        "helicopter": "\U0001f681",
-        "canoe": "\U0001f6f6",
-        "kayak": "\U0001f6f6",
-        "sailboat": "\u26f5",
-        "speedboat": "\U0001f6a4",
-        "motorboat": "\U0001f6e5\ufe0f",
-        "cruise_ship": "\U0001f6f3\ufe0f",
-        "passenger_ship": "\U0001f6f3\ufe0f",
-        "ferry": "\u26f4\ufe0f",
-        "ship": "\U0001f6a2",
-        "ring_buoy": "\U0001f6df",
-        "anchor": "\u2693",
-        "hook": "\U0001fa9d",
-        "fuelpump": "\u26fd",
-        "construction": "\U0001f6a7",
-        "vertical_traffic_light": "\U0001f6a6",
-        "traffic_light": "\U0001f6a5",
-        "busstop": "\U0001f68f",
-        "map": "\U0001f5fa\ufe0f",
-        "world_map": "\U0001f5fa\ufe0f",
-        "moyai": "\U0001f5ff",
-        "statue_of_liberty": "\U0001f5fd",
-        "tokyo_tower": "\U0001f5fc",
-        "european_castle": "\U0001f3f0",
-        "japanese_castle": "\U0001f3ef",
-        "stadium": "\U0001f3df\ufe0f",
-        "ferris_wheel": "\U0001f3a1",
-        "roller_coaster": "\U0001f3a2",
-        "carousel_horse": "\U0001f3a0",
-        "fountain": "\u26f2",
-        "beach_umbrella": "\u26f1\ufe0f",
-        "umbrella_on_ground": "\u26f1\ufe0f",
-        "beach": "\U0001f3d6\ufe0f",
-        "beach_with_umbrella": "\U0001f3d6\ufe0f",
-        "island": "\U0001f3dd\ufe0f",
-        "desert_island": "\U0001f3dd\ufe0f",
-        "desert": "\U0001f3dc\ufe0f",
-        "volcano": "\U0001f30b",
-        "mountain": "\u26f0\ufe0f",
-        "mountain_snow": "\U0001f3d4\ufe0f",
-        "snow_capped_mountain": "\U0001f3d4\ufe0f",
-        "mount_fuji": "\U0001f5fb",
-        "camping": "\U0001f3d5\ufe0f",
-        "tent": "\u26fa",
-        "house": "\U0001f3e0",
-        "house_with_garden": "\U0001f3e1",
-        "homes": "\U0001f3d8\ufe0f",
-        "house_buildings": "\U0001f3d8\ufe0f",
-        "house_abandoned": "\U0001f3da\ufe0f",
-        "derelict_house_building": "\U0001f3da\ufe0f",
-        "hut": "\U0001f6d6",
-        "construction_site": "\U0001f3d7\ufe0f",
-        "building_construction": "\U0001f3d7\ufe0f",
-        "factory": "\U0001f3ed",
-        "office": "\U0001f3e2",
-        "department_store": "\U0001f3ec",
-        "post_office": "\U0001f3e3",
-        "european_post_office": "\U0001f3e4",
-        "hospital": "\U0001f3e5",
-        "bank": "\U0001f3e6",
-        "hotel": "\U0001f3e8",
-        "convenience_store": "\U0001f3ea",
-        "school": "\U0001f3eb",
-        "love_hotel": "\U0001f3e9",
-        "wedding": "\U0001f492",
-        "classical_building": "\U0001f3db\ufe0f",
-        "church": "\u26ea",
-        "mosque": "\U0001f54c",
-        "synagogue": "\U0001f54d",
-        "hindu_temple": "\U0001f6d5",
-        "kaaba": "\U0001f54b",
-        "shinto_shrine": "\u26e9\ufe0f",
-        "railway_track": "\U0001f6e4\ufe0f",
-        "railroad_track": "\U0001f6e4\ufe0f",
-        "motorway": "\U0001f6e3\ufe0f",
-        "japan": "\U0001f5fe",
-        "rice_scene": "\U0001f391",
-        "park": "\U0001f3de\ufe0f",
-        "national_park": "\U0001f3de\ufe0f",
-        "sunrise": "\U0001f305",
-        "sunrise_over_mountains": "\U0001f304",
-        "stars": "\U0001f320",
-        "sparkler": "\U0001f387",
-        "fireworks": "\U0001f386",
-        "city_sunset": "\U0001f307",
-        "city_sunrise": "\U0001f307",
-        "city_dusk": "\U0001f306",
-        "cityscape": "\U0001f3d9\ufe0f",
-        "night_with_stars": "\U0001f303",
-        "milky_way": "\U0001f30c",
-        "bridge_at_night": "\U0001f309",
-        "foggy": "\U0001f301",
-        "watch": "\u231a",
-        "mobile_phone": "\U0001f4f1",
-        "iphone": "\U0001f4f1",
-        "calling": "\U0001f4f2",
-        "computer": "\U0001f4bb",
-        "keyboard": "\u2328\ufe0f",
-        "desktop": "\U0001f5a5\ufe0f",
-        "desktop_computer": "\U0001f5a5\ufe0f",
-        "printer": "\U0001f5a8\ufe0f",
-        "mouse_three_button": "\U0001f5b1\ufe0f",
-        "three_button_mouse": "\U0001f5b1\ufe0f",
-        "trackball": "\U0001f5b2\ufe0f",
-        "joystick": "\U0001f579\ufe0f",
-        "compression": "\U0001f5dc\ufe0f",
-        "minidisc": "\U0001f4bd",
-        "floppy_disk": "\U0001f4be",
-        "cd": "\U0001f4bf",
-        "dvd": "\U0001f4c0",
-        "vhs": "\U0001f4fc",
-        "camera": "\U0001f4f7",
-        "camera_with_flash": "\U0001f4f8",
-        "video_camera": "\U0001f4f9",
-        "movie_camera": "\U0001f3a5",
-        "projector": "\U0001f4fd\ufe0f",
-        "film_projector": "\U0001f4fd\ufe0f",
-        "film_frames": "\U0001f39e\ufe0f",
-        "telephone_receiver": "\U0001f4de",
-        "telephone": "\u260e\ufe0f",
-        "pager": "\U0001f4df",
-        "fax": "\U0001f4e0",
-        "tv": "\U0001f4fa",
-        "radio": "\U0001f4fb",
-        "microphone2": "\U0001f399\ufe0f",
-        "studio_microphone": "\U0001f399\ufe0f",
-        "level_slider": "\U0001f39a\ufe0f",
-        "control_knobs": "\U0001f39b\ufe0f",
-        "compass": "\U0001f9ed",
-        "stopwatch": "\u23f1\ufe0f",
-        "timer": "\u23f2\ufe0f",
-        "timer_clock": "\u23f2\ufe0f",
-        "alarm_clock": "\u23f0",
-        "clock": "\U0001f570\ufe0f",
-        "mantlepiece_clock": "\U0001f570\ufe0f",
-        "hourglass": "\u231b",
-        "hourglass_flowing_sand": "\u23f3",
-        "satellite": "\U0001f4e1",
-        "battery": "\U0001f50b",
-        "low_battery": "\U0001faab",
-        "electric_plug": "\U0001f50c",
-        "bulb": "\U0001f4a1",
-        "flashlight": "\U0001f526",
-        "candle": "\U0001f56f\ufe0f",
-        "diya_lamp": "\U0001fa94",
-        "fire_extinguisher": "\U0001f9ef",
-        "oil": "\U0001f6e2\ufe0f",
-        "oil_drum": "\U0001f6e2\ufe0f",
-        "money_with_wings": "\U0001f4b8",
-        "dollar": "\U0001f4b5",
-        "yen": "\U0001f4b4",
-        "euro": "\U0001f4b6",
-        "pound": "\U0001f4b7",
-        "coin": "\U0001fa99",
-        "moneybag": "\U0001f4b0",
-        "credit_card": "\U0001f4b3",
-        "identification_card": "\U0001faaa",
-        "gem": "\U0001f48e",
-        "scales": "\u2696\ufe0f",
-        "ladder": "\U0001fa9c",
-        "toolbox": "\U0001f9f0",
-        "screwdriver": "\U0001fa9b",
-        "wrench": "\U0001f527",
-        "hammer": "\U0001f528",
-        "hammer_pick": "\u2692\ufe0f",
-        "hammer_and_pick": "\u2692\ufe0f",
-        "tools": "\U0001f6e0\ufe0f",
-        "hammer_and_wrench": "\U0001f6e0\ufe0f",
-        "pick": "\u26cf\ufe0f",
-        "carpentry_saw": "\U0001fa9a",
-        "nut_and_bolt": "\U0001f529",
-        "gear": "\u2699\ufe0f",
-        "mouse_trap": "\U0001faa4",
-        "bricks": "\U0001f9f1",
-        "chains": "\u26d3\ufe0f",
-        "magnet": "\U0001f9f2",
-        "gun": "\U0001f52b",
-        "bomb": "\U0001f4a3",
-        "firecracker": "\U0001f9e8",
-        "axe": "\U0001fa93",
-        "knife": "\U0001f52a",
-        "dagger": "\U0001f5e1\ufe0f",
-        "dagger_knife": "\U0001f5e1\ufe0f",
-        "crossed_swords": "\u2694\ufe0f",
-        "shield": "\U0001f6e1\ufe0f",
-        "smoking": "\U0001f6ac",
-        "coffin": "\u26b0\ufe0f",
-        "headstone": "\U0001faa6",
-        "urn": "\u26b1\ufe0f",
-        "funeral_urn": "\u26b1\ufe0f",
-        "amphora": "\U0001f3fa",
-        "crystal_ball": "\U0001f52e",
-        "prayer_beads": "\U0001f4ff",
-        "nazar_amulet": "\U0001f9ff",
-        "hamsa": "\U0001faac",
-        "barber": "\U0001f488",
-        "alembic": "\u2697\ufe0f",
-        "telescope": "\U0001f52d",
-        "microscope": "\U0001f52c",
-        "hole": "\U0001f573\ufe0f",
-        "x_ray": "\U0001fa7b",
-        "adhesive_bandage": "\U0001fa79",
-        "stethoscope": "\U0001fa7a",
-        "pill": "\U0001f48a",
-        "syringe": "\U0001f489",
-        "drop_of_blood": "\U0001fa78",
-        "dna": "\U0001f9ec",
-        "microbe": "\U0001f9a0",
-        "petri_dish": "\U0001f9eb",
-        "test_tube": "\U0001f9ea",
-        "thermometer": "\U0001f321\ufe0f",
-        "broom": "\U0001f9f9",
-        "plunger": "\U0001faa0",
-        "basket": "\U0001f9fa",
-        "roll_of_paper": "\U0001f9fb",
-        "toilet": "\U0001f6bd",
-        "potable_water": "\U0001f6b0",
-        "shower": "\U0001f6bf",
-        "bathtub": "\U0001f6c1",
-        "bath": "\U0001f6c0",
-        "soap": "\U0001f9fc",
-        "toothbrush": "\U0001faa5",
-        "razor": "\U0001fa92",
-        "sponge": "\U0001f9fd",
-        "bucket": "\U0001faa3",
-        "squeeze_bottle": "\U0001f9f4",
-        "bellhop": "\U0001f6ce\ufe0f",
-        "bellhop_bell": "\U0001f6ce\ufe0f",
-        "key": "\U0001f511",
-        "key2": "\U0001f5dd\ufe0f",
-        "old_key": "\U0001f5dd\ufe0f",
-        "door": "\U0001f6aa",
-        "chair": "\U0001fa91",
-        "couch": "\U0001f6cb\ufe0f",
-        "couch_and_lamp": "\U0001f6cb\ufe0f",
-        "bed": "\U0001f6cf\ufe0f",
-        "sleeping_accommodation": "\U0001f6cc",
-        "teddy_bear": "\U0001f9f8",
-        "nesting_dolls": "\U0001fa86",
-        "frame_photo": "\U0001f5bc\ufe0f",
-        "frame_with_picture": "\U0001f5bc\ufe0f",
-        "mirror": "\U0001fa9e",
-        "window": "\U0001fa9f",
-        "shopping_bags": "\U0001f6cd\ufe0f",
-        "shopping_cart": "\U0001f6d2",
-        "shopping_trolley": "\U0001f6d2",
-        "gift": "\U0001f381",
-        "balloon": "\U0001f388",
-        "flags": "\U0001f38f",
-        "ribbon": "\U0001f380",
-        "magic_wand": "\U0001fa84",
-        "piñata": "\U0001fa85",
-        "confetti_ball": "\U0001f38a",
-        "tada": "\U0001f389",
-        "dolls": "\U0001f38e",
-        "izakaya_lantern": "\U0001f3ee",
-        "wind_chime": "\U0001f390",
-        "mirror_ball": "\U0001faa9",
-        "red_envelope": "\U0001f9e7",
-        "envelope": "\u2709\ufe0f",
-        "envelope_with_arrow": "\U0001f4e9",
-        "incoming_envelope": "\U0001f4e8",
-        "e_mail": "\U0001f4e7",
-        "email": "\U0001f4e7",
-        "love_letter": "\U0001f48c",
-        "inbox_tray": "\U0001f4e5",
-        "outbox_tray": "\U0001f4e4",
-        "package": "\U0001f4e6",
-        "label": "\U0001f3f7\ufe0f",
-        "placard": "\U0001faa7",
-        "mailbox_closed": "\U0001f4ea",
-        "mailbox": "\U0001f4eb",
-        "mailbox_with_mail": "\U0001f4ec",
-        "mailbox_with_no_mail": "\U0001f4ed",
-        "postbox": "\U0001f4ee",
-        "postal_horn": "\U0001f4ef",
-        "scroll": "\U0001f4dc",
-        "page_with_curl": "\U0001f4c3",
-        "page_facing_up": "\U0001f4c4",
-        "bookmark_tabs": "\U0001f4d1",
-        "receipt": "\U0001f9fe",
-        "bar_chart": "\U0001f4ca",
-        "chart_with_upwards_trend": "\U0001f4c8",
-        "chart_with_downwards_trend": "\U0001f4c9",
-        "notepad_spiral": "\U0001f5d2\ufe0f",
-        "spiral_note_pad": "\U0001f5d2\ufe0f",
-        "calendar_spiral": "\U0001f5d3\ufe0f",
-        "spiral_calendar_pad": "\U0001f5d3\ufe0f",
-        "calendar": "\U0001f4c6",
-        "date": "\U0001f4c5",
-        "wastebasket": "\U0001f5d1\ufe0f",
-        "card_index": "\U0001f4c7",
-        "card_box": "\U0001f5c3\ufe0f",
-        "card_file_box": "\U0001f5c3\ufe0f",
-        "ballot_box": "\U0001f5f3\ufe0f",
-        "ballot_box_with_ballot": "\U0001f5f3\ufe0f",
-        "file_cabinet": "\U0001f5c4\ufe0f",
-        "clipboard": "\U0001f4cb",
-        "file_folder": "\U0001f4c1",
-        "open_file_folder": "\U0001f4c2",
-        "dividers": "\U0001f5c2\ufe0f",
-        "card_index_dividers": "\U0001f5c2\ufe0f",
-        "newspaper2": "\U0001f5de\ufe0f",
-        "rolled_up_newspaper": "\U0001f5de\ufe0f",
-        "newspaper": "\U0001f4f0",
-        "notebook": "\U0001f4d3",
-        "notebook_with_decorative_cover": "\U0001f4d4",
-        "ledger": "\U0001f4d2",
-        "closed_book": "\U0001f4d5",
-        "green_book": "\U0001f4d7",
-        "blue_book": "\U0001f4d8",
-        "orange_book": "\U0001f4d9",
-        "books": "\U0001f4da",
-        "book": "\U0001f4d6",
-        "bookmark": "\U0001f516",
-        "safety_pin": "\U0001f9f7",
-        "link": "\U0001f517",
-        "paperclip": "\U0001f4ce",
-        "paperclips": "\U0001f587\ufe0f",
-        "linked_paperclips": "\U0001f587\ufe0f",
-        "triangular_ruler": "\U0001f4d0",
-        "straight_ruler": "\U0001f4cf",
-        "abacus": "\U0001f9ee",
-        "pushpin": "\U0001f4cc",
-        "round_pushpin": "\U0001f4cd",
-        "scissors": "\u2702\ufe0f",
-        "pen_ballpoint": "\U0001f58a\ufe0f",
-        "lower_left_ballpoint_pen": "\U0001f58a\ufe0f",
-        "pen_fountain": "\U0001f58b\ufe0f",
-        "lower_left_fountain_pen": "\U0001f58b\ufe0f",
-        "black_nib": "\u2712\ufe0f",
-        "paintbrush": "\U0001f58c\ufe0f",
-        "lower_left_paintbrush": "\U0001f58c\ufe0f",
-        "crayon": "\U0001f58d\ufe0f",
-        "lower_left_crayon": "\U0001f58d\ufe0f",
-        "pencil": "\U0001f4dd",
-        "memo": "\U0001f4dd",
-        "pencil2": "\u270f\ufe0f",
-        "mag": "\U0001f50d",
-        "mag_right": "\U0001f50e",
-        "lock_with_ink_pen": "\U0001f50f",
-        "closed_lock_with_key": "\U0001f510",
-        "lock": "\U0001f512",
-        "unlock": "\U0001f513",
-        "heart": "\u2764\ufe0f",
-        "orange_heart": "\U0001f9e1",
-        "yellow_heart": "\U0001f49b",
-        "green_heart": "\U0001f49a",
-        "blue_heart": "\U0001f499",
-        "purple_heart": "\U0001f49c",
-        "black_heart": "\U0001f5a4",
-        "brown_heart": "\U0001f90e",
-        "white_heart": "\U0001f90d",
-        "broken_heart": "\U0001f494",
-        "heart_exclamation": "\u2763\ufe0f",
-        "heavy_heart_exclamation_mark_ornament": "\u2763\ufe0f",
-        "two_hearts": "\U0001f495",
-        "revolving_hearts": "\U0001f49e",
-        "heartbeat": "\U0001f493",
-        "heartpulse": "\U0001f497",
-        "sparkling_heart": "\U0001f496",
-        "cupid": "\U0001f498",
-        "gift_heart": "\U0001f49d",
-        "mending_heart": "\u2764\ufe0f\u200d\U0001fa79",
-        "heart_on_fire": "\u2764\ufe0f\u200d\U0001f525",
-        "heart_decoration": "\U0001f49f",
-        "peace": "\u262e\ufe0f",
-        "peace_symbol": "\u262e\ufe0f",
-        "cross": "\u271d\ufe0f",
-        "latin_cross": "\u271d\ufe0f",
-        "star_and_crescent": "\u262a\ufe0f",
-        "om_symbol": "\U0001f549\ufe0f",
-        "wheel_of_dharma": "\u2638\ufe0f",
-        "star_of_david": "\u2721\ufe0f",
-        "six_pointed_star": "\U0001f52f",
-        "menorah": "\U0001f54e",
-        "yin_yang": "\u262f\ufe0f",
-        "orthodox_cross": "\u2626\ufe0f",
-        "place_of_worship": "\U0001f6d0",
-        "worship_symbol": "\U0001f6d0",
-        "ophiuchus": "\u26ce",
-        "aries": "\u2648",
-        "taurus": "\u2649",
-        "gemini": "\u264a",
-        "cancer": "\u264b",
-        "leo": "\u264c",
-        "virgo": "\u264d",
-        "libra": "\u264e",
-        "scorpius": "\u264f",
-        "sagittarius": "\u2650",
-        "capricorn": "\u2651",
-        "aquarius": "\u2652",
-        "pisces": "\u2653",
-        "id": "\U0001f194",
-        "atom": "\u269b\ufe0f",
-        "atom_symbol": "\u269b\ufe0f",
-        "accept": "\U0001f251",
-        "radioactive": "\u2622\ufe0f",
-        "radioactive_sign": "\u2622\ufe0f",
-        "biohazard": "\u2623\ufe0f",
-        "biohazard_sign": "\u2623\ufe0f",
-        "mobile_phone_off": "\U0001f4f4",
-        "vibration_mode": "\U0001f4f3",
-        "u6709": "\U0001f236",
-        "u7121": "\U0001f21a",
-        "u7533": "\U0001f238",
-        "u55b6": "\U0001f23a",
-        "u6708": "\U0001f237\ufe0f",
-        "eight_pointed_black_star": "\u2734\ufe0f",
-        "vs": "\U0001f19a",
-        "white_flower": "\U0001f4ae",
-        "ideograph_advantage": "\U0001f250",
-        "secret": "\u3299\ufe0f",
-        "congratulations": "\u3297\ufe0f",
-        "u5408": "\U0001f234",
-        "u6e80": "\U0001f235",
-        "u5272": "\U0001f239",
-        "u7981": "\U0001f232",
-        "a": "\U0001f170\ufe0f",
-        "b": "\U0001f171\ufe0f",
-        "ab": "\U0001f18e",
-        "cl": "\U0001f191",
-        "o2": "\U0001f17e\ufe0f",
-        "sos": "\U0001f198",
-        "xx": "\u274c",
-        "o": "\u2b55",
-        "octagonal_sign": "\U0001f6d1",
-        "stop_sign": "\U0001f6d1",
-        "no_entry": "\u26d4",
-        "name_badge": "\U0001f4db",
-        "no_entry_sign": "\U0001f6ab",
-        "100": "\U0001f4af",
-        "anger": "\U0001f4a2",
-        "hotsprings": "\u2668\ufe0f",
-        "no_pedestrians": "\U0001f6b7",
-        "do_not_litter": "\U0001f6af",
-        "no_bicycles": "\U0001f6b3",
-        "non_potable_water": "\U0001f6b1",
-        "underage": "\U0001f51e",
-        "no_mobile_phones": "\U0001f4f5",
-        "no_smoking": "\U0001f6ad",
-        "exclamation": "\u2757",
-        "grey_exclamation": "\u2755",
-        "question": "\u2753",
-        "grey_question": "\u2754",
-        "bangbang": "\u203c\ufe0f",
-        "interrobang": "\u2049\ufe0f",
-        "low_brightness": "\U0001f505",
-        "high_brightness": "\U0001f506",
-        "part_alternation_mark": "\u303d\ufe0f",
-        "warning": "\u26a0\ufe0f",
-        "children_crossing": "\U0001f6b8",
-        "trident": "\U0001f531",
-        "fleur_de_lis": "\u269c\ufe0f",
-        "beginner": "\U0001f530",
-        "recycle": "\u267b\ufe0f",
-        "white_check_mark": "\u2705",
-        "u6307": "\U0001f22f",
-        "chart": "\U0001f4b9",
-        "sparkle": "\u2747\ufe0f",
-        "eight_spoked_asterisk": "\u2733\ufe0f",
-        "negative_squared_cross_mark": "\u274e",
-        "globe_with_meridians": "\U0001f310",
-        "diamond_shape_with_a_dot_inside": "\U0001f4a0",
-        "m": "\u24c2\ufe0f",
-        "cyclone": "\U0001f300",
-        "zzz": "\U0001f4a4",
-        "atm": "\U0001f3e7",
-        "wc": "\U0001f6be",
-        "wheelchair": "\u267f",
-        "parking": "\U0001f17f\ufe0f",
-        "u7a7a": "\U0001f233",
-        "sa": "\U0001f202\ufe0f",
-        "passport_control": "\U0001f6c2",
-        "customs": "\U0001f6c3",
-        "baggage_claim": "\U0001f6c4",
-        "left_luggage": "\U0001f6c5",
-        "elevator": "\U0001f6d7",
-        "mens": "\U0001f6b9",
-        "womens": "\U0001f6ba",
-        "baby_symbol": "\U0001f6bc",
-        "restroom": "\U0001f6bb",
-        "put_litter_in_its_place": "\U0001f6ae",
-        "cinema": "\U0001f3a6",
-        "signal_strength": "\U0001f4f6",
-        "koko": "\U0001f201",
-        "symbols": "\U0001f523",
-        "information_source": "\u2139\ufe0f",
-        "abc": "\U0001f524",
-        "abcd": "\U0001f521",
-        "capital_abcd": "\U0001f520",
-        "ng": "\U0001f196",
-        "ok": "\U0001f197",
-        "up": "\U0001f199",
-        "cool": "\U0001f192",
-        "new": "\U0001f195",
-        "free": "\U0001f193",
-        "zero": "0\ufe0f\u20e3",
-        "one": "1\ufe0f\u20e3",
-        "two": "2\ufe0f\u20e3",
-        "three": "3\ufe0f\u20e3",
-        "four": "4\ufe0f\u20e3",
-        "five": "5\ufe0f\u20e3",
-        "six": "6\ufe0f\u20e3",
-        "seven": "7\ufe0f\u20e3",
-        "eight": "8\ufe0f\u20e3",
-        "nine": "9\ufe0f\u20e3",
-        "keycap_ten": "\U0001f51f",
-        "1234": "\U0001f522",
-        "hash": "#\ufe0f\u20e3",
-        "asterisk": "*\ufe0f\u20e3",
-        "keycap_asterisk": "*\ufe0f\u20e3",
-        "eject": "\u23cf\ufe0f",
-        "eject_symbol": "\u23cf\ufe0f",
-        "arrow_forward": "\u25b6\ufe0f",
-        "pause_button": "\u23f8\ufe0f",
-        "double_vertical_bar": "\u23f8\ufe0f",
-        "play_pause": "\u23ef\ufe0f",
-        "stop_button": "\u23f9\ufe0f",
-        "record_button": "\u23fa\ufe0f",
-        "track_next": "\u23ed\ufe0f",
-        "next_track": "\u23ed\ufe0f",
-        "track_previous": "\u23ee\ufe0f",
-        "previous_track": "\u23ee\ufe0f",
-        "fast_forward": "\u23e9",
-        "rewind": "\u23ea",
-        "arrow_double_up": "\u23eb",
-        "arrow_double_down": "\u23ec",
-        "arrow_backward": "\u25c0\ufe0f",
-        "arrow_up_small": "\U0001f53c",
-        "arrow_down_small": "\U0001f53d",
-        "arrow_right": "\u27a1\ufe0f",
-        "arrow_left": "\u2b05\ufe0f",
-        "arrow_up": "\u2b06\ufe0f",
-        "arrow_down": "\u2b07\ufe0f",
-        "arrow_upper_right": "\u2197\ufe0f",
-        "arrow_lower_right": "\u2198\ufe0f",
-        "arrow_lower_left": "\u2199\ufe0f",
-        "arrow_upper_left": "\u2196\ufe0f",
-        "arrow_up_down": "\u2195\ufe0f",
-        "left_right_arrow": "\u2194\ufe0f",
-        "arrow_right_hook": "\u21aa\ufe0f",
-        "leftwards_arrow_with_hook": "\u21a9\ufe0f",
-        "arrow_heading_up": "\u2934\ufe0f",
-        "arrow_heading_down": "\u2935\ufe0f",
-        "twisted_rightwards_arrows": "\U0001f500",
-        "repeat": "\U0001f501",
-        "repeat_one": "\U0001f502",
-        "arrows_counterclockwise": "\U0001f504",
-        "arrows_clockwise": "\U0001f503",
-        "musical_note": "\U0001f3b5",
-        "notes": "\U0001f3b6",
-        "heavy_plus_sign": "\u2795",
-        "heavy_minus_sign": "\u2796",
-        "heavy_division_sign": "\u2797",
-        "heavy_multiplication_x": "\u2716\ufe0f",
-        "heavy_equals_sign": "\U0001f7f0",
-        "infinity": "\u267e\ufe0f",
-        "heavy_dollar_sign": "\U0001f4b2",
-        "currency_exchange": "\U0001f4b1",
-        "tm": "\u2122\ufe0f",
-        "copyright": "\xa9\ufe0f",
-        "registered": "\xae\ufe0f",
-        "wavy_dash": "\u3030\ufe0f",
-        "curly_loop": "\u27b0",
-        "loop": "\u27bf",
-        "end": "\U0001f51a",
-        "back_arrow": "\U0001f519",
-        "on": "\U0001f51b",
-        "top": "\U0001f51d",
-        "soon": "\U0001f51c",
-        "heavy_check_mark": "\u2714\ufe0f",
-        "ballot_box_with_check": "\u2611\ufe0f",
-        "radio_button": "\U0001f518",
-        "white_circle": "\u26aa",
-        "black_circle": "\u26ab",
-        "red_circle": "\U0001f534",
-        "blue_circle": "\U0001f535",
-        "brown_circle": "\U0001f7e4",
-        "purple_circle": "\U0001f7e3",
-        "green_circle": "\U0001f7e2",
-        "yellow_circle": "\U0001f7e1",
-        "orange_circle": "\U0001f7e0",
-        "small_red_triangle": "\U0001f53a",
-        "small_red_triangle_down": "\U0001f53b",
-        "small_orange_diamond": "\U0001f538",
-        "small_blue_diamond": "\U0001f539",
-        "large_orange_diamond": "\U0001f536",
-        "large_blue_diamond": "\U0001f537",
-        "white_square_button": "\U0001f533",
-        "black_square_button": "\U0001f532",
-        "black_small_square": "\u25aa\ufe0f",
-        "white_small_square": "\u25ab\ufe0f",
-        "black_medium_small_square": "\u25fe",
-        "white_medium_small_square": "\u25fd",
-        "black_medium_square": "\u25fc\ufe0f",
-        "white_medium_square": "\u25fb\ufe0f",
-        "black_large_square": "\u2b1b",
-        "white_large_square": "\u2b1c",
-        "orange_square": "\U0001f7e7",
-        "blue_square": "\U0001f7e6",
-        "red_square": "\U0001f7e5",
-        "brown_square": "\U0001f7eb",
-        "purple_square": "\U0001f7ea",
-        "green_square": "\U0001f7e9",
-        "yellow_square": "\U0001f7e8",
-        "speaker": "\U0001f508",
-        "mute": "\U0001f507",
-        "sound": "\U0001f509",
-        "loud_sound": "\U0001f50a",
-        "bell": "\U0001f514",
-        "no_bell": "\U0001f515",
-        "mega": "\U0001f4e3",
-        "loudspeaker": "\U0001f4e2",
-        "speech_left": "\U0001f5e8\ufe0f",
-        "left_speech_bubble": "\U0001f5e8\ufe0f",
-        "eye_in_speech_bubble": "\U0001f441\u200d\U0001f5e8",
-        "speech_balloon": "\U0001f4ac",
-        "thought_balloon": "\U0001f4ad",
-        "anger_right": "\U0001f5ef\ufe0f",
-        "right_anger_bubble": "\U0001f5ef\ufe0f",
-        "spades": "\u2660\ufe0f",
-        "clubs": "\u2663\ufe0f",
-        "hearts": "\u2665\ufe0f",
-        "diamonds": "\u2666\ufe0f",
-        "black_joker": "\U0001f0cf",
-        "flower_playing_cards": "\U0001f3b4",
-        "mahjong": "\U0001f004",
-        "clock1": "\U0001f550",
-        "clock2": "\U0001f551",
-        "clock3": "\U0001f552",
-        "clock4": "\U0001f553",
-        "clock5": "\U0001f554",
-        "clock6": "\U0001f555",
-        "clock7": "\U0001f556",
-        "clock8": "\U0001f557",
-        "clock9": "\U0001f558",
-        "clock10": "\U0001f559",
-        "clock11": "\U0001f55a",
-        "clock12": "\U0001f55b",
-        "clock130": "\U0001f55c",
-        "clock230": "\U0001f55d",
-        "clock330": "\U0001f55e",
-        "clock430": "\U0001f55f",
-        "clock530": "\U0001f560",
-        "clock630": "\U0001f561",
-        "clock730": "\U0001f562",
-        "clock830": "\U0001f563",
-        "clock930": "\U0001f564",
-        "clock1030": "\U0001f565",
-        "clock1130": "\U0001f566",
-        "clock1230": "\U0001f567",
-        "female_sign": "\u2640\ufe0f",
-        "male_sign": "\u2642\ufe0f",
-        "transgender_symbol": "\u26a7",
-        "medical_symbol": "\u2695\ufe0f",
-        "regional_indicator_z": "\U0001f1ff",
-        "regional_indicator_y": "\U0001f1fe",
-        "regional_indicator_x": "\U0001f1fd",
-        "regional_indicator_w": "\U0001f1fc",
-        "regional_indicator_v": "\U0001f1fb",
-        "regional_indicator_u": "\U0001f1fa",
-        "regional_indicator_t": "\U0001f1f9",
-        "regional_indicator_s": "\U0001f1f8",
-        "regional_indicator_r": "\U0001f1f7",
-        "regional_indicator_q": "\U0001f1f6",
-        "regional_indicator_p": "\U0001f1f5",
-        "regional_indicator_o": "\U0001f1f4",
-        "regional_indicator_n": "\U0001f1f3",
-        "regional_indicator_m": "\U0001f1f2",
-        "regional_indicator_l": "\U0001f1f1",
-        "regional_indicator_k": "\U0001f1f0",
-        "regional_indicator_j": "\U0001f1ef",
-        "regional_indicator_i": "\U0001f1ee",
-        "regional_indicator_h": "\U0001f1ed",
-        "regional_indicator_g": "\U0001f1ec",
-        "regional_indicator_f": "\U0001f1eb",
-        "regional_indicator_e": "\U0001f1ea",
-        "regional_indicator_d": "\U0001f1e9",
-        "regional_indicator_c": "\U0001f1e8",
-        "regional_indicator_b": "\U0001f1e7",
-        "regional_indicator_a": "\U0001f1e6",
-        "flag_white": "\U0001f3f3\ufe0f",
-        "flag_black": "\U0001f3f4",
-        "checkered_flag": "\U0001f3c1",
-        "triangular_flag_on_post": "\U0001f6a9",
-        "rainbow_flag": "\U0001f3f3\ufe0f\u200d\U0001f308",
-        "gay_pride_flag": "\U0001f3f3\ufe0f\u200d\U0001f308",
-        "transgender_flag": "\U0001f3f3\ufe0f\u200d\u26a7\ufe0f",
-        "pirate_flag": "\U0001f3f4\u200d\u2620\ufe0f",
-        "flag_af": "\U0001f1e6\U0001f1eb",
-        "flag_ax": "\U0001f1e6\U0001f1fd",
-        "flag_al": "\U0001f1e6\U0001f1f1",
-        "flag_dz": "\U0001f1e9\U0001f1ff",
-        "flag_as": "\U0001f1e6\U0001f1f8",
-        "flag_ad": "\U0001f1e6\U0001f1e9",
-        "flag_ao": "\U0001f1e6\U0001f1f4",
-        "flag_ai": "\U0001f1e6\U0001f1ee",
-        "flag_aq": "\U0001f1e6\U0001f1f6",
-        "flag_ag": "\U0001f1e6\U0001f1ec",
-        "flag_ar": "\U0001f1e6\U0001f1f7",
-        "flag_am": "\U0001f1e6\U0001f1f2",
-        "flag_aw": "\U0001f1e6\U0001f1fc",
-        "flag_au": "\U0001f1e6\U0001f1fa",
-        "flag_at": "\U0001f1e6\U0001f1f9",
-        "flag_az": "\U0001f1e6\U0001f1ff",
-        "flag_bs": "\U0001f1e7\U0001f1f8",
-        "flag_bh": "\U0001f1e7\U0001f1ed",
-        "flag_bd": "\U0001f1e7\U0001f1e9",
-        "flag_bb": "\U0001f1e7\U0001f1e7",
-        "flag_by": "\U0001f1e7\U0001f1fe",
-        "flag_be": "\U0001f1e7\U0001f1ea",
-        "flag_bz": "\U0001f1e7\U0001f1ff",
-        "flag_bj": "\U0001f1e7\U0001f1ef",
-        "flag_bm": "\U0001f1e7\U0001f1f2",
-        "flag_bt": "\U0001f1e7\U0001f1f9",
-        "flag_bo": "\U0001f1e7\U0001f1f4",
-        "flag_ba": "\U0001f1e7\U0001f1e6",
-        "flag_bw": "\U0001f1e7\U0001f1fc",
-        "flag_br": "\U0001f1e7\U0001f1f7",
-        "flag_io": "\U0001f1ee\U0001f1f4",
-        "flag_vg": "\U0001f1fb\U0001f1ec",
-        "flag_bn": "\U0001f1e7\U0001f1f3",
-        "flag_bg": "\U0001f1e7\U0001f1ec",
-        "flag_bf": "\U0001f1e7\U0001f1eb",
-        "flag_bi": "\U0001f1e7\U0001f1ee",
-        "flag_kh": "\U0001f1f0\U0001f1ed",
-        "flag_cm": "\U0001f1e8\U0001f1f2",
-        "flag_ca": "\U0001f1e8\U0001f1e6",
-        "flag_ic": "\U0001f1ee\U0001f1e8",
-        "flag_cv": "\U0001f1e8\U0001f1fb",
-        "flag_bq": "\U0001f1e7\U0001f1f6",
-        "flag_ky": "\U0001f1f0\U0001f1fe",
-        "flag_cf": "\U0001f1e8\U0001f1eb",
-        "flag_td": "\U0001f1f9\U0001f1e9",
-        "flag_cl": "\U0001f1e8\U0001f1f1",
-        "flag_cn": "\U0001f1e8\U0001f1f3",
-        "flag_cx": "\U0001f1e8\U0001f1fd",
-        "flag_cc": "\U0001f1e8\U0001f1e8",
-        "flag_co": "\U0001f1e8\U0001f1f4",
-        "flag_km": "\U0001f1f0\U0001f1f2",
-        "flag_cg": "\U0001f1e8\U0001f1ec",
-        "flag_cd": "\U0001f1e8\U0001f1e9",
-        "flag_ck": "\U0001f1e8\U0001f1f0",
-        "flag_cr": "\U0001f1e8\U0001f1f7",
-        "flag_ci": "\U0001f1e8\U0001f1ee",
-        "flag_hr": "\U0001f1ed\U0001f1f7",
-        "flag_cu": "\U0001f1e8\U0001f1fa",
-        "flag_cw": "\U0001f1e8\U0001f1fc",
-        "flag_cy": "\U0001f1e8\U0001f1fe",
-        "flag_cz": "\U0001f1e8\U0001f1ff",
-        "flag_dk": "\U0001f1e9\U0001f1f0",
-        "flag_dj": "\U0001f1e9\U0001f1ef",
-        "flag_dm": "\U0001f1e9\U0001f1f2",
-        "flag_do": "\U0001f1e9\U0001f1f4",
-        "flag_ec": "\U0001f1ea\U0001f1e8",
-        "flag_eg": "\U0001f1ea\U0001f1ec",
-        "flag_sv": "\U0001f1f8\U0001f1fb",
-        "flag_gq": "\U0001f1ec\U0001f1f6",
-        "flag_er": "\U0001f1ea\U0001f1f7",
-        "flag_ee": "\U0001f1ea\U0001f1ea",
-        "flag_et": "\U0001f1ea\U0001f1f9",
-        "flag_eu": "\U0001f1ea\U0001f1fa",
-        "flag_fk": "\U0001f1eb\U0001f1f0",
-        "flag_fo": "\U0001f1eb\U0001f1f4",
-        "flag_fj": "\U0001f1eb\U0001f1ef",
-        "flag_fi": "\U0001f1eb\U0001f1ee",
-        "flag_fr": "\U0001f1eb\U0001f1f7",
-        "flag_gf": "\U0001f1ec\U0001f1eb",
-        "flag_pf": "\U0001f1f5\U0001f1eb",
-        "flag_tf": "\U0001f1f9\U0001f1eb",
-        "flag_ga": "\U0001f1ec\U0001f1e6",
-        "flag_gm": "\U0001f1ec\U0001f1f2",
-        "flag_ge": "\U0001f1ec\U0001f1ea",
-        "flag_de": "\U0001f1e9\U0001f1ea",
-        "flag_gh": "\U0001f1ec\U0001f1ed",
-        "flag_gi": "\U0001f1ec\U0001f1ee",
-        "flag_gr": "\U0001f1ec\U0001f1f7",
-        "flag_gl": "\U0001f1ec\U0001f1f1",
-        "flag_gd": "\U0001f1ec\U0001f1e9",
-        "flag_gp": "\U0001f1ec\U0001f1f5",
-        "flag_gu": "\U0001f1ec\U0001f1fa",
-        "flag_gt": "\U0001f1ec\U0001f1f9",
-        "flag_gg": "\U0001f1ec\U0001f1ec",
-        "flag_gn": "\U0001f1ec\U0001f1f3",
-        "flag_gw": "\U0001f1ec\U0001f1fc",
-        "flag_gy": "\U0001f1ec\U0001f1fe",
-        "flag_ht": "\U0001f1ed\U0001f1f9",
-        "flag_hn": "\U0001f1ed\U0001f1f3",
-        "flag_hk": "\U0001f1ed\U0001f1f0",
-        "flag_hu": "\U0001f1ed\U0001f1fa",
-        "flag_is": "\U0001f1ee\U0001f1f8",
-        "flag_in": "\U0001f1ee\U0001f1f3",
-        "flag_id": "\U0001f1ee\U0001f1e9",
-        "flag_ir": "\U0001f1ee\U0001f1f7",
-        "flag_iq": "\U0001f1ee\U0001f1f6",
-        "flag_ie": "\U0001f1ee\U0001f1ea",
-        "flag_im": "\U0001f1ee\U0001f1f2",
-        "flag_il": "\U0001f1ee\U0001f1f1",
-        "flag_it": "\U0001f1ee\U0001f1f9",
-        "flag_jm": "\U0001f1ef\U0001f1f2",
-        "flag_jp": "\U0001f1ef\U0001f1f5",
-        "crossed_flags": "\U0001f38c",
-        "flag_je": "\U0001f1ef\U0001f1ea",
-        "flag_jo": "\U0001f1ef\U0001f1f4",
-        "flag_kz": "\U0001f1f0\U0001f1ff",
-        "flag_ke": "\U0001f1f0\U0001f1ea",
-        "flag_ki": "\U0001f1f0\U0001f1ee",
-        "flag_xk": "\U0001f1fd\U0001f1f0",
-        "flag_kw": "\U0001f1f0\U0001f1fc",
-        "flag_kg": "\U0001f1f0\U0001f1ec",
-        "flag_la": "\U0001f1f1\U0001f1e6",
-        "flag_lv": "\U0001f1f1\U0001f1fb",
-        "flag_lb": "\U0001f1f1\U0001f1e7",
-        "flag_ls": "\U0001f1f1\U0001f1f8",
-        "flag_lr": "\U0001f1f1\U0001f1f7",
-        "flag_ly": "\U0001f1f1\U0001f1fe",
-        "flag_li": "\U0001f1f1\U0001f1ee",
-        "flag_lt": "\U0001f1f1\U0001f1f9",
-        "flag_lu": "\U0001f1f1\U0001f1fa",
-        "flag_mo": "\U0001f1f2\U0001f1f4",
-        "flag_mk": "\U0001f1f2\U0001f1f0",
-        "flag_mg": "\U0001f1f2\U0001f1ec",
-        "flag_mw": "\U0001f1f2\U0001f1fc",
-        "flag_my": "\U0001f1f2\U0001f1fe",
-        "flag_mv": "\U0001f1f2\U0001f1fb",
-        "flag_ml": "\U0001f1f2\U0001f1f1",
-        "flag_mt": "\U0001f1f2\U0001f1f9",
-        "flag_mh": "\U0001f1f2\U0001f1ed",
-        "flag_mq": "\U0001f1f2\U0001f1f6",
-        "flag_mr": "\U0001f1f2\U0001f1f7",
-        "flag_mu": "\U0001f1f2\U0001f1fa",
-        "flag_yt": "\U0001f1fe\U0001f1f9",
-        "flag_mx": "\U0001f1f2\U0001f1fd",
-        "flag_fm": "\U0001f1eb\U0001f1f2",
-        "flag_md": "\U0001f1f2\U0001f1e9",
-        "flag_mc": "\U0001f1f2\U0001f1e8",
-        "flag_mn": "\U0001f1f2\U0001f1f3",
-        "flag_me": "\U0001f1f2\U0001f1ea",
-        "flag_ms": "\U0001f1f2\U0001f1f8",
-        "flag_ma": "\U0001f1f2\U0001f1e6",
-        "flag_mz": "\U0001f1f2\U0001f1ff",
-        "flag_mm": "\U0001f1f2\U0001f1f2",
-        "flag_na": "\U0001f1f3\U0001f1e6",
-        "flag_nr": "\U0001f1f3\U0001f1f7",
-        "flag_np": "\U0001f1f3\U0001f1f5",
-        "flag_nl": "\U0001f1f3\U0001f1f1",
-        "flag_nc": "\U0001f1f3\U0001f1e8",
-        "flag_nz": "\U0001f1f3\U0001f1ff",
-        "flag_ni": "\U0001f1f3\U0001f1ee",
-        "flag_ne": "\U0001f1f3\U0001f1ea",
-        "flag_ng": "\U0001f1f3\U0001f1ec",
-        "flag_nu": "\U0001f1f3\U0001f1fa",
-        "flag_nf": "\U0001f1f3\U0001f1eb",
-        "flag_kp": "\U0001f1f0\U0001f1f5",
-        "flag_mp": "\U0001f1f2\U0001f1f5",
-        "flag_no": "\U0001f1f3\U0001f1f4",
-        "flag_om": "\U0001f1f4\U0001f1f2",
-        "flag_pk": "\U0001f1f5\U0001f1f0",
-        "flag_pw": "\U0001f1f5\U0001f1fc",
-        "flag_ps": "\U0001f1f5\U0001f1f8",
-        "flag_pa": "\U0001f1f5\U0001f1e6",
-        "flag_pg": "\U0001f1f5\U0001f1ec",
-        "flag_py": "\U0001f1f5\U0001f1fe",
-        "flag_pe": "\U0001f1f5\U0001f1ea",
-        "flag_ph": "\U0001f1f5\U0001f1ed",
-        "flag_pn": "\U0001f1f5\U0001f1f3",
-        "flag_pl": "\U0001f1f5\U0001f1f1",
-        "flag_pt": "\U0001f1f5\U0001f1f9",
-        "flag_pr": "\U0001f1f5\U0001f1f7",
-        "flag_qa": "\U0001f1f6\U0001f1e6",
-        "flag_re": "\U0001f1f7\U0001f1ea",
-        "flag_ro": "\U0001f1f7\U0001f1f4",
-        "flag_ru": "\U0001f1f7\U0001f1fa",
-        "flag_rw": "\U0001f1f7\U0001f1fc",
-        "flag_ws": "\U0001f1fc\U0001f1f8",
-        "flag_sm": "\U0001f1f8\U0001f1f2",
-        "flag_st": "\U0001f1f8\U0001f1f9",
-        "flag_sa": "\U0001f1f8\U0001f1e6",
-        "flag_sn": "\U0001f1f8\U0001f1f3",
-        "flag_rs": "\U0001f1f7\U0001f1f8",
-        "flag_sc": "\U0001f1f8\U0001f1e8",
-        "flag_sl": "\U0001f1f8\U0001f1f1",
-        "flag_sg": "\U0001f1f8\U0001f1ec",
-        "flag_sx": "\U0001f1f8\U0001f1fd",
-        "flag_sk": "\U0001f1f8\U0001f1f0",
-        "flag_si": "\U0001f1f8\U0001f1ee",
-        "flag_gs": "\U0001f1ec\U0001f1f8",
-        "flag_sb": "\U0001f1f8\U0001f1e7",
-        "flag_so": "\U0001f1f8\U0001f1f4",
-        "flag_za": "\U0001f1ff\U0001f1e6",
-        "flag_kr": "\U0001f1f0\U0001f1f7",
-        "flag_ss": "\U0001f1f8\U0001f1f8",
-        "flag_es": "\U0001f1ea\U0001f1f8",
-        "flag_lk": "\U0001f1f1\U0001f1f0",
-        "flag_bl": "\U0001f1e7\U0001f1f1",
-        "flag_sh": "\U0001f1f8\U0001f1ed",
-        "flag_kn": "\U0001f1f0\U0001f1f3",
-        "flag_lc": "\U0001f1f1\U0001f1e8",
-        "flag_pm": "\U0001f1f5\U0001f1f2",
-        "flag_vc": "\U0001f1fb\U0001f1e8",
-        "flag_sd": "\U0001f1f8\U0001f1e9",
-        "flag_sr": "\U0001f1f8\U0001f1f7",
-        "flag_sz": "\U0001f1f8\U0001f1ff",
-        "flag_se": "\U0001f1f8\U0001f1ea",
-        "flag_ch": "\U0001f1e8\U0001f1ed",
-        "flag_sy": "\U0001f1f8\U0001f1fe",
-        "flag_tw": "\U0001f1f9\U0001f1fc",
-        "flag_tj": "\U0001f1f9\U0001f1ef",
-        "flag_tz": "\U0001f1f9\U0001f1ff",
-        "flag_th": "\U0001f1f9\U0001f1ed",
-        "flag_tl": "\U0001f1f9\U0001f1f1",
-        "flag_tg": "\U0001f1f9\U0001f1ec",
-        "flag_tk": "\U0001f1f9\U0001f1f0",
-        "flag_to": "\U0001f1f9\U0001f1f4",
-        "flag_tt": "\U0001f1f9\U0001f1f9",
-        "flag_tn": "\U0001f1f9\U0001f1f3",
-        "flag_tr": "\U0001f1f9\U0001f1f7",
-        "flag_tm": "\U0001f1f9\U0001f1f2",
-        "flag_tc": "\U0001f1f9\U0001f1e8",
-        "flag_vi": "\U0001f1fb\U0001f1ee",
-        "flag_tv": "\U0001f1f9\U0001f1fb",
-        "flag_ug": "\U0001f1fa\U0001f1ec",
-        "flag_ua": "\U0001f1fa\U0001f1e6",
-        "flag_ae": "\U0001f1e6\U0001f1ea",
-        "flag_gb": "\U0001f1ec\U0001f1e7",
-        "england": "\U0001f3f4\U000e0067\U000e0062\U000e0065\U000e006e\U000e0067\U000e007f",
-        "scotland": "\U0001f3f4\U000e0067\U000e0062\U000e0073\U000e0063\U000e0074\U000e007f",
-        "wales": "\U0001f3f4\U000e0067\U000e0062\U000e0077\U000e006c\U000e0073\U000e007f",
-        "flag_us": "\U0001f1fa\U0001f1f8",
-        "flag_uy": "\U0001f1fa\U0001f1fe",
-        "flag_uz": "\U0001f1fa\U0001f1ff",
-        "flag_vu": "\U0001f1fb\U0001f1fa",
-        "flag_va": "\U0001f1fb\U0001f1e6",
-        "flag_ve": "\U0001f1fb\U0001f1ea",
-        "flag_vn": "\U0001f1fb\U0001f1f3",
-        "flag_wf": "\U0001f1fc\U0001f1eb",
-        "flag_eh": "\U0001f1ea\U0001f1ed",
-        "flag_ye": "\U0001f1fe\U0001f1ea",
-        "flag_zm": "\U0001f1ff\U0001f1f2",
-        "flag_zw": "\U0001f1ff\U0001f1fc",
-        "flag_ac": "\U0001f1e6\U0001f1e8",
-        "flag_bv": "\U0001f1e7\U0001f1fb",
-        "flag_cp": "\U0001f1e8\U0001f1f5",
-        "flag_ea": "\U0001f1ea\U0001f1e6",
-        "flag_dg": "\U0001f1e9\U0001f1ec",
-        "flag_hm": "\U0001f1ed\U0001f1f2",
-        "flag_mf": "\U0001f1f2\U0001f1eb",
-        "flag_sj": "\U0001f1f8\U0001f1ef",
-        "flag_ta": "\U0001f1f9\U0001f1e6",
-        "flag_um": "\U0001f1fa\U0001f1f2",
-        "united_nations": "\U0001f1fa\U0001f1f3",
-        "default": "\u2753",
-    },
+# The data tables (emojidict, the permission/flag descriptions, guild_features, http_codes and the codeblock
+# languages) are edited in _constants_tables.py and compiled into _constants_tables.marshal. Each one is loaded
+# from it the first time it is accessed (see __getattr__), so importing this module doesn't build them.
+# Bump _TABLES_VERSION whenever _constants_tables.py is edited, an artifact stamped with another version is ignored.
+_TABLES_VERSION = 1
+_TABLES_SOURCE = pathlib.Path(__file__).with_name("_constants_tables.py")
+_TABLES_ARTIFACT = _TABLES_SOURCE.with_suffix(".marshal")
+_TABLES = (
+    "emojidict",
+    "permission_proper_names",
+    "permission_descriptions",
+    "user_flag_descriptions",
+    "misc_flag_descriptions",
+    "guild_features",
+    "http_codes",
+    "CODEBLOCK_LANGUAGES",
 )
 
-try:
-    from .custom_constants import emojidict as new_emojidict # type: ignore
-
-    for k, v in new_emojidict.items():
-        emojidict[k] = v
-except ImportError:
-    pass
-
-LOADING_EMOJI: Annotated[str, "The default emoji the bot uses when it is 'thinking'."] = emojidict.get("thinking", "\U0001f4bb")
-
-permission_proper_names: Annotated[Dict[str, str], 
-"A list of all permissions in the Discord API. Dictionary goes in Alphabetical order in the form `api_name`: `proper_name`."
-] = {
-    "add_reactions": "Add Reactions",
-    "administrator": "Administrator",
-    "attach_files": "Attach Files",
-    "ban_members": "Ban Members",
-    "change_nickname": "Change Nickname",
-    "connect": "Connect",
-
-    # 2.4+ only
-    "create_polls": "Create Polls",
-
-    "create_events": "Create Events",
-    "create_expressions": "Create Expressions",
-    "create_instant_invite": "Create Instant Invite",
-    "create_private_threads": "Create Private Threads",
-    "create_public_threads": "Create Public Threads",
-    "deafen_members": "Deafen Members",
-    "embed_links": "Embed Links",
-
-    "external_emojis": "Use External Emojis",
-    "external_stickers": "Use External Stickers",
-
-    "kick_members": "Kick Members",
-    "manage_channels": "Manage Channels",
-    
-    "manage_emojis": "Manage Emojis",
-    "manage_emojis_and_stickers": "Manage Emojis And Stickers",
-
-    "manage_events": "Manage Events",
-    "manage_expressions": "Manage Expressions",
-    "manage_guild": "Manage Server",
-    "manage_messages": "Manage Messages",
-    "manage_nicknames": "Manage Nicknames",
-
-    "manage_permissions": "Manage Permissions",
-    "manage_roles": "Manage Roles",
-
-    "manage_threads": "Manage Threads",
-    "manage_webhooks": "Manage Webhooks",
-    "mention_everyone": "Mention Everyone",
-    "moderate_members": "Moderate Members",
-    "move_members": "Move Members",
-    "mute_members": "Mute Members",
-    "priority_speaker": "Priority Speaker",
-    "read_message_history": "Read Message History",
-    "read_messages": "Read Messages",
-    "request_to_speak": "Request To Speak",
-    "send_messages": "Send Messages",
-    "send_messages_in_threads": "Send Messages In Threads",
-    "send_tts_messages": "Send TTS Messages",
-    "send_voice_messages": "Send Voice Messages",
-    "speak": "Speak",
-    "stream": "Stream",
-    "use_application_commands": "Use Application Commands",
-    "use_embedded_activities": "Use Embedded Activities",
-
-    "use_external_emojis": "Use External Emojis",
-    "use_external_stickers": "Use External Stickers",
-
-    "use_external_sounds": "Use External Sounds",
-    "use_soundboard": "Use Soundboard",
-    
-    "use_voice_activation": "Use Voice Activity",
-
-    # 2.4+ only
-    "use_external_apps": "Use External Apps",
-
-    "view_audit_log": "View Audit Log",
-    "view_channel": "View Channel",
-    "view_guild_insights": "View Server Insights",
-}
+_tables_lock = threading.RLock()
+_table_blobs: Optional[Dict[str, bytes]] = None
 
-permission_descriptions: Annotated[Dict[str, str],
-"A list of all permissions in the Discord API. Dictionary goes in Alphabetical order in the form `api_name`: `description`."
-] = {
-    "add_reactions": "Allows members to add new emoji reactions to a message. If this permission is disabled, members can still react using any existing reactions on a message.",
-    "administrator": "Members with this permission will have every permission and will also bypass all channel specific permissions or restrictions (for example, these members would get access to all private channels. **This is a dangerous permission to grant**.",
-    "attach_files": "Allows members to upload files or media in text channels.",
-    "ban_members": "Allows members to permanently ban and delete the message history of other members from this server.",
-    "change_nickname": "Allows members to change their own nickname, a custom name for just this server.",
-    "connect": "Allows members to join voice channels and hear others.",
-    "create_events": "Allows members to create events.",
-    "create_expressions": "Allows members to add custom emoji, stickers, and sounds in this server.",
-    "create_instant_invite": "Allows members to invite new people to this server.",
-    "create_private_threads": "Allow members to create invite-only threads.",
-    "create_public_threads": "Allow members to create threads that everyone in a channel can view.",
-    "deafen_members": "Allows members to deafen other members in voice channels, which means they won't be able to speak or hear others.",
-    "embed_links": "Allows links that members share to show embedded content in text channels.",
-    "external_emojis": "Allows members to use emoji from other servers, if they're a Discord Nitro member.",
-    "external_stickers": "Allows members to use emoji from other servers, if they're a Discord Nitro member.",
-    "kick_members": "Allows members to remove other members from this server. Kicked members will be able to rejoin if they have another invite.",
-    "manage_channels": "Allows members to create, edit, or delete channels.",
-    "manage_emojis": "Allows members to edit or remove custom emoji, stickers, and sounds in this server.",
-    "manage_emojis_and_stickers": "Allows members to edit or remove custom emoji, stickers, and sounds in this server.",
-    "manage_events": "Allows members to edit and cancel events.",
-    "manage_expressions": "Allows members to edit or remove custom emoji, stickers, and sounds in this server.",
-    "manage_guild": "Allow members to change this server's name, switch regions, view all invites, add apps to this server and create and update AutoMod rules.",
-    "manage_messages": "Allows members to delete messages by other members or pin any message.",
-    "manage_nicknames": "Allows members to change the nicknames of other members.",
-    "manage_permissions": "Members with this permission can change this channel's permissions.",
-    "manage_roles": "Allows members to create new roles and edit or delete roles lower than their highest role. Also allows members to change permissions of individual channels that they have access to.",
-    "manage_threads": "Allows members to rename, delete, close, and turn on slow mode for threads. They can also view private threads.",
-    "manage_webhooks": "Allows members to create, edit, or delete webhooks, which can post messages from other apps or sites into this server.",
-    "mention_everyone": "Allows members to use @everyone (everyone in the server or @here (only online members in that channel. They can also @mention all roles, even if the role's 'Allow anyone to mention this role' permission is disabled.",
-    "moderate_members": "When you put a user in timeout they will not be able to send messages in chat, reply within threads, react to messages, or speak in voice or Stage channels.",
-    "move_members": "Allows members to disconnect or move other members between voice channels that the member with this permission has access to.",
-    "mute_members": "Allows members to mute other members in voice channels for everyone.",
-    "priority_speaker": "Allows members to be more easily heard in voice channels. When activated, the volume of others without this permission will be automatically lowered.",
-    "read_message_history": "Allows members to read previous messages sent in channels. If this permission is disabled, members only see messages sent when they are online and focused on that channel.",
-    "read_messages": "Allows members to view channels and messages in this server.",
-    "request_to_speak": "Allow requests to speak in Stage channels. Stage moderators manually approve or deny each request.",
-    "send_messages": "Allows members to send messages in text channels.",
-    "send_messages_in_threads": "Allow members to send messages in threads.",
-    "send_tts_messages": "Allows members to send text-to-speech messages by starting a message with /tts. These messages can be heard by anyone focused on the channel.",
-    "send_voice_messages": "Allows members to send voice messages.",
-    "speak": "Allows members to talk in voice channels. If this permission is disabled, members are default muted until somebody with the 'Mute Members' permission un-mutes them.",
-    "stream": "Allows members to share their video, screen share, or stream a game in this server.",
-    "use_application_commands": "Members with this permission can use commands from applications, including slash commands and context menu commands.",
-    "use_embedded_activities": "Allows members to use Activities.",
-    "use_external_emojis": "Allows members to use emoji from other servers, if they're a Discord Nitro member.",
-    "use_external_sounds": "Allows members to use sounds from other servers, if they're a Discord Nitro member.",
-    "use_external_stickers": "Allows members to use stickers from other servers, if they're a Discord Nitro member.",
-    "use_soundboard": "Allows members to send sounds from server soundboard.",
-    "use_voice_activation": "Allows members to speak in voice channels by simply talking. If this permission is disabled, members are required to use Push-to-talk. Good for controlling background noise or noisy members.",
-    "view_audit_log": "Allows members to view a record of who made which changes in this server.",
-    "view_channel": "Allows members to view channels by default (excluding private channels.",
-    "view_guild_insights": "Allows members to view Server Insights, which shows data on community growth, engagement, and more. This will allow them to see certain data about channel activity, even for channels they cannot access.",
-}
 
-# https://canary.discord.com/channels/613425648685547541/697138785317814292/1318633773713064049 in Discord Developers discord server
-discord_file_size_change_date = datetime.datetime(2024, 1, 25)
-now = datetime.datetime.now()
+def _tables_from_source() -> Dict[str, Any]:
+    from . import _constants_tables as source
 
-if now < discord_file_size_change_date:
-    DISCORD_FILE_SIZE_LIMIT: Annotated[int, "The maximum file size that can be uploaded to Discord in bytes. (excluding guilds with the feature that increases it)"] = 26_214_400  # 8 MB
-else:
-    DISCORD_FILE_SIZE_LIMIT: Annotated[int, "The maximum file size that can be uploaded to Discord in bytes. (excluding guilds with the feature that increases it)"] = 10_490_000  # 8 MB
+    tables = {name: getattr(source, name) for name in _TABLES if name != "CODEBLOCK_LANGUAGES"}
+    tables["CODEBLOCK_LANGUAGES"] = list(source.CodeblockLanguage.__args__)
+    return tables
 
-# DISCORD_FILE_SIZE_LIMIT: Annotated[int, "The maximum file size that can be uploaded to Discord in bytes. (excluding guilds with the feature that increases it)"] = 8_388_608  # 8 MB
-# 8 MB is the maximum file size that can be uploaded to Discord as of 12-2-2024 unless a guild has the higher upload limit feature
 
-user_flag_descriptions: Annotated[Dict[str, str],
-"A dictionary of all current user flags and their descriptions in the form `flag_name`: `description`."
-] = {
-    'staff': 'Discord Staff',
-    'partner': 'Discord Partner',
-    'hypesquad': 'HypeSquad Events',
-    'bug_hunter': 'Bug Hunter',
-    'hypesquad_bravery': 'HypeSquad Bravery',
-    'hypesquad_brilliance': 'HypeSquad Brilliance',
-    'hypesquad_balance': 'HypeSquad Balance',
-    'early_supporter': 'Early Supporter',
-    'team_user': 'Team User',
-    'system': 'System',
-    'bug_hunter_level_2': 'Bug Hunter Level 2',
-    'verified_bot': 'Verified Bot',
-    'verified_bot_developer': 'Verified Bot Developer',
-    'early_verified_bot_developer': 'Early Verified Bot Developer',
-    'discord_certified_moderator': 'Discord Certified Moderator',
-    'bot_http_interactions': 'HTTP Interactions Bot',
-    'spammer': 'Spammer',
-    'active_developer': 'Active Developer',
-}
+def _write_tables_artifact() -> None:
+    """Compiles _constants_tables.py into the artifact the tables are loaded from."""
+    blobs = {name: marshal.dumps(value) for name, value in _tables_from_source().items()}
+    _TABLES_ARTIFACT.write_bytes(marshal.dumps((_TABLES_VERSION, blobs)))
 
-# for discord user badges
-misc_flag_descriptions: Annotated[Dict[str, str],
-"A dictionary of miscellaneous user flags and their descriptions in the form `flag_name`: `description`."
-] = {
-    'team_user': 'Application Team User',
-    'system': 'System User',
-    'spammer': 'Spammer',
-    'verified_bot': 'Verified Bot',
-    'bot_http_interactions': 'HTTP Interactions Bot',
-}
 
-guild_features = {
-    'ACTIVITY_FEED_DISABLED_BY_USER': 'Activity Feed Disabled By User',
-    'AGE_VERIFICATION_LARGE_GUILD': 'Age Verification Large Guild',
-    'ANIMATED_BANNER': 'Animated Banner',
-    'APPLICATION_COMMAND_PERMISSIONS_V2': 'Application Command Permissions V2',
-    'PARTNERED': 'Partnered',
-    'VERIFIED': 'Verified',
-    'CONSIDERED_EXTERNALLY_DISCOVERABLE': 'Considered Externally Discoverable',
-    'CREATOR_MONETIZABLE_PROVISIONAL': 'Creator Monetizable Provisional',
-    'CREATOR_STORE_PAGE': 'Creator Store Page',
-    'DEVELOPER_SUPPORT_SERVER': 'Developer Support Server',
-    'DISCOVERABLE': 'Server Discovery',
-    'ENABLED_DISCOVERABLE_BEFORE': 'Enabled Discoverable Before',
-    'AUTO_MODERATION': 'Auto Moderation',
-    'AUTOMOD_TRIGGER_USER_PROFILE': 'AutoMod Trigger User Profile',
-    'AUDIO_BITRATE_128_KBPS': 'Audio Bitrate 128 kbps',
-    'AUDIO_BITRATE_256_KBPS': 'Audio Bitrate 256 kbps',
-    'AUDIO_BITRATE_384_KBPS': 'Audio Bitrate 384 kbps',
-    'BYPASS_SLOWMODE_PERMISSION_MIGRATION_COMPLETE': 'Bypass Slowmode Permission Migration Complete',
-    'CHANNEL_ICON_EMOJIS_GENERATED': 'Channel Icon Emojis Generated',
-    'COMMUNITY_EXP_LARGE_GATED': 'Community EXP Large Gated',
-    'COMMUNITY': 'Community Server',
-    'ENHANCED_ROLE_COLORS': 'Enhanced Role Colors',
-    'FEATURABLE': 'Featured',
-    'GUILD_ONBOARDING': 'Guild Onboarding',
-    'GUILD_ONBOARDING_EVER_ENABLED': 'Guild Onboarding Ever Enabled',
-    'GUILD_ONBOARDING_HAS_PROMPTS': 'Guild Onboarding Has Prompts',
-    'GUILD_TAGS': 'Guild Tags',
-    'GUILD_TAGS_BADGE_PACK_FLEX': 'Guild Tags Badge Pack Flex',
-    'GUILD_TAGS_BADGE_PACK_PETS': 'Guild Tags Badge Pack Pets',
-    'GUILD_WEB_PAGE_VANITY_URL': 'Guild Web Page Vanity URL',
-    'MAX_FILE_SIZE_50_MB': 'Max File Size 50 MB',
-    'MAX_FILE_SIZE_100_MB': 'Max File Size 100 MB',
-    'MEMBER_VERIFICATION_GATE_ENABLED': 'Member Verification Gate Enabled',
-    'MORE_SOUNDBOARD': 'More Soundboard',
-    'MORE_STICKERS': 'More Stickers',
-    'NEW_THREAD_PERMISSIONS': 'New Thread Permissions',
-    'PIN_PERMISSION_MIGRATION_COMPLETE': 'Pin Permission Migration Complete',
-    'PREVIEW_ENABLED': 'Preview Enabled',
-    'INVITES_DISABLED': 'Invites Disabled',
-    'RAID_ALERTS_DISABLED': 'Raid Alerts Disabled',
-    'ROLE_ICONS': 'Role Icons',
-    'ROLE_SUBSCRIPTIONS_AVAILABLE_FOR_PURCHASE': 'Role Subscriptions Available For Purchase',
-    'ROLE_SUBSCRIPTIONS_ENABLED': 'Role Subscriptions Enabled',
-    'SOUNDBOARD': 'Soundboard',
-    'STAGE_CHANNEL_VIEWERS_50': 'Stage Channel Viewers 50',
-    'STAGE_CHANNEL_VIEWERS_150': 'Stage Channel Viewers 150',
-    'STAGE_CHANNEL_VIEWERS_300': 'Stage Channel Viewers 300',
-    'TICKETED_EVENTS_ENABLED': 'Ticketed Events Enabled',
-    'TEXT_IN_VOICE_ENABLED': 'Text In Voice Enabled',
-    'THREADS_ENABLED': 'Threads Enabled',
-    'TIERLESS_BOOSTING': 'Tierless Boosting',
-    'TIERLESS_BOOSTING_SYSTEM_MESSAGE': 'Tierless Boosting System Message',
-    'VIDEO_BITRATE_ENHANCED': 'Video Bitrate Enhanced',
-    'VIDEO_QUALITY_720_60FPS': 'Video Quality 720p 60fps',
-    'VIDEO_QUALITY_1080_60FPS': 'Video Quality 1080p 60fps',
-    'WELCOME_SCREEN_ENABLED': 'Welcome Screen',
-    'GUESTS_ENABLED': 'Guests Enabled',
-    'INVITE_SPLASH': 'Invite Splash',
-    'VIP_REGIONS': 'VIP Voice Servers',
-    'VANITY_URL': 'Vanity Invite',
-    'COMMERCE': 'Commerce',
-    'LURKABLE': 'Lurkable',
-    'NEWS': 'News Channels',
-    'ANIMATED_ICON': 'Animated Icon',
-    'BANNER': 'Banner',
-}
+def _load_table(name: str) -> Any:
+    global _table_blobs
+    blobs = _table_blobs
+    if blobs is None:
+        try:
+            version, blobs = marshal.loads(_TABLES_ARTIFACT.read_bytes())
+            current = version == _TABLES_VERSION
+        except (OSError, EOFError, ValueError, TypeError):
+            current = False
+        if not current or blobs is None:
+            # the artifact is missing or wasn't regenerated after the tables were edited
+            _log.debug("%s is missing or outdated, building the constants tables from %s", _TABLES_ARTIFACT, _TABLES_SOURCE)
+            blobs = {name: marshal.dumps(value) for name, value in _tables_from_source().items()}
+        _table_blobs = blobs
+    return marshal.loads(blobs.pop(name))
+
+
+def _build_emojidict() -> emojidictionary:
+    emojidict = emojidictionary(constant_factory("\U00002753"), _load_table("emojidict"))
+    try:
+        from .custom_constants import emojidict as new_emojidict # type: ignore
+
+        for k, v in new_emojidict.items():
+            emojidict[k] = v
+    except ImportError:
+        pass
+    return emojidict
+
+
+def _build_frozen_table(name: str) -> Mapping[Any, str]:
+    return MappingProxyType(_load_table(name))
 
-http_codes = {
-    100: "Continue",
-    101: "Switching Protocols",
-    102: "Processing",
-    103: "Early Hints",
-    200: "OK",
-    201: "Created",
-    202: "Accepted",
-    203: "Non-Authoritative Information",
-    204: "No Content",
-    205: "Reset Content",
-    206: "Partial Content",
-    207: "Multi-Status",
-    208: "Already Reported",
-    218: "This is fine",  # apache servers... https://en.wikipedia.org/wiki/List_of_HTTP_status_codes#Unofficial_codes
-    226: "IM Used",
-    300: "Multiple Choices",
-    301: "Moved Permanently",
-    302: "Found",
-    303: "See Other",
-    304: "Not Modified",
-    305: "Use Proxy",  # depricated
-    306: "Unused",  # depricated
-    307: "Temporary Redirect",
-    308: "Permanent Redirect",
-    400: "Bad Request",
-    401: "Unauthorized",
-    402: "Payment Required",
-    403: "Forbidden",
-    404: "Not Found",
-    405: "Method Not Allowed",
-    406: "Not Acceptable",
-    407: "Proxy Authentication Required",
-    408: "Request Timeout",
-    409: "Conflict",
-    410: "Gone",
-    411: "Length Required",
-    412: "Precondition Failed",
-    413: "Payload Too Large",
-    414: "URI Too Long",
-    415: "Unsupported Media Type",
-    416: "Range Not Satisfiable",
-    417: "Expectation Failed",
-    418: "I'm a teapot",  # this is real btw
-    420: "Enhance Your Calm",  # unofficial twitter response code??? https://en.wikipedia.org/wiki/List_of_HTTP_status_codes#Unofficial_codes
-    421: "Misdirected Request",
-    422: "Unprocessable Content",
-    423: "Locked",
-    424: "Failed Dependency",
-    425: "Too Early",
-    426: "Upgrade Required",
-    428: "Precondition Required",
-    429: "Too Many Requests",
-    430: "Shopify Security Rejection",  # unofficial shopify servers... https://en.wikipedia.org/wiki/List_of_HTTP_status_codes#Unofficial_codes
-    431: "Request Header Fields Too Large",
-    444: "No Response",  # unofficial nginx  https://en.wikipedia.org/wiki/List_of_HTTP_status_codes#Unofficial_codes
-    449: "Retry With",  # unofficial
-    450: "Blocked by Windows Parental Controls",  # bro what https://en.wikipedia.org/wiki/List_of_HTTP_status_codes#Unofficial_codes
-    451: "Unavailable For Legal Reasons",
-    500: "Internal Server Error",
-    501: "Not Implemented",
-    502: "Bad Gateway",
-    503: "Service Unavailable",
-    504: "Gateway Timeout",
-    505: "HTTP Version Not Supported",
-    506: "Variant Also Negotiates",
-    507: "Insufficient Storage",
-    508: "Loop Detected",
-    510: "Not Extended",
-    511: "Network Authentication Required",
-    520: "Web Server Returned an Unknown Error",  # unoffical code cloudflare
-    521: "Web Server is Down",  # unoffical code cloudflare
-    522: "Connection Timed Out",  # unoffical code cloudflare
-    523: "Origin is Unreachable",  # unoffical code cloudflare
-    524: "A Timeout Occurred",  # unoffical code cloudflare
-    525: "SSL Handshake Failed",  # unoffical code cloudflare
-    526: "Invalid SSL Certificate",  # unoffical code cloudflare
-    527: "Railgun Error",  # unoffical code cloudflare
-    530: "Site is Frozen",  # unoffical code cloudflare
-    598: "Network Read Timeout Error",  # unoffical code
-    599: "Network Connect Timeout Error",  # unoffical code
+
+_LAZY_CONSTANTS: Dict[str, Callable[[], Any]] = {
+    "emojidict": _build_emojidict,
+    "LOADING_EMOJI": lambda: _materialize("emojidict").get("thinking", "\U0001f4bb"),
+    "permission_proper_names": functools.partial(_build_frozen_table, "permission_proper_names"),
+    "permission_descriptions": functools.partial(_build_frozen_table, "permission_descriptions"),
+    "user_flag_descriptions": functools.partial(_build_frozen_table, "user_flag_descriptions"),
+    "misc_flag_descriptions": functools.partial(_build_frozen_table, "misc_flag_descriptions"),
+    "guild_features": functools.partial(_build_frozen_table, "guild_features"),
+    "http_codes": functools.partial(_build_frozen_table, "http_codes"),
+    "CODEBLOCK_LANGUAGES": functools.partial(_load_table, "CODEBLOCK_LANGUAGES"),
+    "CodeblockLanguage": lambda: Literal[tuple(_materialize("CODEBLOCK_LANGUAGES"))],
 }
 
 
-CodeblockLanguage = Literal[
-    "1c",
-    "4d",
-    "abnf",
-    "accesslog",
-    "ada",
-    "arduino",
-    "ino",
-    "armasm",
-    "arm",
-    "avrasm",
-    "actionscript",
-    "as",
-    "alan",
-    "ansi",
-    "i",
-    "log",
-    "ln",
-    "angelscript",
-    "asc",
-    "apache",
-    "apacheconf",
-    "applescript",
-    "osascript",
-    "arcade",
-    "asciidoc",
-    "adoc",
-    "aspectj",
-    "autohotkey",
-    "autoit",
-    "awk",
-    "mawk",
-    "nawk",
-    "gawk",
-    "bash",
-    "sh",
-    "zsh",
-    "basic",
-    "bbcode",
-    "blade",
-    "bnf",
-    "brainfuck",
-    "bf",
-    "csharp",
-    "cs",
-    "c",
-    "h",
-    "cpp",
-    "hpp",
-    "cc",
-    "hh",
-    "c++",
-    "h++",
-    "cxx",
-    "hxx",
-    "cal",
-    "cos",
-    "cls",
-    "cmake",
-    "cmake.in",
-    "coq",
-    "csp",
-    "css",
-    "csv",
-    "capnproto",
-    "capnp",
-    "chaos",
-    "kaos",
-    "chapel",
-    "chpl",
-    "cisco",
-    "clojure",
-    "clj",
-    "coffeescript",
-    "coffee",
-    "cson",
-    "iced",
-    "cpc",
-    "crmsh",
-    "crm",
-    "pcmk",
-    "crystal",
-    "cr",
-    "cypher",
-    "d",
-    "dns",
-    "zone",
-    "bind",
-    "dos",
-    "bat",
-    "cmd",
-    "dart",
-    "delphi",
-    "dpr",
-    "dfm",
-    "pas",
-    "pascal",
-    "freepascal",
-    "lazarus",
-    "lpr",
-    "lfm",
-    "diff",
-    "patch",
-    "django",
-    "jinja",
-    "dockerfile",
-    "docker",
-    "dsconfig",
-    "dts",
-    "dust",
-    "dst",
-    "dylan",
-    "ebnf",
-    "elixir",
-    "ex",
-    "elm",
-    "erlang",
-    "erl",
-    "extempore",
-    "xtlang",
-    "xtm",
-    "fsharp",
-    "fs",
-    "fix",
-    "fortran",
-    "f90",
-    "f95",
-    "gcode",
-    "nc",
-    "gams",
-    "gms",
-    "gauss",
-    "gss",
-    "godot",
-    "gdscript",
-    "gherkin",
-    "gn",
-    "gni",
-    "go",
-    "golang",
-    "gf",
-    "golo",
-    "gololang",
-    "gradle",
-    "groovy",
-    "xml",
-    "html",
-    "xhtml",
-    "rss",
-    "atom",
-    "xjb",
-    "xsd",
-    "xsl",
-    "plist",
-    "svg",
-    "http",
-    "https",
-    "haml",
-    "handlebars",
-    "hbs",
-    "html.hbs",
-    "html.handlebars",
-    "haskell",
-    "hs",
-    "haxe",
-    "hx",
-    "hy",
-    "hylang",
-    "ini",
-    "toml",
-    "inform7",
-    "i7",
-    "irpf90",
-    "json",
-    "java",
-    "jsp",
-    "javascript",
-    "js",
-    "jsx",
-    "jolie",
-    "iol",
-    "ol",
-    "julia",
-    "julia-repl",
-    "kotlin",
-    "kt",
-    "tex",
-    "leaf",
-    "lean",
-    "lasso",
-    "ls",
-    "lassoscript",
-    "less",
-    "ldif",
-    "lisp",
-    "livecodeserver",
-    "livescript",
-    "lock",
-    "ls",
-    "lua",
-    "makefile",
-    "mk",
-    "mak",
-    "make",
-    "markdown",
-    "md",
-    "mkdown",
-    "mkd",
-    "mathematica",
-    "mma",
-    "wl",
-    "matlab",
-    "maxima",
-    "mel",
-    "mercury",
-    "mirc",
-    "mrc",
-    "mizar",
-    "mojolicious",
-    "monkey",
-    "moonscript",
-    "moon",
-    "n1ql",
-    "nsis",
-    "never",
-    "nginx",
-    "nginxconf",
-    "nim",
-    "nimrod",
-    "nix",
-    "ocl",
-    "ocaml",
-    "ml",
-    "objectivec",
-    "mm",
-    "objc",
-    "obj-c",
-    "obj-c++",
-    "objective-c++",
-    "glsl",
-    "openscad",
-    "scad",
-    "ruleslanguage",
-    "oxygene",
-    "pf",
-    "pf.conf",
-    "php",
-    "php3",
-    "php4",
-    "php5",
-    "php6",
-    "php7",
-    "parser3",
-    "perl",
-    "pl",
-    "pm",
-    "plaintext",
-    "txt",
-    "text",
-    "pony",
-    "pgsql",
-    "postgres",
-    "postgresql",
-    "powershell",
-    "ps",
-    "ps1",
-    "processing",
-    "prolog",
-    "properties",
-    "protobuf",
-    "puppet",
-    "pp",
-    "python",
-    "py",
-    "gyp",
-    "profile",
-    "python-repl",
-    "pycon",
-    "k",
-    "kdb",
-    "qml",
-    "r",
-    "cshtml",
-    "razor",
-    "razor-cshtml",
-    "reasonml",
-    "re",
-    "redbol",
-    "rebol",
-    "red",
-    "red-system",
-    "rib",
-    "rsl",
-    "graph",
-    "instances",
-    "robot",
-    "rf",
-    "rpm-specfile",
-    "rpm",
-    "spec",
-    "rpm-spec",
-    "specfile",
-    "ruby",
-    "rb",
-    "gemspec",
-    "podspec",
-    "thor",
-    "irb",
-    "rust",
-    "rs",
-    "SAS",
-    "sas",
-    "scss",
-    "sql",
-    "p21",
-    "step",
-    "stp",
-    "scala",
-    "scheme",
-    "scilab",
-    "sci",
-    "shexc",
-    "shell",
-    "console",
-    "smali",
-    "smalltalk",
-    "st",
-    "sml",
-    "ml",
-    "solidity",
-    "sol",
-    "stan",
-    "stanfuncs",
-    "stata",
-    "iecst",
-    "scl",
-    "structured-text",
-    "stylus",
-    "styl",
-    "subunit",
-    "supercollider",
-    "sc",
-    "svelte",
-    "swift",
-    "tcl",
-    "tk",
-    "terraform",
-    "tf",
-    "hcl",
-    "tap",
-    "thrift",
-    "tp",
-    "tsql",
-    "twig",
-    "craftcms",
-    "typescript",
-    "ts",
-    "tsx",
-    "unicorn-rails-log",
-    "vbnet",
-    "vb",
-    "vba",
-    "vbscript",
-    "vbs",
-    "vhdl",
-    "vala",
-    "verilog",
-    "v",
-    "vim",
-    "axapta",
-    "x++",
-    "x86asm",
-    "xl",
-    "tao",
-    "xquery",
-    "xpath",
-    "xq",
-    "yml",
-    "yaml",
-    "zephir",
-    "zep",
-]
+def _materialize(name: str) -> Any:
+    namespace = globals()
+    # loaded tables are only ever added, so they can be read without the lock
+    try:
+        return namespace[name]
+    except KeyError:
+        pass
+
+    with _tables_lock:
+        if name not in namespace:
+            namespace[name] = _LAZY_CONSTANTS[name]()
+        return namespace[name]
+
 
-# only way to get a list of all the codeblock langs and create a type for it
-# is to use this hacky method -_-
-CODEBLOCK_LANGUAGES: List[Union[str, app_commands.locale_str]] = list(CodeblockLanguage.__args__)
+if TYPE_CHECKING:
+    from discord import app_commands
+
+    from ._constants_tables import CodeblockLanguage as CodeblockLanguage
+
+    emojidict: Annotated[emojidictionary[Any, str], "A dictionary that maps strings to emojis in the form `name`: `emoji_str`."]
+    LOADING_EMOJI: Annotated[str, "The default emoji the bot uses when it is 'thinking'."]
+    permission_proper_names: Mapping[str, str]
+    permission_descriptions: Mapping[str, str]
+    user_flag_descriptions: Mapping[str, str]
+    misc_flag_descriptions: Mapping[str, str]
+    guild_features: Mapping[str, str]
+    http_codes: Mapping[int, str]
+    CODEBLOCK_LANGUAGES: List[Union[str, app_commands.locale_str]]
+
+# https://canary.discord.com/channels/613425648685547541/697138785317814292/1318633773713064049 in Discord Developers discord server
+# the limit went down on 2024-01-25, it used to be 26_214_400 (25 MB)
+DISCORD_FILE_SIZE_LIMIT: Annotated[int, "The maximum file size that can be uploaded to Discord in bytes. (excluding guilds with the feature that increases it)"] = 10_490_000  # 10 MB
+
+# DISCORD_FILE_SIZE_LIMIT: Annotated[int, "The maximum file size that can be uploaded to Discord in bytes. (excluding guilds with the feature that increases it)"] = 8_388_608  # 8 MB
+# 8 MB is the maximum file size that can be uploaded to Discord as of 12-2-2024 unless a guild has the higher upload limit feature
 
 class HTTPCode:
     status: int
 
     def __init__(self, status: int):
         self.status = status
-        assert status in http_codes.keys(), f"Invalid HTTP status code {status}"
+        assert status in _materialize("http_codes"), f"Invalid HTTP status code {status}"
 
     @property
     def name(self) -> str:
-        return http_codes.get(self.status, "Unknown")
+        return _materialize("http_codes").get(self.status, "Unknown")
 
     @property
     def is_1xx(self) -> bool:
@@ -3015,14 +251,21 @@ formatter = logging.Formatter(
     "[{asctime}] [{levelname:<8}] {name}: {message}", dt_fmt, style="{"
 )
 
-if os.path.exists("apikeys.yml"):
-    with open("apikeys.yml", "r") as f:
-        config = dict(yaml.safe_load(f))
-        BLOXLINK_API_KEY = config.get("bloxlink_api", None)
-        ROVER_API_KEY = config.get("rover_api", None)
-else:
-    BLOXLINK_API_KEY = None
-    ROVER_API_KEY = None
+
+def __getattr__(name: str):
+    if name in _LAZY_CONSTANTS:
+        return _materialize(name)
+    # the API keys used to be read from apikeys.yml when this module was imported, they now come from the settings
+    if name == "BLOXLINK_API_KEY":
+        return get_settings().bloxlink_api_key
+    if name == "ROVER_API_KEY":
+        return get_settings().rover_api_key
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_CONSTANTS})
+
 
 class Snowflake:
     __value: int
@@ -9,29 +9,52 @@ Taken from https://github.com/Rapptz/RoboDanny/blob/rewrite/cogs/utils/cache.py
 """
 
 import asyncio
+import bisect
 import enum
 from functools import wraps
+import heapq
+import itertools
+import logging
 import time
-from typing import Any, Callable, Coroutine, MutableMapping, Protocol, TypeVar
+from typing import Any, Callable, Container, Coroutine, Hashable, Iterable, MutableMapping, Optional, Protocol, TypeVar
 
 from lru import LRU
 
+from .cache_backends import CacheBackend
+
+# fmt: off
+__all__ = (
+    'CacheProtocol',
+    'ExpiringCache',
+    'Strategy',
+    'cache',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
 R = TypeVar('R')
 
 # Can't use ParamSpec due to https://github.com/python/typing/discussions/946
 class CacheProtocol(Protocol[R]):
-    cache: MutableMapping[str, asyncio.Task[R]]
+    cache: MutableMapping[Hashable, asyncio.Task[R]]
 
     def __call__(self, *args: Any, **kwds: Any) -> asyncio.Task[R]:
         ...
 
-    def get_key(self, *args: Any, **kwargs: Any) -> str:
+    def get_key(self, *args: Any, **kwargs: Any) -> Hashable:
         ...
 
     def invalidate(self, *args: Any, **kwargs: Any) -> bool:
         ...
 
-    def invalidate_containing(self, key: str) -> None:
+    def invalidate_containing(self, key: Hashable) -> None:
+        ...
+
+    def invalidate_arg(self, value: Any) -> int:
+        ...
+
+    def invalidate_tag(self, tag: Hashable) -> int:
         ...
 
     def get_stats(self) -> tuple[int, int]:
@@ -39,34 +62,83 @@ class CacheProtocol(Protocol[R]):
 
 
 class ExpiringCache(dict):
-    def __init__(self, seconds: float):
+    """A dict whose entries expire `seconds` after being set.
+
+    Expiry times are kept in a min-heap, so lookups are O(1) and expired entries are dropped from the
+    head of the heap as they come due. If `maxsize` is given, the entries closest to expiring are evicted
+    to stay within it.
+    """
+
+    def __init__(self, seconds: float, maxsize: Optional[int] = None):
         self.__ttl: float = seconds
+        self.__maxsize: Optional[int] = maxsize
+        # (set at, insertion number, key), entries whose key was deleted or set again since are skipped when popped.
+        # The insertion number breaks ties between equal timestamps, so keys never have to be ordered.
+        self.__heap: list[tuple[float, int, Hashable]] = []
+        self.__counter = itertools.count()
         super().__init__()
 
+    def __is_current(self, key: Hashable, n: int) -> bool:
+        entry = super().get(key)
+        return entry is not None and entry[2] == n
+
+    def __pop_heap(self) -> None:
+        _, _, key = heapq.heappop(self.__heap)
+        super().pop(key, None)
+
     def __verify_cache_integrity(self):
-        # Have to do this in two steps...
-        current_time = time.monotonic()
-        to_remove = [k for (k, (v, t)) in super().items() if current_time > (t + self.__ttl)]
-        for k in to_remove:
-            del self[k]
+        heap = self.__heap
+        expired_before = time.monotonic() - self.__ttl
+        while heap and heap[0][0] < expired_before:
+            _, n, key = heap[0]
+            if self.__is_current(key, n):
+                self.__pop_heap()
+            else:
+                heapq.heappop(heap)
 
-    def __contains__(self, key: str):
+    def __contains__(self, key: Hashable):
         self.__verify_cache_integrity()
         return super().__contains__(key)
 
-    def __getitem__(self, key: str):
+    def __getitem__(self, key: Hashable):
         self.__verify_cache_integrity()
-        v, _ = super().__getitem__(key)
-        return v
+        return super().__getitem__(key)[0]
 
-    def get(self, key: str, default: Any = None):
+    def get(self, key: Hashable, default: Any = None):
+        self.__verify_cache_integrity()
         v = super().get(key, default)
         if v is default:
             return default
         return v[0]
 
-    def __setitem__(self, key: str, value: Any):
-        super().__setitem__(key, (value, time.monotonic()))
+    def __setitem__(self, key: Hashable, value: Any):
+        self.__verify_cache_integrity()
+        t = time.monotonic()
+        n = next(self.__counter)
+        super().__setitem__(key, (value, t, n))
+        heapq.heappush(self.__heap, (t, n, key))
+
+        if self.__maxsize is not None:
+            heap = self.__heap
+            while len(self) > self.__maxsize:
+                _, n, key = heap[0]
+                if self.__is_current(key, n):
+                    self.__pop_heap()
+                else:
+                    heapq.heappop(heap)
+
+        # entries that were deleted or set again pile up in the heap, rebuild it once they outnumber the live ones
+        if len(self.__heap) > 2 * len(self) + 64:
+            self.__heap = [(t, n, k) for k, (_, t, n) in super().items()]
+            heapq.heapify(self.__heap)
+
+    def age(self, key: Hashable) -> float:
+        """Returns how long ago (in seconds) `key` was set, raises :exc:`KeyError` if it is missing."""
+        return time.monotonic() - super().__getitem__(key)[1]
+
+    def clear(self):
+        super().clear()
+        self.__heap.clear()
 
     def values(self):
         return map(lambda x: x[0], super().values())
@@ -75,88 +147,434 @@ class ExpiringCache(dict):
         return map(lambda x: (x[0], x[1][0]), super().items())
 
 
+class _KeyIndex:
+    """Maps tokens (arguments, their reprs and tags) to the cache keys they appear in.
+
+    The reprs are also kept sorted, so the keys with an argument whose repr starts with a prefix
+    are found in O(log n) plus the number of matches.
+    """
+
+    def __init__(self):
+        self._keys: dict[Hashable, set[Hashable]] = {}
+        self._tokens: dict[Hashable, tuple[Hashable, ...]] = {}
+        self._reprs: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def add(self, key: Hashable, tokens: Iterable[Hashable]) -> None:
+        self.discard(key)
+        tokens = tuple(tokens)
+        self._tokens[key] = tokens
+        for token in tokens:
+            keys = self._keys.get(token)
+            if keys is None:
+                keys = self._keys[token] = set()
+                if isinstance(token, _Repr):
+                    bisect.insort(self._reprs, token[0])
+            keys.add(key)
+
+    def discard(self, key: Hashable) -> None:
+        for token in self._tokens.pop(key, ()):
+            keys = self._keys.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys[token]
+                    if isinstance(token, _Repr):
+                        del self._reprs[bisect.bisect_left(self._reprs, token[0])]
+
+    def __contains__(self, token: Hashable) -> bool:
+        return token in self._keys
+
+    def pop(self, token: Hashable) -> list[Hashable]:
+        """Removes and returns the keys `token` appears in."""
+        try:
+            keys = list(self._keys.get(token, ()))
+        except TypeError:
+            # unhashable, it can't be an argument of any entry
+            return []
+        for key in keys:
+            self.discard(key)
+        return keys
+
+    def pop_prefix(self, prefix: str) -> list[Hashable]:
+        """Removes and returns the keys with an argument whose repr starts with `prefix`."""
+        reprs = self._reprs
+        start = end = bisect.bisect_left(reprs, prefix)
+        while end < len(reprs) and reprs[end].startswith(prefix):
+            end += 1
+        keys = {key for text in reprs[start:end] for key in self._keys[_Repr((text,))]}
+        for key in keys:
+            self.discard(key)
+        return list(keys)
+
+    def prune(self, cache: Container[Any]) -> None:
+        """Forgets the keys that were evicted from `cache`."""
+        for key in [key for key in self._tokens if key not in cache]:
+            self.discard(key)
+
+
+class _Tag(tuple):
+    """Wraps tags so they can't collide with arguments in a :class:`_KeyIndex`."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f'<tag {self[0]!r}>'
+
+
+class _Repr(tuple):
+    """Wraps the repr of an argument so it can't collide with string arguments in a :class:`_KeyIndex`."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f'<repr {self[0]}>'
+
+
 class Strategy(enum.Enum):
     lru = 1
     raw = 2
     timed = 3
 
 
+def _true_repr(o: Any) -> str:
+    # we do care what 'self' parameter is when we __repr__ it
+    if o.__class__.__repr__ is object.__repr__:
+        return f'<{o.__class__.__module__}.{o.__class__.__name__}>'
+    return repr(o)
+
+
+def _hashable(value: Any) -> Any:
+    # invalidations sent through a JSON backend come back with lists instead of tuples
+    if isinstance(value, list):
+        return tuple(map(_hashable, value))
+    return value
+
+
+# note: this only really works for this use case in particular
+# I want to pass asyncpg.Connection objects to the parameters
+# however, they use default __repr__ and I do not care what
+# connection is passed in, so I needed a bypass.
+_IGNORED_KWARGS = frozenset(('connection', 'pool'))
+
+
+class _KwargsMark:
+    """Separates positional from keyword arguments in tuple keys."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return '<kwargs>'
+
+    def __reduce__(self) -> str:
+        return '_KWARGS_MARK'
+
+
+_KWARGS_MARK = _KwargsMark()
+
+
 def cache(
     maxsize: int = 128,
     strategy: Strategy = Strategy.lru,
     ignore_kwargs: bool = False,
+    ttl: Optional[float] = None,
+    tags: Optional[Callable[..., Iterable[Hashable]]] = None,
+    key: Optional[Callable[..., Hashable]] = None,
+    hashable_keys: bool = False,
+    refresh_ahead: Optional[float] = None,
+    backend: Optional[CacheBackend] = None,
+    backend_ttl: Optional[float] = None,
 ) -> Callable[[Callable[..., Coroutine[Any, Any, R]]], CacheProtocol[R]]:
+    """Caches the tasks of a coroutine function, keyed by its arguments.
+
+    By default the keys are strings made of the repr of each argument. With `hashable_keys`, they are
+    tuples of the arguments themselves, which is much cheaper but compares arguments by equality
+    (so ex. two instances of a class with the default repr are different keys). Calls with unhashable
+    arguments fall back to string keys. `key` replaces both, it is called with the function's arguments
+    and returns the key.
+
+    With :attr:`Strategy.timed`, entries expire after `ttl` seconds and `maxsize` bounds the number of entries.
+    If `ttl` isn't given, `maxsize` is used as the TTL instead and the cache is unbounded (the historical behaviour).
+    With `refresh_ahead`, a hit on an entry that expires in less than `refresh_ahead` seconds still returns it
+    but calls the function again in the background, replacing the entry once (and if) that call succeeds.
+
+    Tasks that raise or are cancelled are evicted as soon as they finish, so the next call retries.
+
+    `tags` is called with the function's arguments and returns the tags of the entry, which can then be
+    invalidated together with ``invalidate_tag(tag)``. Entries are also indexed by each (hashable) argument,
+    so ``invalidate_arg(guild_id)`` only touches the entries called with it. ``invalidate_containing(value)``
+    drops those too and, with string keys, the entries with an argument whose repr starts with `value`
+    (ex. ``invalidate_containing(repr(guild_id))``). Both cost time proportional to the matching entries.
+
+    `backend` shares results between processes (see :mod:`cache_backends`): in-process misses are looked up in
+    it before calling the function, results are written to it for `backend_ttl` seconds (defaults to the TTL of
+    the timed strategy, forever otherwise) and invalidations are broadcast to the other processes. Keys are
+    always strings with a backend.
+    """
+    key_func = key
+
     def decorator(func: Callable[..., Coroutine[Any, Any, R]]) -> CacheProtocol[R]:
+        # hits, misses
+        _counters = [0, 0]
+        _stats = lambda: (_counters[0], _counters[1])
+        _refresh_at: Optional[float] = None
+
+        if refresh_ahead is not None and strategy is not Strategy.timed:
+            raise ValueError('refresh_ahead is only supported with Strategy.timed')
+
         if strategy is Strategy.lru:
             _internal_cache = LRU(maxsize)
             _stats = _internal_cache.get_stats
         elif strategy is Strategy.raw:
             _internal_cache = {}
-            _stats = lambda: (0, 0)
         elif strategy is Strategy.timed:
-            _internal_cache = ExpiringCache(maxsize)
-            _stats = lambda: (0, 0)
-
-        def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
-            # this is a bit of a cluster fuck
-            # we do care what 'self' parameter is when we __repr__ it
-            def _true_repr(o):
-                if o.__class__.__repr__ is object.__repr__:
-                    return f'<{o.__class__.__module__}.{o.__class__.__name__}>'
-                return repr(o)
-
-            key = [f'{func.__module__}.{func.__name__}']
-            key.extend(_true_repr(o) for o in args)
-            if not ignore_kwargs:
-                for k, v in kwargs.items():
-                    # note: this only really works for this use case in particular
-                    # I want to pass asyncpg.Connection objects to the parameters
-                    # however, they use default __repr__ and I do not care what
-                    # connection is passed in, so I needed a bypass.
-                    if k == 'connection' or k == 'pool':
-                        continue
-
-                    key.append(_true_repr(k))
-                    key.append(_true_repr(v))
+            if ttl is None:
+                _internal_cache = ExpiringCache(maxsize)
+            else:
+                _internal_cache = ExpiringCache(ttl, maxsize)
+            if refresh_ahead is not None:
+                _refresh_at = (maxsize if ttl is None else ttl) - refresh_ahead
+
+        _refreshing: dict[Hashable, asyncio.Task[R]] = {}
+
+        _index = _KeyIndex()
+        _prefix = f'{func.__module__}.{func.__name__}'
+        _string_tokens = key_func is None and not hashable_keys
+
+        def _make_str_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+            if not kwargs or ignore_kwargs:
+                return ':'.join((_prefix, *map(_true_repr, args)))
+
+            key = [_prefix, *map(_true_repr, args)]
+            for k, v in kwargs.items():
+                if k in _IGNORED_KWARGS:
+                    continue
+
+                key.append(_true_repr(k))
+                key.append(_true_repr(v))
 
             return ':'.join(key)
 
+        def _make_tuple_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+            if not kwargs or ignore_kwargs:
+                key = args
+            elif _IGNORED_KWARGS.isdisjoint(kwargs):
+                key = (*args, _KWARGS_MARK, *kwargs.items())
+            else:
+                key = (*args, _KWARGS_MARK, *((k, v) for k, v in kwargs.items() if k not in _IGNORED_KWARGS))
+
+            try:
+                hash(key)
+            except TypeError:
+                return _make_str_key(args, kwargs)
+            return key
+
+        _make_key: Callable[[tuple[Any, ...], dict[str, Any]], Hashable]
+        if key_func is not None:
+            _custom_key = key_func
+            _make_key = lambda args, kwargs: _custom_key(*args, **kwargs)
+        elif hashable_keys:
+            _make_key = _make_tuple_key
+        else:
+            _make_key = _make_str_key
+
+        def _tokens(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Iterable[Hashable]:
+            values = args if ignore_kwargs else (*args, *(v for k, v in kwargs.items() if k not in _IGNORED_KWARGS))
+            for value in values:
+                # string keys are made of the reprs, invalidate_containing looks them up by prefix
+                if _string_tokens:
+                    yield _Repr((_true_repr(value),))
+                try:
+                    hash(value)
+                except TypeError:
+                    continue
+                yield value
+
+            if tags is not None:
+                for tag in tags(*args, **kwargs):
+                    yield _Tag((tag,))
+
+        def _evict_failed(key: Hashable, task: asyncio.Task[R]) -> None:
+            # retrieving the exception also keeps it from being logged as never retrieved
+            if not task.cancelled() and task.exception() is None:
+                return
+
+            if _internal_cache.get(key) is task:
+                del _internal_cache[key]
+                _index.discard(key)
+
+        def _refreshed(key: Hashable, task: asyncio.Task[R]) -> None:
+            del _refreshing[key]
+            # a failed refresh keeps serving the current entry until it expires
+            if task.cancelled() or task.exception() is not None:
+                return
+
+            if key in _internal_cache:
+                _internal_cache[key] = task
+
+        def _refresh(key: Hashable, task: asyncio.Task[R], args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+            refresh_at = _refresh_at
+            if refresh_at is None or not isinstance(_internal_cache, ExpiringCache):
+                return
+            if key in _refreshing or not task.done():
+                return
+
+            try:
+                age = _internal_cache.age(key)
+            except KeyError:
+                return
+
+            if age >= refresh_at:
+                tokens = tuple(_tokens(args, kwargs))
+                _refreshing[key] = refresh = asyncio.create_task(_call(key, args, kwargs, tokens, refresh=True))
+                refresh.add_done_callback(lambda refresh: _refreshed(key, refresh))
+
+        if backend is None:
+
+            def _call(
+                key: Hashable,
+                args: tuple[Any, ...],
+                kwargs: dict[str, Any],
+                tokens: tuple[Hashable, ...],
+                *,
+                refresh: bool = False,
+            ) -> Coroutine[Any, Any, R]:
+                return func(*args, **kwargs)
+
+        else:
+            shared = backend
+            _unshared_make_key = _make_key
+            _backend_ttl = backend_ttl
+            if _backend_ttl is None and strategy is Strategy.timed:
+                _backend_ttl = maxsize if ttl is None else ttl
+
+            def _shared_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+                # the keys of every function share the backend, they need to start with the function's name
+                key = _unshared_make_key(args, kwargs)
+                if isinstance(key, str) and key_func is None:
+                    return key
+                return f'{_prefix}:{key!r}'
+
+            _make_key = _shared_key
+
+            def _backend_token(token: Hashable) -> str:
+                if isinstance(token, _Tag):
+                    return shared.tag_token(_prefix, token[0])
+                if isinstance(token, _Repr):
+                    return shared.repr_token(_prefix, token[0])
+                return shared.token(_prefix, token)
+
+            async def _store(key: str, args: tuple[Any, ...], kwargs: dict[str, Any], tokens: tuple[Hashable, ...]) -> R:
+                result = await func(*args, **kwargs)
+                try:
+                    await shared.set(key, result, ttl=_backend_ttl, tokens=[_backend_token(token) for token in tokens])
+                except Exception:
+                    _log.exception('Failed to store %s in %r', key, shared)
+                return result
+
+            async def _load(key: str, args: tuple[Any, ...], kwargs: dict[str, Any], tokens: tuple[Hashable, ...]) -> R:
+                try:
+                    return await shared.get(key)
+                except KeyError:
+                    pass
+                except Exception:
+                    _log.exception('Failed to load %s from %r', key, shared)
+                return await _store(key, args, kwargs, tokens)
+
+            def _call(
+                key: Hashable,
+                args: tuple[Any, ...],
+                kwargs: dict[str, Any],
+                tokens: tuple[Hashable, ...],
+                *,
+                refresh: bool = False,
+            ) -> Coroutine[Any, Any, R]:
+                # keys are always strings with a backend
+                if refresh:
+                    return _store(str(key), args, kwargs, tokens)
+                return _load(str(key), args, kwargs, tokens)
+
+            def _on_invalidation(namespace: str, kind: str, value: Any) -> None:
+                if namespace == _prefix:
+                    _invalidate_local(kind, _hashable(value))
+
+            shared.subscribe(_on_invalidation)
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any):
             key = _make_key(args, kwargs)
             try:
                 task = _internal_cache[key]
             except KeyError:
-                _internal_cache[key] = task = asyncio.create_task(func(*args, **kwargs))
+                _counters[1] += 1
+                tokens = tuple(_tokens(args, kwargs))
+                _internal_cache[key] = task = asyncio.create_task(_call(key, args, kwargs, tokens))
+                task.add_done_callback(lambda task: _evict_failed(key, task))
+                # entries evicted by the cache itself linger in the index until it is pruned
+                if len(_index) > 2 * len(_internal_cache) + 64:
+                    _index.prune(_internal_cache)
+                _index.add(key, tokens)
                 return task
             else:
+                _counters[0] += 1
+                if _refresh_at is not None:
+                    _refresh(key, task, args, kwargs)
                 return task
 
-        def _invalidate(*args: Any, **kwargs: Any) -> bool:
-            try:
-                del _internal_cache[_make_key(args, kwargs)]
-            except KeyError:
-                return False
-            else:
-                return True
-
-        def _invalidate_containing(key: str) -> None:
-            to_remove = []
-            for k in _internal_cache.keys():
-                if key in k:
-                    to_remove.append(k)
-            for k in to_remove:
+        def _delete(keys: Iterable[Hashable]) -> int:
+            deleted = 0
+            for k in keys:
+                _index.discard(k)
                 try:
                     del _internal_cache[k]
                 except KeyError:
                     continue
+                else:
+                    deleted += 1
+            return deleted
+
+        def _invalidate_local(kind: str, value: Any) -> int:
+            if kind == 'key':
+                return _delete((value,))
+            if kind == 'arg':
+                return _delete(_index.pop(value))
+            if kind == 'tag':
+                return _delete(_index.pop(_Tag((value,))))
+
+            # the entries with that argument, and those with an argument whose repr starts with the string
+            keys = set(_index.pop(value))
+            if isinstance(value, str):
+                keys.update(_index.pop_prefix(value))
+            return _delete(keys)
+
+        def _invalidate_everywhere(kind: str, value: Any) -> int:
+            deleted = _invalidate_local(kind, value)
+            if backend is not None:
+                backend.invalidate(_prefix, kind, value)
+            return deleted
 
-        wrapper.cache = _internal_cache
-        wrapper.get_key = lambda *args, **kwargs: _make_key(args, kwargs)
-        wrapper.invalidate = _invalidate
-        wrapper.get_stats = _stats
-        wrapper.invalidate_containing = _invalidate_containing
-        return wrapper  # type: ignore
+        def _invalidate(*args: Any, **kwargs: Any) -> bool:
+            return _invalidate_everywhere('key', _make_key(args, kwargs)) == 1
 
-    return decorator
+        def _invalidate_containing(key: Hashable) -> None:
+            _invalidate_everywhere('containing', key)
 
+        def _invalidate_arg(value: Any) -> int:
+            return _invalidate_everywhere('arg', value)
+
+        def _invalidate_tag(tag: Hashable) -> int:
+            return _invalidate_everywhere('tag', tag)
+
+        cached: Any = wrapper
+        cached.cache = _internal_cache
+        cached.get_key = lambda *args, **kwargs: _make_key(args, kwargs)
+        cached.invalidate = _invalidate
+        cached.get_stats = _stats
+        cached.invalidate_containing = _invalidate_containing
+        cached.invalidate_arg = _invalidate_arg
+        cached.invalidate_tag = _invalidate_tag
+        return cached
+
+    return decorator
@@ -12,6 +12,17 @@ from __future__ import annotations
 import datetime
 from typing import Any, Iterable, Optional, Sequence
 
+# fmt: off
+__all__ = (
+    'plural',
+    'human_join',
+    'TabularData',
+    'format_dt',
+    'tick',
+)
+# fmt: on
+
+
 class plural:
     def __init__(self, value: int):
         self.value: int = value
@@ -16,6 +16,17 @@ import traceback
 from discord.ext.commands import Paginator as CommandPaginator
 from discord.ext import menus
 
+# fmt: off
+__all__ = (
+    'NumberedPageModal',
+    'RoboPages',
+    'FieldPageSource',
+    'TextPageSource',
+    'SimplePageSource',
+    'SimplePages',
+)
+# fmt: on
+
 if TYPE_CHECKING:
     from .context import ContextU as Context
 
@@ -21,6 +21,22 @@ import parsedatetime as pdt
 from .context import ContextU
 from .danny_formats import format_dt as format_dt, human_join, plural
 
+# fmt: off
+__all__ = (
+    'ShortTime',
+    'RelativeDelta',
+    'HumanTime',
+    'Time',
+    'FutureTime',
+    'BadTimeTransform',
+    'TimeTransformer',
+    'FriendlyTimeResult',
+    'UserFriendlyTime',
+    'human_timedelta',
+    'format_relative',
+)
+# fmt: on
+
 # Monkey patch mins and secs into the units
 units = pdt.pdtLocales["en_US"].units
 units["minutes"].append("mins")
@@ -10,6 +10,7 @@ from typing_extensions import Self
 __all__ = (
     "EnumU",
     "RequestType",
+    "CircuitState",
     "IntegrationType",
 )
 # fmt: on
@@ -114,6 +115,19 @@ class RequestType(Enum):
         return self.value.upper()
 
 
+class CircuitState(Enum):
+    """An Enum representing the state of a :class:`CircuitBreaker`'s circuit for a host."""
+    closed = 0
+    """Requests are made normally."""
+    open = 1
+    """Requests fail straight away, without being made."""
+    half_open = 2
+    """A limited number of trial requests are made to check whether the host has recovered."""
+
+    def __str__(self) -> str:
+        return self.name
+
+
 class IntegrationType(Enum):
     """An Enum representing the type of integration for a discord bot."""
     guild = 0
@@ -1,9 +1,28 @@
 import logging
 
-from .constants import formatter
+from .settings import get_settings
 
-requests_handler = logging.FileHandler("requests.log", "a")
-requests_handler.setFormatter(formatter)
+# fmt: off
+__all__ = (
+    'requests_handler',
+    'requests_logger',
+)
+# fmt: on
+
+
+class _RequestsLogHandler(logging.Handler):
+    """Writes records to the requests log of the current settings (see :func:`settings.init`).
+
+    The file is only opened when the first record is written to it, so importing this module has no side effects.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        handler = get_settings().requests_handler
+        if handler is not None:
+            handler.handle(record)
+
+
+requests_handler = _RequestsLogHandler()
 requests_logger = logging.getLogger("requests_commands")
 requests_logger.setLevel(logging.INFO)
 requests_logger.addHandler(requests_handler)
@@ -26,19 +26,18 @@ from discord.ext import commands
 from discord.ext.commands import Bot
 from discord.utils import MISSING
 
+from . import constants
 from .constants import (
     DEFAULT_FOOTER_NAME,
-    CODEBLOCK_LANGUAGES,
-    CodeblockLanguage,
     DISCORD_FILE_SIZE_LIMIT,
     RE_URL,
     Snowflake,
-    emojidict,
 )
 from .enums import IntegrationType
 from .views import SendModalView
 
 if TYPE_CHECKING:
+    from .constants import CodeblockLanguage
     from .context import ContextU
 
 # fmt: off
@@ -265,7 +264,7 @@ def makeembed_failedaction(
     """
 
     if not title:
-        title = f"{emojidict.get(False)} Action Failed"
+        title = f"{constants.emojidict.get(False)} Action Failed"
     # kwargs["title"] = kwargs.get("title", f"{emojidict.get(False)} Action Failed")
     # if not color:
     #     color = discord.Color.brand_red()
@@ -310,7 +309,7 @@ def makeembed_partialaction(
     """
 
     if not title:
-        title = f'{emojidict.get("yellow")} Action Partially Successful'
+        title = f'{constants.emojidict.get("yellow")} Action Partially Successful'
 
     emb = makeembed_bot(
         title=title,
@@ -350,7 +349,7 @@ def makeembed_successfulaction(
     This method calls :meth:`makeembed_bot` with the changed defaults.
     """
     if not title:
-        title = f"{emojidict.get(True)} Action Successful"
+        title = f"{constants.emojidict.get(True)} Action Successful"
 
     emb = makeembed_bot(
         title=title,
@@ -594,7 +593,7 @@ async def create_codeblock(content: Union[str, app_commands.locale_str], lang: C
     :class:`ValueError`
         If the language is not a valid language code.
     """
-    if lang not in CODEBLOCK_LANGUAGES:
+    if lang not in constants.CODEBLOCK_LANGUAGES:
         raise ValueError(f"Invalid Language: {lang}")
     fmt: Union[str, app_commands.locale_str] = "```"
     return f"{fmt}{lang}\n{content}{fmt}"
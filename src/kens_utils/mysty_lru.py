@@ -18,13 +18,12 @@ limitations under the License.
 
 from __future__ import annotations
 
-from collections import deque
-from typing import TYPE_CHECKING, Generic, TypeVar, overload
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, TypeVar, overload
 
 
-if TYPE_CHECKING:
-    from collections.abc import MutableMapping
-
 # fmt: off
 __all__ = (
     "LRUCache",
@@ -35,12 +34,62 @@ KT = TypeVar("KT")
 VT = TypeVar("VT")
 DT = TypeVar("DT")
 
+_MISSING: Any = object()
+
 
 class LRUCache(Generic[KT, VT]):
-    def __init__(self, max_size: int = 100) -> None:
+    """A least recently used cache.
+
+    Parameters
+    ----------
+    max_size: :class:`int`
+        The maximum number of entries.
+    ttl: Optional[:class:`float`]
+        How long (in seconds) entries stay fresh. Can be overridden per entry with :meth:`set`.
+        Expired entries are dropped when they are accessed, and in bulk at most every `ttl` seconds
+        when new entries are added (or when :meth:`expire` is called).
+    max_weight: Optional[:class:`int`]
+        The maximum total weight of the entries, as returned by `weigher`.
+    weigher: Optional[Callable[[KT, VT], :class:`int`]]
+        Returns the weight of an entry (ex. its size in bytes). Every entry weighs ``1`` if not given.
+    negative_ttl: Optional[:class:`float`]
+        How long (in seconds) :meth:`get_or_load` caches ``None`` results. They are not cached if not given.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 100,
+        *,
+        ttl: Optional[float] = None,
+        max_weight: Optional[int] = None,
+        weigher: Optional[Callable[[KT, VT], int]] = None,
+        negative_ttl: Optional[float] = None,
+    ) -> None:
         self._max_size: int = max_size
-        self._keys: deque[KT] = deque()
-        self._cache: MutableMapping[KT, VT] = {}
+        self._max_entries: int = max_size
+        if weigher is None and max_weight is not None:
+            # every entry weighs 1 without a weigher, so the weight limit is a limit on the number of entries
+            self._max_entries = min(max_size, max_weight)
+        self._ttl: Optional[float] = ttl
+        self._max_weight: Optional[int] = max_weight
+        self._weigher: Optional[Callable[[KT, VT], int]] = weigher
+        self._negative_ttl: Optional[float] = negative_ttl
+        self._timer: Callable[[], float] = time.monotonic
+
+        # ordered from least to most recently used, every operation is O(1)
+        self._cache: OrderedDict[KT, VT] = OrderedDict()
+        # only entries with a TTL/a weigher are tracked in these
+        self._expires: Dict[KT, float] = {}
+        self._weights: Dict[KT, int] = {}
+        self._weight: int = 0
+        self._next_sweep: float = 0.0
+        # the loads started by get_or_load, a key's load is forgotten if the key is deleted meanwhile
+        self._loading: Dict[KT, asyncio.Task[VT]] = {}
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
 
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}(max_size={self._max_size}, items={len(self._cache)})"
@@ -48,25 +97,86 @@ class LRUCache(Generic[KT, VT]):
     def __len__(self) -> int:
         return len(self._cache)
 
+    @property
+    def weight(self) -> int:
+        """The total weight of the entries (their count if there is no `weigher`)."""
+        return self._weight if self._weigher is not None else len(self._cache)
+
+    def _expired(self, key: KT, now: float) -> bool:
+        expires_at = self._expires.get(key)
+        if expires_at is None or expires_at > now:
+            return False
+
+        self._remove(key)
+        self.expirations += 1
+        return True
+
+    def _remove(self, key: KT, /) -> VT:
+        self._expires.pop(key, None)
+        if self._weigher is not None:
+            self._weight -= self._weights.pop(key)
+        return self._cache.pop(key)
+
     def _rotate(self, key: KT, /) -> VT:
-        self._keys.remove(key)
-        self._keys.append(key)
+        self._cache.move_to_end(key)
 
         return self._cache[key]
 
-    def __setitem__(self, key: KT, value: VT, /) -> None:
-        if key in self._cache:
-            self._keys.remove(key)
+    def _lookup(self, key: KT, /) -> bool:
+        """Returns whether `key` is cached (and not expired), updating the hit/miss counters."""
+        if key not in self._cache or (self._expires and self._expired(key, self._timer())):
+            self.misses += 1
+            return False
+
+        self.hits += 1
+        return True
+
+    def set(self, key: KT, value: VT, /, *, ttl: Optional[float] = _MISSING) -> None:
+        """Adds or replaces an entry. `ttl` overrides the cache's TTL for this entry (``None`` to never expire it)."""
+        if ttl is _MISSING:
+            ttl = self._ttl
+
+        cache = self._cache
+        if ttl is not None or self._expires:
+            now = self._timer()
+            if self._expires and now >= self._next_sweep:
+                self.expire()
+            if ttl is not None:
+                self._expires[key] = now + ttl
+                if self._next_sweep <= now:
+                    self._next_sweep = now + (self._ttl or ttl)
+            else:
+                self._expires.pop(key, None)
+
+        if key in cache:
+            cache.move_to_end(key)
+
+        cache[key] = value
+        if self._weigher is not None:
+            weight = self._weigher(key, value)
+            self._weight += weight - self._weights.get(key, 0)
+            self._weights[key] = weight
 
-        elif len(self._cache) == self._max_size:
-            removed = self._keys.popleft()
-            del self._cache[removed]
+        if len(cache) > self._max_entries or (self._max_weight is not None and self._weight > self._max_weight):
+            self._evict()
 
-        self._cache[key] = value
-        self._keys.append(key)
+    def _evict(self) -> None:
+        cache = self._cache
+        if not self._expires and self._weigher is None:
+            while len(cache) > self._max_entries:
+                cache.popitem(last=False)
+                self.evictions += 1
+            return
+
+        while len(cache) > self._max_entries or (self._max_weight is not None and self._weight > self._max_weight):
+            self._remove(next(iter(cache)))
+            self.evictions += 1
+
+    def __setitem__(self, key: KT, value: VT, /) -> None:
+        self.set(key, value)
 
     def __getitem__(self, key: KT, /) -> VT:
-        if key not in self._cache:
+        if not self._lookup(key):
             raise KeyError(f'The key "{key}" does not exist in {self!r}')
 
         return self._rotate(key)
@@ -75,8 +185,8 @@ class LRUCache(Generic[KT, VT]):
         if key not in self._cache:
             raise KeyError(f'The key "{key}" does not exist in {self!r}')
 
-        self._keys.remove(key)
-        del self._cache[key]
+        self._remove(key)
+        self._loading.pop(key, None)
 
     @overload
     def get(self, key: KT, /) -> VT | None: ...
@@ -85,11 +195,90 @@ class LRUCache(Generic[KT, VT]):
     def get(self, key: KT, default: DT, /) -> VT | DT: ...
 
     def get(self, key: KT, default: DT | None = None, /) -> VT | DT | None:
-        if key not in self._cache:
+        if not self._lookup(key):
             return default
 
         return self._rotate(key)
 
+    async def get_or_load(
+        self,
+        key: KT,
+        loader: Callable[[], Awaitable[VT]],
+        /,
+        *,
+        ttl: Optional[float] = _MISSING,
+        negative_ttl: Optional[float] = _MISSING,
+    ) -> VT:
+        """Returns the value of `key`, awaiting ``loader()`` and caching its result if it is missing.
+
+        Concurrent calls for the same missing key share a single call to `loader`. The load runs in its own
+        task, so cancelling one of the callers doesn't cancel it for the others (and its result is still cached).
+        If `loader` raises, every caller gets the exception and nothing is cached.
+
+        ``None`` results are cached for `negative_ttl` seconds (defaults to the cache's `negative_ttl`),
+        other results for `ttl` seconds (defaults to the cache's `ttl`).
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._load(key, loader, ttl, negative_ttl))
+            self._loading[key] = task
+            task.add_done_callback(lambda task: self._forget_load(key, task))
+
+        return await asyncio.shield(task)
+
+    async def _load(
+        self, key: KT, loader: Callable[[], Awaitable[VT]], ttl: Optional[float], negative_ttl: Optional[float]
+    ) -> VT:
+        value = await loader()
+
+        # don't cache the value if the key was deleted (or the cache cleared) while loading it
+        if self._loading.get(key) is asyncio.current_task():
+            if value is not None:
+                self.set(key, value, ttl=ttl)
+            else:
+                if negative_ttl is _MISSING:
+                    negative_ttl = self._negative_ttl
+                if negative_ttl:
+                    self.set(key, value, ttl=negative_ttl)
+        return value
+
+    def _forget_load(self, key: KT, task: asyncio.Task[VT]) -> None:
+        if self._loading.get(key) is task:
+            del self._loading[key]
+        if not task.cancelled():
+            # retrieve the exception so it isn't logged as unhandled if every caller was cancelled
+            task.exception()
+
+    def expire(self) -> int:
+        """Drops every expired entry and returns how many were dropped."""
+        now = self._timer()
+        expired = [key for key, expires_at in self._expires.items() if expires_at <= now]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+
+        if self._expires:
+            self._next_sweep = now + (self._ttl or min(self._expires.values()) - now)
+        return len(expired)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the cache's counters along with its current size and weight."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self._cache),
+            "weight": self.weight,
+        }
+
     def clear(self) -> None:
-        self._keys = deque()
-        self._cache = {}
\ No newline at end of file
+        self._cache.clear()
+        self._expires.clear()
+        self._weights.clear()
+        self._weight = 0
+        self._loading.clear()
@@ -1,22 +1,78 @@
 from __future__ import annotations
 import asyncio
-from typing import Union
+import bisect
+from collections import Counter, defaultdict, deque
+import datetime
+import email.utils
+import functools
+import hashlib
+import io
+import pathlib
+import random
+import re
+import tempfile
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    FrozenSet,
+    IO,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import aiohttp
+import discord
+from discord.ext import commands
+from discord.utils import MISSING, _from_json as from_json, _to_json as to_json
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
 
 from .constants import HTTPCode
-
-try:
-    from .constants import BLOXLINK_API_KEY, ROVER_API_KEY
-except ImportError:
-    BLOXLINK_API_KEY = None
-    ROVER_API_KEY = None
-
-from .enums import RequestType
+from .enums import CircuitState, RequestType
 from .logger import requests_logger
+from .methods import get_max_file_upload_limit
+from .mysty_lru import LRUCache
+from .settings import get_settings
 
 # fmt: off
 __all__ = (
+    "BufferedResponse",
+    "CachedResponse",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "DEFAULT_CIRCUIT_BREAKER",
+    "DEFAULT_HTTP_METRICS",
+    "DEFAULT_HTTP_CACHE",
+    "DEFAULT_RATE_LIMITER",
+    "DEFAULT_RETRY_POLICY",
+    "HTTPCache",
+    "HTTPMetrics",
+    "Histogram",
+    "RateLimitBucket",
+    "RateLimiter",
+    "RequestResult",
+    "ResponseTooLargeError",
+    "RetryBudget",
+    "RetryPolicy",
+    "SessionPool",
+    "download_file",
+    "gather_requests",
+    "get_session_pool",
+    "iter_response_chunks",
+    "parse_retry_after",
+    "set_session_pool",
+    "stream_response",
     "_delete",
     "_get",
     "_patch",
@@ -25,10 +81,1416 @@ __all__ = (
 )
 # fmt: on
 
+class Histogram:
+    """A cumulative histogram of observed values (ex. latencies, in seconds), with fixed bucket bounds."""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    DEFAULT_BOUNDS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BOUNDS) -> None:
+        self.bounds: Tuple[float, ...] = tuple(sorted(bounds))
+        # the last count is for values larger than every bound (+Inf)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} count={self.count} sum={self.sum:.4f}>"
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Returns ``(upper bound, number of values <= bound)`` pairs, ending with ``(inf, count)``."""
+        total = 0
+        buckets = []
+        for bound, count in zip((*self.bounds, float("inf")), self.counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": {("+Inf" if bound == float("inf") else str(bound)): count for bound, count in self.cumulative()},
+        }
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class HTTPMetrics:
+    """An in-process registry of metrics about the requests made through :func:`_request`.
+
+    Latencies are recorded per route (see :meth:`RateLimiter.route_key`), everything else per host.
+    Connection-level timings (DNS resolution, opening a connection, including the TLS handshake,
+    and waiting for a free connection in the pool) and body sizes come from the :class:`aiohttp.TraceConfig`
+    returned by :meth:`trace_config`, which every :class:`SessionPool` session is created with.
+
+    Use :meth:`snapshot` to dump the metrics or :meth:`to_prometheus` to serve them.
+
+    Parameters
+    ----------
+    bounds: Tuple[:class:`float`, ...]
+        The bucket bounds (in seconds) of the histograms. Defaults to :attr:`Histogram.DEFAULT_BOUNDS`.
+    """
+
+    def __init__(self, *, bounds: Tuple[float, ...] = Histogram.DEFAULT_BOUNDS) -> None:
+        self.bounds: Tuple[float, ...] = bounds
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} routes={len(self.latency)} hosts={len(self.responses)}>"
+
+    def reset(self) -> None:
+        """Clears every metric."""
+        self.latency: Dict[str, Histogram] = defaultdict(self._histogram)
+        self.pool_wait: Dict[str, Histogram] = defaultdict(self._histogram)
+        self.dns: Dict[str, Histogram] = defaultdict(self._histogram)
+        self.connect: Dict[str, Histogram] = defaultdict(self._histogram)
+        self.responses: Counter[Tuple[str, str]] = Counter()
+        self.errors: Counter[Tuple[str, str]] = Counter()
+        self.retries: Counter[str] = Counter()
+        self.connections: Counter[Tuple[str, str]] = Counter()
+        self.bytes_in: Counter[str] = Counter()
+        self.bytes_out: Counter[str] = Counter()
+
+    def _histogram(self) -> Histogram:
+        return Histogram(self.bounds)
+
+    def record_response(self, route_key: str, host: str, status: int, elapsed: float) -> None:
+        """Records a response to a request (a single attempt) that took `elapsed` seconds."""
+        self.latency[route_key].observe(elapsed)
+        self.responses[(host, f"{status // 100}xx")] += 1
+
+    def record_error(self, route_key: str, host: str, error: BaseException, elapsed: float) -> None:
+        """Records a request (a single attempt) that raised `error` after `elapsed` seconds."""
+        self.latency[route_key].observe(elapsed)
+        self.errors[(host, error.__class__.__name__)] += 1
+
+    def record_retry(self, host: str) -> None:
+        self.retries[host] += 1
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Returns a :class:`aiohttp.TraceConfig` that records connection timings and body sizes into this registry."""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session: Any, ctx: Any, params: aiohttp.TraceRequestStartParams) -> None:
+            ctx.host = _host_of(params.url)
+
+        async def on_request_chunk_sent(session: Any, ctx: Any, params: aiohttp.TraceRequestChunkSentParams) -> None:
+            self.bytes_out[ctx.host] += len(params.chunk)
+
+        async def on_response_chunk_received(
+            session: Any, ctx: Any, params: aiohttp.TraceResponseChunkReceivedParams
+        ) -> None:
+            self.bytes_in[ctx.host] += len(params.chunk)
+
+        async def on_connection_queued_start(session: Any, ctx: Any, params: Any) -> None:
+            ctx.queued_at = time.perf_counter()
+
+        async def on_connection_queued_end(session: Any, ctx: Any, params: Any) -> None:
+            self.pool_wait[ctx.host].observe(time.perf_counter() - ctx.queued_at)
+
+        async def on_connection_create_start(session: Any, ctx: Any, params: Any) -> None:
+            ctx.connect_started_at = time.perf_counter()
+
+        async def on_connection_create_end(session: Any, ctx: Any, params: Any) -> None:
+            self.connect[ctx.host].observe(time.perf_counter() - ctx.connect_started_at)
+            self.connections[(ctx.host, "created")] += 1
+
+        async def on_connection_reuseconn(session: Any, ctx: Any, params: Any) -> None:
+            self.connections[(ctx.host, "reused")] += 1
+
+        async def on_dns_resolvehost_start(session: Any, ctx: Any, params: Any) -> None:
+            ctx.dns_started_at = time.perf_counter()
+
+        async def on_dns_resolvehost_end(session: Any, ctx: Any, params: Any) -> None:
+            self.dns[ctx.host].observe(time.perf_counter() - ctx.dns_started_at)
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_chunk_sent.append(on_request_chunk_sent)
+        trace_config.on_response_chunk_received.append(on_response_chunk_received)
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(on_connection_queued_end)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+        trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        return trace_config
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns every metric as plain dictionaries, ready to be dumped (ex. as JSON)."""
+
+        def histograms(mapping: Dict[str, Histogram]) -> Dict[str, Dict[str, Any]]:
+            return {key: histogram.to_dict() for key, histogram in mapping.items()}
+
+        def nested(counter: Counter[Tuple[str, str]]) -> Dict[str, Dict[str, int]]:
+            result: Dict[str, Dict[str, int]] = defaultdict(dict)
+            for (host, label), count in counter.items():
+                result[host][label] = count
+            return dict(result)
+
+        return {
+            "latency": histograms(self.latency),
+            "pool_wait": histograms(self.pool_wait),
+            "dns": histograms(self.dns),
+            "connect": histograms(self.connect),
+            "responses": nested(self.responses),
+            "errors": nested(self.errors),
+            "connections": nested(self.connections),
+            "retries": dict(self.retries),
+            "bytes_in": dict(self.bytes_in),
+            "bytes_out": dict(self.bytes_out),
+        }
+
+    def to_prometheus(self, prefix: str = "kens_utils_http") -> str:
+        """Returns every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def histograms(name: str, label: str, mapping: Dict[str, Histogram], help_: str) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for key, histogram in mapping.items():
+                key = _escape_label(key)
+                for bound, count in histogram.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{prefix}_{name}_bucket{{{label}="{key}",le="{le}"}} {count}')
+                lines.append(f'{prefix}_{name}_sum{{{label}="{key}"}} {histogram.sum}')
+                lines.append(f'{prefix}_{name}_count{{{label}="{key}"}} {histogram.count}')
+
+        def counters(name: str, labels: Tuple[str, ...], counter: Mapping[Any, int], help_: str) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for key, count in counter.items():
+                values = key if isinstance(key, tuple) else (key,)
+                rendered = ",".join(f'{label}="{_escape_label(value)}"' for label, value in zip(labels, values))
+                lines.append(f"{prefix}_{name}{{{rendered}}} {count}")
+
+        histograms("request_duration_seconds", "route", self.latency, "Time taken by each request attempt.")
+        histograms("pool_wait_seconds", "host", self.pool_wait, "Time spent waiting for a free connection.")
+        histograms("dns_seconds", "host", self.dns, "Time spent resolving hosts.")
+        histograms("connect_seconds", "host", self.connect, "Time spent opening connections (including TLS).")
+        counters("responses_total", ("host", "status_class"), self.responses, "Responses by status class.")
+        counters("errors_total", ("host", "error"), self.errors, "Requests that raised an exception.")
+        counters("connections_total", ("host", "kind"), self.connections, "Connections created or reused.")
+        counters("retries_total", ("host",), self.retries, "Retried requests.")
+        counters("received_bytes_total", ("host",), self.bytes_in, "Response body bytes received.")
+        counters("sent_bytes_total", ("host",), self.bytes_out, "Request body bytes sent.")
+        return "\n".join(lines) + "\n"
+
+
+DEFAULT_HTTP_METRICS: HTTPMetrics = HTTPMetrics()
+"""The :class:`HTTPMetrics` registry used by :class:`SessionPool` (and :func:`_request`) unless another one is given."""
+
+
+class SessionPool:
+    """A registry of long-lived :class:`aiohttp.ClientSession` objects, one per host.
+
+    Each host (scheme, host and port) gets its own session and :class:`aiohttp.TCPConnector`,
+    so connections are kept alive and reused between requests instead of being
+    created (and closed) for every call, and one slow host can't exhaust the
+    connections of another.
+
+    Sessions are created lazily the first time a host is requested, so the pool
+    itself can be created outside of a running event loop.
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        The total number of simultaneous connections per host session. Defaults to ``100``.
+    limit_per_host: :class:`int`
+        The number of simultaneous connections to a single endpoint. ``0`` means no limit. Defaults to ``30``.
+    keepalive_timeout: :class:`float`
+        How long (in seconds) idle connections are kept open for reuse. Defaults to ``30.0``.
+    ttl_dns_cache: Optional[:class:`int`]
+        How long (in seconds) resolved DNS entries are cached. ``None`` caches forever. Defaults to ``300``.
+    timeout: Optional[:class:`aiohttp.ClientTimeout`]
+        The default timeout for sessions created by this pool.
+    connector_kwargs: Optional[Dict[:class:`str`, Any]]
+        Extra keyword arguments passed to :class:`aiohttp.TCPConnector`.
+    metrics: Optional[:class:`HTTPMetrics`]
+        The registry the sessions' trace hooks record into. Defaults to :data:`DEFAULT_HTTP_METRICS`.
+    **session_kwargs: Any
+        Extra keyword arguments passed to :class:`aiohttp.ClientSession`.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 30,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        connector_kwargs: Optional[Dict[str, Any]] = None,
+        metrics: Optional[HTTPMetrics] = None,
+        **session_kwargs: Any,
+    ) -> None:
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.ttl_dns_cache: Optional[int] = ttl_dns_cache
+        self.timeout: Optional[aiohttp.ClientTimeout] = timeout
+        self.connector_kwargs: Dict[str, Any] = connector_kwargs or {}
+        self.session_kwargs: Dict[str, Any] = session_kwargs
+        self.metrics: HTTPMetrics = metrics or DEFAULT_HTTP_METRICS
+
+        self._sessions: Dict[Tuple[str, str, Optional[int]], aiohttp.ClientSession] = {}
+        self._closed: bool = False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} hosts={len(self._sessions)} closed={self._closed}>"
+
+    @property
+    def closed(self) -> bool:
+        """Whether :meth:`close` has been called on this pool."""
+        return self._closed
+
+    @staticmethod
+    def _host_key(url: Union[str, URL]) -> Tuple[str, str, Optional[int]]:
+        url = URL(url)
+        return (url.scheme, url.host or "", url.port)
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.ttl_dns_cache,
+            **self.connector_kwargs,
+        )
+        kwargs = dict(self.session_kwargs)
+        if self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+        kwargs["trace_configs"] = [*kwargs.get("trace_configs", []), self.metrics.trace_config()]
+        return aiohttp.ClientSession(connector=connector, **kwargs)
+
+    def get_session(self, url: Union[str, URL]) -> aiohttp.ClientSession:
+        """Returns the session for the host of `url`, creating it if it doesn't exist yet.
+
+        Must be called from within a running event loop.
+
+        Parameters
+        ----------
+        url: Union[:class:`str`, :class:`yarl.URL`]
+            The URL the session will be used for.
+
+        Raises
+        ------
+        :class:`RuntimeError`
+            The pool has been closed.
+
+        Returns
+        -------
+        :class:`aiohttp.ClientSession`
+            The session for the URL's host.
+        """
+        if self._closed:
+            raise RuntimeError(f"{self!r} is closed")
+
+        key = self._host_key(url)
+        session = self._sessions.get(key)
+        if session is None or session.closed:
+            session = self._sessions[key] = self._create_session()
+        return session
+
+    async def open(self) -> None:
+        """|coro|
+        Marks the pool as open so sessions can be (re)created after :meth:`close`.
+        """
+        self._closed = False
+
+    async def close(self) -> None:
+        """|coro|
+        Closes every session (and its connections) in the pool.
+        """
+        self._closed = True
+        sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+    async def __aenter__(self) -> SessionPool:
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+_session_pool: Optional[SessionPool] = None
+
+
+def _host_of(url: Union[str, URL]) -> str:
+    url = URL(url)
+    return f"{url.host}:{url.explicit_port}" if url.explicit_port else (url.host or "")
+
+
+def get_session_pool() -> SessionPool:
+    """Returns the process-wide :class:`SessionPool` used by :func:`_request`.
+
+    If no pool has been set with :func:`set_session_pool` (or the current one
+    was closed), a new one with the default settings is created.
+    """
+    global _session_pool
+    if _session_pool is None or _session_pool.closed:
+        _session_pool = SessionPool()
+    return _session_pool
+
+
+def set_session_pool(pool: Optional[SessionPool]) -> None:
+    """Sets the process-wide :class:`SessionPool` used by :func:`_request`.
+
+    :class:`BotU` calls this in :meth:`BotU.setup_hook` with its own pool.
+    """
+    global _session_pool
+    _session_pool = pool
+
+
+class RetryBudget:
+    """Limits how many retries can be made to a single host, relative to the number of requests made to it.
+
+    Over a sliding window of `window` seconds, a host may be retried at most
+    ``max(min_retries, ratio * requests)`` times. This stops a failing upstream
+    from multiplying our outbound traffic by the number of retry attempts.
+
+    Parameters
+    ----------
+    ratio: :class:`float`
+        The number of retries allowed per request made. Defaults to ``0.2`` (one retry every five requests).
+    min_retries: :class:`int`
+        The number of retries always allowed in a window, so hosts with little traffic can still be retried. Defaults to ``10``.
+    window: :class:`float`
+        The length of the sliding window in seconds. Defaults to ``10.0``.
+    """
+
+    def __init__(self, *, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0) -> None:
+        self.ratio: float = ratio
+        self.min_retries: int = min_retries
+        self.window: float = window
+        self._requests: Dict[str, Deque[float]] = defaultdict(deque)
+        self._retries: Dict[str, Deque[float]] = defaultdict(deque)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} ratio={self.ratio} min_retries={self.min_retries} window={self.window}>"
+
+    def _prune(self, host: str, now: float) -> None:
+        cutoff = now - self.window
+        for entries in (self._requests[host], self._retries[host]):
+            while entries and entries[0] < cutoff:
+                entries.popleft()
+
+    def record_request(self, host: str) -> None:
+        """Records a (first attempt) request made to `host`."""
+        now = time.monotonic()
+        self._prune(host, now)
+        self._requests[host].append(now)
+
+    def try_acquire(self, host: str) -> bool:
+        """Withdraws a retry for `host` from the budget.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the retry is allowed. If ``False``, the request should not be retried.
+        """
+        now = time.monotonic()
+        self._prune(host, now)
+        allowed = max(self.min_retries, int(self.ratio * len(self._requests[host])))
+        if len(self._retries[host]) >= allowed:
+            return False
+        self._retries[host].append(now)
+        return True
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Parses how long to wait before retrying from a response's headers.
+
+    ``Retry-After`` is checked first (either delay-seconds or an HTTP-date),
+    then ``X-RateLimit-Reset-After``.
+
+    Parameters
+    ----------
+    headers: Mapping[:class:`str`, :class:`str`]
+        The response headers.
+
+    Returns
+    -------
+    Optional[:class:`float`]
+        The number of seconds to wait, or ``None`` if no (valid) header was found.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+        try:
+            when = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError, IndexError):
+            when = None
+
+        if when is not None:
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=datetime.timezone.utc)
+            return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+    reset_after = headers.get("X-RateLimit-Reset-After")
+    if reset_after:
+        try:
+            return max(0.0, float(reset_after))
+        except ValueError:
+            pass
+
+    return None
+
+
+_IDEMPOTENT_METHODS: FrozenSet[RequestType] = frozenset((RequestType.GET, RequestType.PUT, RequestType.DELETE))
+
+
+class RetryPolicy:
+    """Decides whether (and when) a failed request made through :func:`_request` is retried.
+
+    Retries wait with exponential backoff and full jitter, unless the response
+    says how long to wait (see :func:`parse_retry_after`). Every retry is withdrawn
+    from the policy's :class:`RetryBudget`.
+
+    Parameters
+    ----------
+    max_attempts: :class:`int`
+        The total number of attempts made, including the first one. Defaults to ``3``.
+    retry_statuses: Collection[:class:`int`]
+        Individual status codes that are retried. Defaults to ``408`` and ``429``.
+    retry_status_classes: Collection[:class:`int`]
+        Status classes (the first digit of the status, ex. ``5`` for 5xx) that are retried. Defaults to ``5``.
+    base_delay: :class:`float`
+        The backoff before the first retry, in seconds. Defaults to ``0.5``.
+    max_delay: :class:`float`
+        The maximum backoff between two attempts, in seconds. Defaults to ``30.0``.
+    multiplier: :class:`float`
+        How much the backoff grows after each attempt. Defaults to ``2.0``.
+    jitter: :class:`bool`
+        Whether to pick a random backoff between ``0`` and the computed backoff. Defaults to ``True``.
+    max_retry_after: :class:`float`
+        The longest server-requested wait (``Retry-After``) that is honoured. If a
+        response asks for longer, the request is not retried. Defaults to ``60.0``.
+    budget: Optional[:class:`RetryBudget`]
+        The retry budget shared by every request using this policy. ``None`` disables the budget.
+        Defaults to a new :class:`RetryBudget`.
+    retry_non_idempotent: :class:`bool`
+        Whether POST and PATCH requests are retried after a timeout or a dropped connection, when the server
+        may already have processed them. Requests that could not connect are always retried. Defaults to ``False``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        retry_statuses: Collection[int] = (408, 429),
+        retry_status_classes: Collection[int] = (5,),
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        max_retry_after: float = 60.0,
+        budget: Optional[RetryBudget] = MISSING,
+        retry_non_idempotent: bool = False,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts: int = max_attempts
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.retry_status_classes: FrozenSet[int] = frozenset(retry_status_classes)
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.multiplier: float = multiplier
+        self.jitter: bool = jitter
+        self.max_retry_after: float = max_retry_after
+        self.budget: Optional[RetryBudget] = RetryBudget() if budget is MISSING else budget
+        self.retry_non_idempotent: bool = retry_non_idempotent
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} max_attempts={self.max_attempts} base_delay={self.base_delay}>"
+
+    def is_retryable(self, status: int) -> bool:
+        """Whether a response with this status should be retried."""
+        return status in self.retry_statuses or status // 100 in self.retry_status_classes
+
+    def can_resend(self, method: RequestType) -> bool:
+        """Whether a request that may have reached the server (it timed out or was disconnected) should be retried."""
+        return self.retry_non_idempotent or method in _IDEMPOTENT_METHODS
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the backoff (in seconds) to wait after the `attempt`-th attempt (starting at 1) failed."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+DEFAULT_RETRY_POLICY: RetryPolicy = RetryPolicy()
+"""The :class:`RetryPolicy` used by :func:`_request` when none is passed."""
+
+
+class RateLimitBucket:
+    """The rate limit state of a single host/route, as reported by its ``X-RateLimit-*`` headers.
+
+    While the limit is unknown (no response has been seen yet), requests are let through.
+    """
+
+    __slots__ = ("limit", "remaining", "reset_at", "window")
+
+    def __init__(self) -> None:
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0.0
+        self.window: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} limit={self.limit} remaining={self.remaining} reset_at={self.reset_at}>"
+
+    def delay(self, now: float) -> float:
+        """Returns how long (in seconds) a request has to wait before it can be made. ``0`` if it can be made now."""
+        if self.reset_at <= now:
+            if self.limit is None or self.window <= 0:
+                return 0.0
+            # the window is over, assume the next one is as long as the last one we saw
+            self.remaining = self.limit
+            self.reset_at = now + self.window
+        if self.remaining is None or self.remaining > 0:
+            return 0.0
+        return self.reset_at - now
+
+    async def acquire(self) -> None:
+        """|coro|
+        Waits until a request can be made without going over the limit, then reserves it.
+        """
+        while True:
+            now = time.monotonic()
+            delay = self.delay(now)
+            if delay <= 0:
+                if self.remaining is not None:
+                    self.remaining -= 1
+                return
+            requests_logger.debug(f"Bucket is exhausted, waiting {delay:.2f} seconds before making a request.")
+            await asyncio.sleep(delay)
+
+    def update(self, headers: Mapping[str, str], *, status: int = 200) -> None:
+        """Updates the bucket from a response's headers. A ``429`` response exhausts the bucket."""
+        now = time.monotonic()
+
+        limit = headers.get("X-RateLimit-Limit")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        reset = headers.get("X-RateLimit-Reset")
+
+        try:
+            reset_at = self.reset_at
+            if reset_after is not None:
+                self.window = float(reset_after)
+                reset_at = now + self.window
+            elif reset is not None:
+                reset_ = float(reset)
+                # some APIs send a unix timestamp, others the number of seconds left
+                self.window = reset_ - time.time() if reset_ > 1e9 else reset_
+                reset_at = now + self.window
+
+            # allow some leeway, APIs tend to round the reset to the second
+            new_window = self.reset_at <= now or reset_at > self.reset_at + 0.5
+            self.reset_at = reset_at
+
+            if limit is not None:
+                self.limit = int(limit)
+            if remaining is not None:
+                remaining_ = int(remaining)
+                if new_window or self.remaining is None:
+                    self.remaining = remaining_
+                else:
+                    # other requests may have been reserved since this one was sent
+                    self.remaining = min(self.remaining, remaining_)
+        except ValueError:
+            requests_logger.debug(f"Ignoring malformed rate limit headers: {dict(headers)}")
+
+        if status == 429:
+            self.remaining = 0
+            retry_after = parse_retry_after(headers)
+            if retry_after is not None:
+                self.reset_at = max(self.reset_at, now + retry_after)
+
+
+_ROUTE_ID_RE = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+class RateLimiter:
+    """Tracks :class:`RateLimitBucket` objects for every host and route requests are made to.
+
+    Before a request is made through :func:`_request`, it waits on its bucket so
+    it isn't sent if it would go over the limit (and get a ``429``). Buckets are
+    updated from the ``X-RateLimit-*`` headers of every response.
+
+    Routes are the request path with numeric path segments (IDs) replaced, so
+    ``/v4/public/guilds/123/discord-to-roblox/456`` and ``/v4/public/guilds/789/discord-to-roblox/012``
+    share a bucket. If the API sends an ``X-RateLimit-Bucket`` header, every
+    route that reports the same bucket shares its state.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, RateLimitBucket] = {}
+        self._route_to_bucket: Dict[str, str] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} buckets={len(self._buckets)}>"
+
+    @staticmethod
+    def route_key(method: Union[str, RequestType], url: Union[str, URL], route: Optional[str] = None) -> str:
+        """Returns the key of the route for a request."""
+        url = URL(url)
+        if route is None:
+            route = _ROUTE_ID_RE.sub("{id}", url.path)
+        return f"{str(method).upper()} {_host_of(url)}{route}"
+
+    def get_bucket(self, route_key: str) -> RateLimitBucket:
+        """Returns the bucket for a route key (see :meth:`route_key`), creating it if it doesn't exist."""
+        bucket_key = self._route_to_bucket.get(route_key, route_key)
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            bucket = self._buckets[bucket_key] = RateLimitBucket()
+        return bucket
+
+    async def acquire(self, route_key: str) -> None:
+        """|coro|
+        Waits until a request to the route can be made without going over its limit.
+        """
+        await self.get_bucket(route_key).acquire()
+
+    def update(self, route_key: str, headers: Mapping[str, str], *, status: int = 200) -> None:
+        """Updates the route's bucket from a response's headers."""
+        bucket_id = headers.get("X-RateLimit-Bucket")
+        if bucket_id:
+            host = route_key.split(" ", 1)[-1].split("/", 1)[0]
+            bucket_key = f"{host} bucket:{bucket_id}"
+            old_key = self._route_to_bucket.get(route_key, route_key)
+            if old_key != bucket_key:
+                self._route_to_bucket[route_key] = bucket_key
+                if bucket_key not in self._buckets:
+                    self._buckets[bucket_key] = self._buckets.pop(old_key, None) or RateLimitBucket()
+        self.get_bucket(route_key).update(headers, status=status)
+
+    def clear(self) -> None:
+        """Forgets every bucket."""
+        self._buckets.clear()
+        self._route_to_bucket.clear()
+
+
+DEFAULT_RATE_LIMITER: RateLimiter = RateLimiter()
+"""The :class:`RateLimiter` shared by every :func:`_request` call that doesn't pass its own."""
+
+
+class BufferedResponse:
+    """A fully read HTTP response, returned for coalesced requests (see :func:`_request`).
+
+    Unlike :class:`aiohttp.ClientResponse`, the body is already in memory, so it can be
+    read any number of times, by any number of callers. The commonly used parts of
+    :class:`aiohttp.ClientResponse` (``status``, ``headers``, :meth:`read`, :meth:`text`,
+    :meth:`json`, ...) are mirrored so it can be used in its place.
+    """
+
+    __slots__ = ("method", "url", "status", "reason", "headers", "request_info", "history", "_body", "_encoding")
+
+    def __init__(
+        self,
+        *,
+        method: str,
+        url: URL,
+        status: int,
+        reason: Optional[str],
+        headers: CIMultiDictProxy[str],
+        request_info: aiohttp.RequestInfo,
+        history: Tuple[aiohttp.ClientResponse, ...],
+        body: bytes,
+        encoding: Optional[str] = None,
+    ) -> None:
+        self.method: str = method
+        self.url: URL = url
+        self.status: int = status
+        self.reason: Optional[str] = reason
+        self.headers: CIMultiDictProxy[str] = headers
+        self.request_info: aiohttp.RequestInfo = request_info
+        self.history: Tuple[aiohttp.ClientResponse, ...] = history
+        self._body: bytes = body
+        self._encoding: Optional[str] = encoding
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} [{self.status} {self.reason}] {self.url} ({len(self._body)} bytes)>"
+
+    @classmethod
+    async def from_response(cls, response: aiohttp.ClientResponse) -> BufferedResponse:
+        """|coro|
+        Reads the body of `response` (releasing its connection) and returns it as a :class:`BufferedResponse`.
+        """
+        body = await response.read()
+        return cls(
+            method=response.method,
+            url=response.url,
+            status=response.status,
+            reason=response.reason,
+            headers=response.headers,
+            request_info=response.request_info,
+            history=response.history,
+            body=body,
+            encoding=response.charset,
+        )
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("Content-Type", "application/octet-stream").split(";", 1)[0].strip()
+
+    @property
+    def charset(self) -> Optional[str]:
+        return self._encoding
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise aiohttp.ClientResponseError(
+                self.request_info,
+                self.history,
+                status=self.status,
+                message=self.reason or "",
+                headers=self.headers,
+            )
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: Optional[str] = None, errors: str = "strict") -> str:
+        return self._body.decode(encoding or self._encoding or "utf-8", errors)
+
+    async def json(self, *, loads: Callable[[str], Any] = from_json, **kwargs: Any) -> Any:
+        return loads(await self.text())
+
+    def release(self) -> None:
+        # nothing to release, the connection was released when the body was read
+        return None
+
+    def close(self) -> None:
+        return None
+
+    async def __aenter__(self) -> BufferedResponse:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+
+_in_flight: Dict[Tuple[Any, ...], asyncio.Future[BufferedResponse]] = {}
+
+
+def _coalesce_key(request: _PreparedRequest) -> Tuple[Any, ...]:
+    params = request.kwargs.get("params")
+    if isinstance(params, Mapping):
+        params = tuple(sorted((str(k), str(v)) for k, v in params.items()))
+    elif params is not None and not isinstance(params, str):
+        params = tuple((str(k), str(v)) for k, v in params)
+
+    authorization = CIMultiDict(request.kwargs.get("headers") or {}).get("Authorization")
+    return (str(request.method), str(URL(request.url)), params, authorization, tuple(id(s) for s in request.sessions))
+
+
+def _forget_in_flight(key: Tuple[Any, ...], task: asyncio.Future[BufferedResponse]) -> None:
+    _in_flight.pop(key, None)
+    # every waiter may have been cancelled, don't warn about the exception never being retrieved
+    if not task.cancelled():
+        task.exception()
+
+
+async def _send_buffered(request: _PreparedRequest) -> BufferedResponse:
+    response = await _send(request)
+    return await BufferedResponse.from_response(response)
+
+
+def _parse_cache_control(header: Optional[str]) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    if not header:
+        return directives
+    for part in header.split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') if value else None
+    return directives
+
+
+class CachedResponse:
+    """A response stored in a :class:`HTTPCache`, along with the information needed to revalidate it."""
+
+    __slots__ = (
+        "url",
+        "status",
+        "reason",
+        "headers",
+        "body",
+        "charset",
+        "fresh_until",
+        "stale_until",
+        "etag",
+        "last_modified",
+    )
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        status: int,
+        reason: Optional[str],
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        charset: Optional[str],
+        fresh_until: float,
+        stale_until: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        self.url: str = url
+        self.status: int = status
+        self.reason: Optional[str] = reason
+        self.headers: List[Tuple[str, str]] = headers
+        self.body: bytes = body
+        self.charset: Optional[str] = charset
+        self.fresh_until: float = fresh_until
+        self.stale_until: float = stale_until
+        self.etag: Optional[str] = etag
+        self.last_modified: Optional[str] = last_modified
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} url={self.url} status={self.status} fresh_until={self.fresh_until}>"
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.fresh_until
+
+    def is_usable_stale(self, now: float) -> bool:
+        """Whether the response is stale but may still be served while it is revalidated."""
+        return self.fresh_until <= now < self.stale_until
+
+    @property
+    def can_revalidate(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """The headers to send to revalidate the response."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, method: str = "GET") -> BufferedResponse:
+        url = URL(self.url)
+        headers = CIMultiDictProxy(CIMultiDict(self.headers))
+        return BufferedResponse(
+            method=method,
+            url=url,
+            status=self.status,
+            reason=self.reason,
+            headers=headers,
+            request_info=aiohttp.RequestInfo(url, method, CIMultiDictProxy(CIMultiDict()), url),
+            history=(),
+            body=self.body,
+            encoding=self.charset,
+        )
+
+    def to_bytes(self) -> bytes:
+        meta = {name: getattr(self, name) for name in self.__slots__ if name != "body"}
+        return to_json(meta).encode() + b"\n" + self.body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> CachedResponse:
+        meta, _, body = data.partition(b"\n")
+        kwargs = from_json(meta.decode())
+        kwargs["headers"] = [tuple(h) for h in kwargs["headers"]]
+        return cls(body=body, **kwargs)
+
+
+class HTTPCache:
+    """A cache of GET responses for :func:`_request`, enabled with ``cache=True``.
+
+    Responses are kept in an in-memory :class:`LRUCache` and, if `path` is given, in
+    a directory on disk so they survive restarts. How long a response is fresh
+    is taken from its ``Cache-Control: max-age`` (or ``Expires``) header, falling back to `default_ttl`.
+    ``no-store`` responses are never cached, ``no-cache`` responses are always revalidated.
+
+    Stale responses with an ``ETag`` or ``Last-Modified`` header are revalidated with
+    ``If-None-Match``/``If-Modified-Since``, so an unchanged body isn't downloaded again.
+    During the ``stale-while-revalidate`` window (from the response, else `stale_while_revalidate`)
+    the stale response is returned straight away and revalidated in the background.
+
+    Parameters
+    ----------
+    max_entries: :class:`int`
+        The maximum number of responses kept in memory. Defaults to ``512``.
+    default_ttl: :class:`float`
+        How long (in seconds) responses without caching headers are fresh. Defaults to ``60.0``.
+    stale_while_revalidate: :class:`float`
+        How long (in seconds) a stale response may be served while it is revalidated, if the
+        response doesn't say. Defaults to ``0``.
+    max_body_size: :class:`int`
+        Responses with a larger body (in bytes) are not cached. Defaults to 1 MiB.
+    path: Optional[Union[:class:`str`, :class:`pathlib.Path`]]
+        A directory to also store responses in. Defaults to ``None`` (memory only).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 512,
+        default_ttl: float = 60.0,
+        stale_while_revalidate: float = 0.0,
+        max_body_size: int = 1024 * 1024,
+        path: Optional[Union[str, pathlib.Path]] = None,
+    ) -> None:
+        self.default_ttl: float = default_ttl
+        self.stale_while_revalidate: float = stale_while_revalidate
+        self.max_body_size: int = max_body_size
+        self.path: Optional[pathlib.Path] = pathlib.Path(path) if path is not None else None
+
+        self._memory: LRUCache[str, CachedResponse] = LRUCache(max_entries)
+        self._revalidating: Dict[str, asyncio.Task[Any]] = {}
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.stale_hits: int = 0
+        self.revalidations: int = 0
+        self.revalidations_unchanged: int = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} entries={len(self._memory)} path={self.path}>"
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the cache's counters.
+
+        ``hits`` are fresh responses served from the cache, ``stale_hits`` stale responses served while
+        being revalidated, ``misses`` requests that had to be downloaded, ``revalidations`` conditional requests
+        sent and ``revalidations_unchanged`` the ones that got ``304 Not Modified`` back.
+        """
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "revalidations_unchanged": self.revalidations_unchanged,
+            "entries": len(self._memory),
+        }
+
+    @staticmethod
+    def make_key(url: str, kwargs: Dict[str, Any]) -> str:
+        params = kwargs.get("params")
+        if isinstance(params, Mapping):
+            params = sorted((str(k), str(v)) for k, v in params.items())
+        authorization = CIMultiDict(kwargs.get("headers") or {}).get("Authorization")
+        raw = to_json([str(URL(url)), str(params), authorization])
+        # the authorization header is hashed so it's never written to disk
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _disk_path(self, key: str) -> pathlib.Path:
+        assert self.path is not None
+        return self.path / f"{key}.cache"
+
+    def _read_disk(self, key: str) -> Optional[CachedResponse]:
+        try:
+            return CachedResponse.from_bytes(self._disk_path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError, KeyError):
+            requests_logger.warning(f"Ignoring corrupt HTTP cache entry {key}.")
+            return None
+
+    def _write_disk(self, key: str, entry: CachedResponse) -> None:
+        assert self.path is not None
+        self.path.mkdir(parents=True, exist_ok=True)
+        final = self._disk_path(key)
+        temp = final.with_suffix(".tmp")
+        temp.write_bytes(entry.to_bytes())
+        # atomically move the file
+        temp.replace(final)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """|coro|
+        Returns the stored response for `key`, checking the disk if it isn't in memory.
+        """
+        entry = self._memory.get(key)
+        if entry is None and self.path is not None:
+            entry = await asyncio.to_thread(self._read_disk, key)
+            if entry is not None:
+                self._memory[key] = entry
+        return entry
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        """|coro|
+        Stores a response for `key`.
+        """
+        self._memory[key] = entry
+        if self.path is not None:
+            await asyncio.to_thread(self._write_disk, key, entry)
+
+    async def delete(self, key: str) -> None:
+        """|coro|
+        Removes the stored response for `key`, if there is one.
+        """
+        try:
+            del self._memory[key]
+        except KeyError:
+            pass
+        if self.path is not None:
+            await asyncio.to_thread(self._disk_path(key).unlink, missing_ok=True)
+
+    def clear(self) -> None:
+        """Removes every response stored in memory. Responses stored on disk are kept."""
+        self._memory.clear()
+
+    def build_entry(self, response: BufferedResponse, *, previous: Optional[CachedResponse] = None) -> Optional[CachedResponse]:
+        """Builds the entry to store for `response`, or returns ``None`` if it must not be cached.
+
+        If `response` is a ``304 Not Modified``, `previous` is refreshed with its headers instead.
+        """
+        directives = _parse_cache_control(response.headers.get("Cache-Control"))
+        if "no-store" in directives:
+            return None
+
+        now = time.time()
+        ttl = self.default_ttl
+        if "no-cache" in directives:
+            ttl = 0.0
+        elif directives.get("max-age") is not None:
+            try:
+                ttl = max(0.0, float(directives["max-age"]))  # type: ignore
+            except ValueError:
+                pass
+        elif response.headers.get("Expires"):
+            try:
+                expires = email.utils.parsedate_to_datetime(response.headers["Expires"])
+                ttl = max(0.0, expires.timestamp() - now)
+            except (TypeError, ValueError, IndexError):
+                ttl = 0.0
+
+        swr = self.stale_while_revalidate
+        if directives.get("stale-while-revalidate") is not None:
+            try:
+                swr = max(0.0, float(directives["stale-while-revalidate"]))  # type: ignore
+            except ValueError:
+                pass
+
+        if response.status == 304 and previous is not None:
+            body, status, reason, charset = previous.body, previous.status, previous.reason, previous.charset
+            headers = CIMultiDict(previous.headers)
+            # a 304 only carries the headers that changed
+            for name in ("Cache-Control", "Expires", "ETag", "Last-Modified", "Date"):
+                if name in response.headers:
+                    headers[name] = response.headers[name]
+        else:
+            body, status, reason, charset = response._body, response.status, response.reason, response.charset
+            headers = CIMultiDict(response.headers)
+            if len(body) > self.max_body_size:
+                return None
+
+        return CachedResponse(
+            url=str(response.url),
+            status=status,
+            reason=reason,
+            headers=list(headers.items()),
+            body=body,
+            charset=charset,
+            fresh_until=now + ttl,
+            stale_until=now + ttl + swr,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+
+
+DEFAULT_HTTP_CACHE: HTTPCache = HTTPCache()
+"""The :class:`HTTPCache` used when ``cache=True`` is passed to :func:`_request`."""
+
+
+class CircuitOpenError(aiohttp.ClientConnectionError):
+    """Raised by :func:`_request` instead of making a request to a host whose circuit is open.
+
+    Subclass of :class:`aiohttp.ClientConnectionError`.
+
+    Attributes
+    ----------
+    host: :class:`str`
+        The host that is failing.
+    retry_after: :class:`float`
+        How long (in seconds) until requests to the host are tried again.
+    """
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        self.host: str = host
+        self.retry_after: float = retry_after
+        super().__init__(f"Circuit for {host} is open, not retrying for {retry_after:.2f} seconds.")
+
+
+class _HostCircuit:
+    __slots__ = ("state", "outcomes", "opened_at", "trial_calls")
+
+    def __init__(self) -> None:
+        self.state: CircuitState = CircuitState.closed
+        self.outcomes: Deque[Tuple[float, bool]] = deque()
+        self.opened_at: float = 0.0
+        self.trial_calls: int = 0
+
+
+class CircuitBreaker:
+    """Stops requests to a host that keeps failing, so callers fail fast instead of waiting through their retries.
+
+    Every host starts :attr:`~CircuitState.closed`. Once at least `minimum_calls` requests were made to it in
+    the last `window` seconds and at least `failure_threshold` of them failed (connection errors, timeouts or 5xx
+    responses), it is :attr:`~CircuitState.open` and requests raise :class:`CircuitOpenError` without being sent.
+    After `cooldown` seconds it is :attr:`~CircuitState.half_open`: up to `half_open_max_calls` requests are let through,
+    and the first one to finish closes the circuit again (if it succeeded) or re-opens it.
+
+    Parameters
+    ----------
+    failure_threshold: :class:`float`
+        The failure rate (between ``0`` and ``1``) at which the circuit opens. Defaults to ``0.5``.
+    minimum_calls: :class:`int`
+        The number of requests needed in the window before the failure rate is looked at. Defaults to ``10``.
+    window: :class:`float`
+        How far back (in seconds) requests are counted. Defaults to ``60.0``.
+    cooldown: :class:`float`
+        How long (in seconds) the circuit stays open. Defaults to ``30.0``.
+    half_open_max_calls: :class:`int`
+        How many trial requests are let through while half-open. Defaults to ``1``.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window: float = 60.0,
+        cooldown: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        self.failure_threshold: float = failure_threshold
+        self.minimum_calls: int = minimum_calls
+        self.window: float = window
+        self.cooldown: float = cooldown
+        self.half_open_max_calls: int = half_open_max_calls
+        self._circuits: Dict[str, _HostCircuit] = defaultdict(_HostCircuit)
+
+    def __repr__(self) -> str:
+        open_ = sum(c.state is not CircuitState.closed for c in self._circuits.values())
+        return f"<{self.__class__.__name__} hosts={len(self._circuits)} open={open_}>"
+
+    def state(self, host: str) -> CircuitState:
+        """Returns the current state of the circuit for `host`."""
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            return CircuitState.closed
+        if circuit.state is CircuitState.open and time.monotonic() - circuit.opened_at >= self.cooldown:
+            return CircuitState.half_open
+        return circuit.state
+
+    def before_request(self, host: str) -> None:
+        """Called before a request is made to `host`.
+
+        Raises
+        ------
+        :class:`CircuitOpenError`
+            The circuit for `host` is open (or half-open with no trial requests left).
+        """
+        circuit = self._circuits[host]
+        if circuit.state is CircuitState.closed:
+            return
+
+        now = time.monotonic()
+        retry_after = circuit.opened_at + self.cooldown - now
+        if circuit.state is CircuitState.open:
+            if retry_after > 0:
+                raise CircuitOpenError(host, retry_after)
+            circuit.state = CircuitState.half_open
+            circuit.trial_calls = 0
+            requests_logger.info(f"Circuit for {host} is half-open, letting a trial request through.")
+
+        if circuit.trial_calls >= self.half_open_max_calls:
+            raise CircuitOpenError(host, max(retry_after, 0.0))
+        circuit.trial_calls += 1
+
+    def _record(self, host: str, success: bool) -> None:
+        circuit = self._circuits[host]
+        now = time.monotonic()
+
+        if circuit.state is CircuitState.half_open:
+            circuit.trial_calls = max(0, circuit.trial_calls - 1)
+            circuit.outcomes.clear()
+            if success:
+                circuit.state = CircuitState.closed
+                requests_logger.info(f"Circuit for {host} is closed again.")
+            else:
+                circuit.state = CircuitState.open
+                circuit.opened_at = now
+                requests_logger.warning(f"Trial request to {host} failed, circuit is open again.")
+            return
+
+        circuit.outcomes.append((now, success))
+        cutoff = now - self.window
+        while circuit.outcomes and circuit.outcomes[0][0] < cutoff:
+            circuit.outcomes.popleft()
+
+        if circuit.state is CircuitState.closed and len(circuit.outcomes) >= self.minimum_calls:
+            failures = sum(not ok for _, ok in circuit.outcomes)
+            if failures / len(circuit.outcomes) >= self.failure_threshold:
+                circuit.state = CircuitState.open
+                circuit.opened_at = now
+                requests_logger.warning(
+                    f"Circuit for {host} is open: {failures}/{len(circuit.outcomes)} requests failed in the last {self.window} seconds."
+                )
+
+    def record_success(self, host: str) -> None:
+        """Records a request to `host` that got a response."""
+        self._record(host, True)
+
+    def record_failure(self, host: str) -> None:
+        """Records a request to `host` that failed (connection error, timeout or 5xx response)."""
+        self._record(host, False)
+
+    def release(self, host: str) -> None:
+        """Gives back a half-open trial call without recording its outcome (ex. the request was cancelled)."""
+        circuit = self._circuits[host]
+        if circuit.state is CircuitState.half_open:
+            circuit.trial_calls = max(0, circuit.trial_calls - 1)
+
+    def reset(self, host: Optional[str] = None) -> None:
+        """Closes the circuit for `host`, or every circuit if no host is given."""
+        if host is None:
+            self._circuits.clear()
+        else:
+            self._circuits.pop(host, None)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the state of every known host's circuit, for dashboards and debugging.
+
+        Returns
+        -------
+        Dict[:class:`str`, Dict[:class:`str`, Any]]
+            A mapping of host to its ``state``, the ``calls`` and ``failures`` in the window,
+            the ``failure_rate`` and, if it's open, how many seconds are left (``retry_after``).
+        """
+        now = time.monotonic()
+        snapshot = {}
+        for host, circuit in self._circuits.items():
+            failures = sum(not ok for _, ok in circuit.outcomes)
+            calls = len(circuit.outcomes)
+            state = self.state(host)
+            snapshot[host] = {
+                "state": state.name,
+                "calls": calls,
+                "failures": failures,
+                "failure_rate": failures / calls if calls else 0.0,
+                "retry_after": max(0.0, circuit.opened_at + self.cooldown - now) if state is CircuitState.open else 0.0,
+            }
+        return snapshot
+
+
+DEFAULT_CIRCUIT_BREAKER: CircuitBreaker = CircuitBreaker()
+"""The :class:`CircuitBreaker` shared by every :func:`_request` call that doesn't pass its own."""
+
+
+class _PreparedRequest:
+    """Everything :func:`_request` resolved from its arguments, passed along to the helpers that send it."""
+
+    __slots__ = (
+        "method",
+        "url",
+        "host",
+        "sessions",
+        "policy",
+        "rate_limiter",
+        "route_key",
+        "circuit_breaker",
+        "metrics",
+        "kwargs",
+    )
+
+    def __init__(
+        self,
+        method: RequestType,
+        url: str,
+        *,
+        sessions: List[aiohttp.ClientSession],
+        policy: RetryPolicy,
+        rate_limiter: Optional[RateLimiter],
+        route_key: str,
+        circuit_breaker: Optional[CircuitBreaker],
+        metrics: Optional[HTTPMetrics],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        self.method: RequestType = method
+        self.url: str = url
+        self.host: str = _host_of(url)
+        self.sessions: List[aiohttp.ClientSession] = sessions
+        self.policy: RetryPolicy = policy
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.route_key: str = route_key
+        self.circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
+        self.metrics: Optional[HTTPMetrics] = metrics
+        self.kwargs: Dict[str, Any] = kwargs
+
+    def with_headers(self, headers: Dict[str, str]) -> _PreparedRequest:
+        """Returns a copy of the request with extra headers."""
+        kwargs = dict(self.kwargs)
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), **headers}
+        return _PreparedRequest(
+            self.method,
+            self.url,
+            sessions=self.sessions,
+            policy=self.policy,
+            rate_limiter=self.rate_limiter,
+            route_key=self.route_key,
+            circuit_breaker=self.circuit_breaker,
+            metrics=self.metrics,
+            kwargs=kwargs,
+        )
+
+
 async def _request(
     _method: Union[str, RequestType], /, url: str, **kwargs
-) -> aiohttp.ClientResponse:
-    """Performs a GET request on the given URL."""
+) -> Union[aiohttp.ClientResponse, BufferedResponse]:
+    """Performs a request on the given URL.
+
+    Unless `session` or `sessions` are passed, the request is made with a pooled
+    session from `pool` (or the process-wide pool from :func:`get_session_pool`).
+
+    Failed requests are retried according to `retry_policy` (defaults to :data:`DEFAULT_RETRY_POLICY`).
+
+    Requests wait on their bucket in `rate_limiter` (defaults to :data:`DEFAULT_RATE_LIMITER`, ``None`` disables it)
+    so they aren't sent if they would be rate limited. `route` can be passed to override the route the bucket is keyed on.
+
+    Every attempt is recorded in `metrics` (defaults to the :attr:`SessionPool.metrics` of the pool the request
+    is made from, or :data:`DEFAULT_HTTP_METRICS` with an explicit `session`, ``None`` disables it).
+
+    Requests to a host that keeps failing raise :class:`CircuitOpenError` straight away, see :class:`CircuitBreaker`.
+    `circuit_breaker` defaults to :data:`DEFAULT_CIRCUIT_BREAKER`, ``None`` disables it.
+
+    If `coalesce` is ``True`` (GET requests only), identical requests (same URL, params and ``Authorization`` header)
+    made while one is already in flight share its result. Coalesced requests return a :class:`BufferedResponse`.
+
+    If `cache` is ``True`` (or a :class:`HTTPCache`), GET responses are served from (and stored in)
+    :data:`DEFAULT_HTTP_CACHE` (or the given cache), see :class:`HTTPCache`. Cached requests return a :class:`BufferedResponse`.
+    """
     method: RequestType
     if isinstance(_method, str):
         method = RequestType(_method.upper())
@@ -38,108 +1500,626 @@ async def _request(
     rover = kwargs.pop("rover", False)
     bloxlink = kwargs.pop("bloxlink", False)
     
+    pool: Optional[SessionPool] = kwargs.pop("pool", None)
+    policy: RetryPolicy = kwargs.pop("retry_policy", None) or DEFAULT_RETRY_POLICY
+    rate_limiter: Optional[RateLimiter] = kwargs.pop("rate_limiter", DEFAULT_RATE_LIMITER)
+    circuit_breaker: Optional[CircuitBreaker] = kwargs.pop("circuit_breaker", DEFAULT_CIRCUIT_BREAKER)
+    route_key = RateLimiter.route_key(method, url, kwargs.pop("route", None))
+    coalesce: bool = kwargs.pop("coalesce", False)
+    cache: Union[bool, HTTPCache] = kwargs.pop("cache", False)
+
     if 'session' in kwargs.keys() or 'sessions' in kwargs.keys():
-        CUSTOM_SESSIONS = True
         SESSIONS = [kwargs.pop('session', None)] if 'session' in kwargs.keys() else kwargs.pop('sessions', None)
     else:
-        CUSTOM_SESSIONS = False
-        SESSIONS = [aiohttp.ClientSession() for _ in range(3)]
+        # the pooled session is reused for every attempt, it is never closed here
+        pool = pool or get_session_pool()
+        SESSIONS = [pool.get_session(url)]
+
+    # attempts are recorded in the metrics of the pool that makes them
+    metrics: Optional[HTTPMetrics] = kwargs.pop("metrics", pool.metrics if pool is not None else DEFAULT_HTTP_METRICS)
 
     if rover:
-        kwargs["headers"] = {"Authorization": f"Bearer {ROVER_API_KEY}"}
+        kwargs["headers"] = {"Authorization": f"Bearer {get_settings().rover_api_key}"}
 
     if bloxlink:
-        kwargs["headers"] = {"Authorization": f"{BLOXLINK_API_KEY}"}
+        kwargs["headers"] = {"Authorization": f"{get_settings().bloxlink_api_key}"}
+
+    request = _PreparedRequest(
+        method,
+        url,
+        sessions=SESSIONS,
+        policy=policy,
+        rate_limiter=rate_limiter,
+        route_key=route_key,
+        circuit_breaker=circuit_breaker,
+        metrics=metrics,
+        kwargs=kwargs,
+    )
+
+    http_cache: Optional[HTTPCache] = None
+    if cache and method is RequestType.GET:
+        http_cache = DEFAULT_HTTP_CACHE if cache is True else cache
+
+    if http_cache is None:
+        return await _fetch(request, coalesce=coalesce)
 
-    tr = 0
+    key = http_cache.make_key(url, kwargs)
+    entry = await http_cache.get(key)
+    now = time.time()
 
-    for tr in range(len(SESSIONS)): # cannot close all sesisons in the list if we are iterating through it
-        session = SESSIONS[tr]
+    if entry is not None and entry.is_fresh(now):
+        http_cache.hits += 1
+        return entry.to_response(str(method))
+
+    if entry is not None and entry.is_usable_stale(now):
+        http_cache.stale_hits += 1
+        if key not in http_cache._revalidating:
+            task = asyncio.ensure_future(_fetch_cached(http_cache, key, entry, request, coalesce=coalesce))
+            http_cache._revalidating[key] = task
+            task.add_done_callback(functools.partial(_forget_revalidation, http_cache, key))
+        return entry.to_response(str(method))
+
+    http_cache.misses += 1
+    return await _fetch_cached(http_cache, key, entry, request, coalesce=coalesce)
+
+
+async def _fetch(
+    request: _PreparedRequest, *, coalesce: bool = False, buffered: bool = False
+) -> Union[aiohttp.ClientResponse, BufferedResponse]:
+    """Makes the request for :func:`_request`, joining an identical in-flight request if `coalesce` is ``True``."""
+    if coalesce and request.method is RequestType.GET:
+        key = _coalesce_key(request)
+        task = _in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(_send_buffered(request))
+            _in_flight[key] = task
+            task.add_done_callback(functools.partial(_forget_in_flight, key))
+        else:
+            requests_logger.debug(f"[{request.method}] Joining in-flight request to {request.url}")
+        # a cancelled caller must not cancel the request for everyone else
+        return await asyncio.shield(task)
+
+    if buffered:
+        return await _send_buffered(request)
+    return await _send(request)
+
+
+async def _fetch_cached(
+    http_cache: HTTPCache,
+    key: str,
+    entry: Optional[CachedResponse],
+    request: _PreparedRequest,
+    *,
+    coalesce: bool = False,
+) -> BufferedResponse:
+    """Downloads (or revalidates `entry`) and stores the response in `http_cache`."""
+    if entry is not None and entry.can_revalidate:
+        http_cache.revalidations += 1
+        request = request.with_headers(entry.conditional_headers())
+
+    response = await _fetch(request, coalesce=coalesce, buffered=True)
+    assert isinstance(response, BufferedResponse)
+
+    not_modified = response.status == 304 and entry is not None
+    if not_modified:
+        http_cache.revalidations_unchanged += 1
+
+    if response.status == 200 or not_modified:
+        new_entry = http_cache.build_entry(response, previous=entry)
+        if new_entry is None:
+            await http_cache.delete(key)
+        else:
+            await http_cache.set(key, new_entry)
+        if not_modified:
+            return (new_entry or entry).to_response(str(request.method))  # type: ignore
+    return response
+
+
+def _forget_revalidation(http_cache: HTTPCache, key: str, task: asyncio.Future[Any]) -> None:
+    http_cache._revalidating.pop(key, None)
+    if not task.cancelled() and task.exception() is not None:
+        requests_logger.warning(f"Failed to revalidate cached response {key}: {task.exception()!r}")
+
+
+async def _send(prepared: _PreparedRequest) -> aiohttp.ClientResponse:
+    """Makes the request (with retries) for :func:`_request`. Returns the first successful response."""
+    method, url, host, policy = prepared.method, prepared.url, prepared.host, prepared.policy
+    rate_limiter, circuit_breaker, metrics = prepared.rate_limiter, prepared.circuit_breaker, prepared.metrics
+
+    if policy.budget is not None:
+        policy.budget.record_request(host)
+
+    last_error: Optional[BaseException] = None
+    attempt = 0
+
+    for attempt in range(1, policy.max_attempts + 1):
+        session = prepared.sessions[(attempt - 1) % len(prepared.sessions)]
         request = method.get_method_callable(session)
 
+        # an open circuit fails fast instead of waiting for (and using up) a rate limit slot first
+        if circuit_breaker is not None:
+            circuit_breaker.before_request(host)
+
+        if rate_limiter is not None:
+            try:
+                await rate_limiter.acquire(prepared.route_key)
+            except BaseException:
+                if circuit_breaker is not None:
+                    circuit_breaker.release(host)
+                raise
+
+        started_at = time.perf_counter()
         try:
-            response = await request(url, **kwargs)
-        except aiohttp.ServerDisconnectedError:
-            requests_logger.warning(f"Server disconnected on session {tr}.")
-            # await asyncio.sleep(5)
-            continue
-
-        status = response.status
-        status_ = HTTPCode(status)
-        requests_logger.info(
-            f"[{method}] {status} {status_.name} from {response.url} (Session {tr})"
-        )
+            response = await request(url, **prepared.kwargs)
+        except (aiohttp.ServerDisconnectedError, aiohttp.ClientConnectorError, asyncio.TimeoutError) as e:
+            if metrics is not None:
+                metrics.record_error(prepared.route_key, host, e, time.perf_counter() - started_at)
+            if circuit_breaker is not None:
+                circuit_breaker.record_failure(host)
+            requests_logger.warning(f"[{method}] {e.__class__.__name__} from {url} (Attempt {attempt}).")
+            last_error = e
+            if not isinstance(e, aiohttp.ClientConnectorError) and not policy.can_resend(method):
+                requests_logger.info(f"[{method}] The server may have processed the request already. Not retrying.")
+                break
+            delay = policy.backoff(attempt)
+        except aiohttp.ClientError as e:
+            if metrics is not None:
+                metrics.record_error(prepared.route_key, host, e, time.perf_counter() - started_at)
+            if circuit_breaker is not None:
+                circuit_breaker.record_failure(host)
+            raise
+        except BaseException:
+            # cancelled, or not the host's fault
+            if circuit_breaker is not None:
+                circuit_breaker.release(host)
+            raise
+        else:
+            status = response.status
+            if metrics is not None:
+                metrics.record_response(prepared.route_key, host, status, time.perf_counter() - started_at)
+            status_ = HTTPCode(status)
+            requests_logger.info(
+                f"[{method}] {status} {status_.name} from {response.url} (Attempt {attempt})"
+            )
 
-        if status_.is_2xx:
-            if not CUSTOM_SESSIONS:
-                for s in SESSIONS:
-                    await s.close()
-            return response
-
-        if status_.is_1xx:
-            requests_logger.info("Got a 1__ Continue, Retrying request...")
-        elif status_.is_3xx:
-            requests_logger.info("Got a 3__ Redirect. Retrying request...")
-        elif status_.is_4xx:
-            if status == 429:
-                retry_after = response.headers.get("Retry-After", None)
-                if not retry_after:
-                    retry_after = response.headers.get("X-Ratelimit-Remaining", None)
-
-                if retry_after:
-                    requests_logger.info(
-                        f"We are being rate limited. Retrying in {retry_after} seconds."
-                    )
-                    await asyncio.sleep(retry_after)
+            if circuit_breaker is not None:
+                if status_.is_5xx:
+                    circuit_breaker.record_failure(host)
                 else:
-                    requests_logger.info(
-                        "We are being rate limited but no Retry-After header was found. Retrying in 5 seconds."
-                    )
-                    await asyncio.sleep(5)
-            else:
-                requests_logger.info("Got a 4__ Client Error.")
+                    circuit_breaker.record_success(host)
+
+            if rate_limiter is not None:
+                rate_limiter.update(prepared.route_key, response.headers, status=status)
+
+            # a 304 can only be the answer to a conditional request, let the caller handle it
+            if status_.is_2xx or status == 304:
+                return response
+
+            # give the connection back to the pool, the body is never read
+            response.release()
+
+            if not policy.is_retryable(status):
                 raise aiohttp.ClientResponseError(
                     response.request_info,
                     response.history,
                     status=status,
-                    message=response.reason,
+                    message=response.reason or "",
                     headers=response.headers,
                 )
-        elif status_.is_5xx:
-            requests_logger.info("Got a 5__ Server Error. Retrying request...")
-        else:
-            requests_logger.warning(
-                f"Got an unknown status code {status}. Retrying request..."
+
+            last_error = aiohttp.ClientResponseError(
+                response.request_info,
+                response.history,
+                status=status,
+                message=response.reason or "",
+                headers=response.headers,
             )
+            retry_after = parse_retry_after(response.headers)
+            if retry_after is None:
+                delay = policy.backoff(attempt)
+            elif retry_after > policy.max_retry_after:
+                requests_logger.info(
+                    f"We are being asked to wait {retry_after:.2f} seconds, which is longer than allowed. Not retrying."
+                )
+                break
+            else:
+                delay = retry_after
+
+        if attempt == policy.max_attempts:
+            break
+
+        if policy.budget is not None and not policy.budget.try_acquire(host):
+            requests_logger.warning(f"Retry budget for {host} is exhausted. Not retrying.")
+            break
 
-        if not CUSTOM_SESSIONS:
-            await session.close()
+        if metrics is not None:
+            metrics.record_retry(host)
+        requests_logger.info(f"Retrying request in {delay:.2f} seconds...")
+        await asyncio.sleep(delay)
 
     raise aiohttp.ClientConnectionError(
-        f"Failed to get a 2__ Success response after {tr} tries."
-    )
+        f"Failed to get a 2__ Success response after {attempt} tries."
+    ) from last_error
 
 
-async def _get(url: str, **kwargs) -> aiohttp.ClientResponse:
+async def _get(url: str, **kwargs) -> Union[aiohttp.ClientResponse, BufferedResponse]:
     """Performs a GET request on the given URL."""
     return await _request(RequestType.GET, url, **kwargs)
 
 
-async def _post(url: str, **kwargs) -> aiohttp.ClientResponse:
+async def _post(url: str, **kwargs) -> Union[aiohttp.ClientResponse, BufferedResponse]:
     """Performs a POST request on the given URL."""
     return await _request(RequestType.POST, url, **kwargs)
 
 
-async def _patch(url: str, **kwargs) -> aiohttp.ClientResponse:
+async def _patch(url: str, **kwargs) -> Union[aiohttp.ClientResponse, BufferedResponse]:
     """Performs a PATCH request on the given URL."""
     return await _request(RequestType.PATCH, url, **kwargs)
 
 
-async def _put(url: str, **kwargs) -> aiohttp.ClientResponse:
+async def _put(url: str, **kwargs) -> Union[aiohttp.ClientResponse, BufferedResponse]:
     """Performs a PUT request on the given URL."""
     return await _request(RequestType.PUT, url, **kwargs)
 
 
-async def _delete(url: str, **kwargs) -> aiohttp.ClientResponse:
+async def _delete(url: str, **kwargs) -> Union[aiohttp.ClientResponse, BufferedResponse]:
     """Performs a DELETE request on the given URL."""
     return await _request(RequestType.DELETE, url, **kwargs)
+
+
+class RequestResult:
+    """The outcome of a single request made by :func:`gather_requests`.
+
+    Attributes
+    ----------
+    index: :class:`int`
+        The position of the request in the iterable passed to :func:`gather_requests`.
+    method: :class:`RequestType`
+        The method of the request.
+    url: :class:`str`
+        The URL of the request.
+    response: Optional[Union[:class:`BufferedResponse`, :class:`aiohttp.ClientResponse`]]
+        The response, if the request succeeded.
+    error: Optional[:class:`Exception`]
+        The exception raised by the request, if it failed.
+    """
+
+    __slots__ = ("index", "method", "url", "response", "error")
+
+    def __init__(
+        self,
+        index: int,
+        method: RequestType,
+        url: str,
+        *,
+        response: Optional[Union[aiohttp.ClientResponse, BufferedResponse]] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.index: int = index
+        self.method: RequestType = method
+        self.url: str = url
+        self.response: Optional[Union[aiohttp.ClientResponse, BufferedResponse]] = response
+        self.error: Optional[Exception] = error
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error is not None else f"status={self.response.status}"  # type: ignore
+        return f"<{self.__class__.__name__} index={self.index} [{self.method}] {self.url} {outcome}>"
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> Union[aiohttp.ClientResponse, BufferedResponse]:
+        """Returns the response, or raises the exception if the request failed."""
+        if self.error is not None:
+            raise self.error
+        return self.response  # type: ignore
+
+
+RequestLike = Union[str, Tuple[Union[str, RequestType], str], Tuple[Union[str, RequestType], str, Dict[str, Any]]]
+
+
+def _normalize_request(request: RequestLike) -> Tuple[RequestType, str, Dict[str, Any]]:
+    if isinstance(request, str):
+        return RequestType.GET, request, {}
+
+    method, url, *rest = request
+    if isinstance(method, str):
+        method = RequestType(method.upper())
+    return method, url, dict(rest[0]) if rest else {}
+
+
+async def gather_requests(
+    requests: Iterable[RequestLike],
+    *,
+    concurrency: int = 10,
+    per_host_concurrency: Optional[int] = 4,
+    buffered: bool = True,
+    **kwargs: Any,
+) -> AsyncIterator[RequestResult]:
+    """Makes many requests with bounded concurrency, yielding each :class:`RequestResult` as soon as it completes.
+
+    At most `concurrency` requests are in flight at once (and at most `per_host_concurrency` to a single host),
+    so looking up dozens of users doesn't flood an API. Requests are started lazily, so `requests` can be a
+    (large) generator. Every request goes through :func:`_request`, so pooling, retries, rate limits and the
+    circuit breaker all apply.
+
+    A failed request doesn't stop the others, its exception is stored in :attr:`RequestResult.error`.
+
+    .. code-block:: python3
+
+        async for result in gather_requests(urls, bloxlink=True):
+            if result.ok:
+                data = await result.response.json()
+
+    Parameters
+    ----------
+    requests: Iterable[Union[:class:`str`, Tuple[:class:`str`, :class:`str`], Tuple[:class:`str`, :class:`str`, Dict[:class:`str`, Any]]]]
+        The requests to make. Either a URL (for a GET request), a ``(method, url)`` tuple
+        or a ``(method, url, kwargs)`` tuple, where `kwargs` are passed to that request only.
+    concurrency: :class:`int`
+        The maximum number of requests in flight. Defaults to ``10``.
+    per_host_concurrency: Optional[:class:`int`]
+        The maximum number of requests in flight to a single host. ``None`` means no limit. Defaults to ``4``.
+    buffered: :class:`bool`
+        Whether to read every response body (returning :class:`BufferedResponse` objects) so connections are given
+        back to the pool straight away. Defaults to ``True``.
+    **kwargs: Any
+        Passed to every request (ex. `pool`, `bloxlink`, `retry_policy`).
+
+    Yields
+    ------
+    :class:`RequestResult`
+        The result of each request, in the order they complete.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def run(index: int, method: RequestType, url: str, request_kwargs: Dict[str, Any]) -> RequestResult:
+        host = _host_of(url)
+        semaphore = None
+        if per_host_concurrency is not None:
+            semaphore = host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = host_semaphores[host] = asyncio.Semaphore(per_host_concurrency)
+
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+            try:
+                response = await _request(method, url, **{**kwargs, **request_kwargs})
+                if buffered and isinstance(response, aiohttp.ClientResponse):
+                    response = await BufferedResponse.from_response(response)
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+        except Exception as e:
+            return RequestResult(index, method, url, error=e)
+        return RequestResult(index, method, url, response=response)
+
+    iterator = enumerate(requests)
+    pending: Set[asyncio.Task[RequestResult]] = set()
+
+    def fill() -> None:
+        while len(pending) < concurrency:
+            try:
+                index, request = next(iterator)
+            except StopIteration:
+                return
+            method, url, request_kwargs = _normalize_request(request)
+            pending.add(asyncio.ensure_future(run(index, method, url, request_kwargs)))
+
+    try:
+        fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                yield task.result()
+                fill()
+    finally:
+        # the caller stopped iterating early (or was cancelled), don't leave requests running
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+class ResponseTooLargeError(aiohttp.ClientError):
+    """Raised when a streamed response body is larger than the allowed limit.
+
+    The download is aborted as soon as the limit is exceeded (or straight away, if
+    the response's ``Content-Length`` is already over it).
+
+    Attributes
+    ----------
+    limit: :class:`int`
+        The maximum allowed size, in bytes.
+    size: Optional[:class:`int`]
+        The size of the body, if the server reported it.
+    """
+
+    def __init__(self, limit: int, size: Optional[int] = None) -> None:
+        self.limit: int = limit
+        self.size: Optional[int] = size
+        if size is not None:
+            message = f"Response body is {size} bytes, which is larger than the limit of {limit} bytes."
+        else:
+            message = f"Response body is larger than the limit of {limit} bytes."
+        super().__init__(message)
+
+
+async def iter_response_chunks(
+    response: Union[aiohttp.ClientResponse, BufferedResponse],
+    *,
+    chunk_size: int = 64 * 1024,
+    limit: Optional[int] = None,
+) -> AsyncIterator[memoryview]:
+    """Yields the body of `response` as :class:`memoryview` chunks, without loading it all into memory.
+
+    Parameters
+    ----------
+    response: Union[:class:`aiohttp.ClientResponse`, :class:`BufferedResponse`]
+        The response to read. Its body must not have been read yet.
+    chunk_size: :class:`int`
+        The (maximum) size of each chunk, in bytes. Defaults to 64 KiB.
+    limit: Optional[:class:`int`]
+        The maximum number of bytes to read. Defaults to ``None`` (no limit).
+
+    Raises
+    ------
+    :class:`ResponseTooLargeError`
+        The body is larger than `limit`. The connection is closed instead of being read to the end.
+
+    Yields
+    ------
+    :class:`memoryview`
+        A chunk of the body.
+    """
+    content_length = response.headers.get("Content-Length")
+    if limit is not None and content_length is not None and content_length.isdigit() and int(content_length) > limit:
+        response.close()
+        raise ResponseTooLargeError(limit, int(content_length))
+
+    if isinstance(response, BufferedResponse):
+        body = memoryview(await response.read())
+        if limit is not None and len(body) > limit:
+            raise ResponseTooLargeError(limit, len(body))
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+        return
+
+    read = 0
+    try:
+        async for chunk in response.content.iter_chunked(chunk_size):
+            read += len(chunk)
+            if limit is not None and read > limit:
+                raise ResponseTooLargeError(limit)
+            yield memoryview(chunk)
+    except BaseException:
+        # the rest of the body is never read, so the connection can't be reused
+        response.close()
+        raise
+    else:
+        response.release()
+
+
+async def stream_response(
+    response: Union[aiohttp.ClientResponse, BufferedResponse],
+    *,
+    limit: Optional[int] = None,
+    spool_size: int = 1024 * 1024,
+    chunk_size: int = 64 * 1024,
+) -> io.BufferedIOBase:
+    """|coro|
+    Streams the body of `response` into a file object, spooling it to a temporary file on disk once it
+    is larger than `spool_size`. The returned file object is positioned at the start and can be passed
+    directly to :class:`discord.File` (or read like any other file).
+
+    Parameters
+    ----------
+    response: Union[:class:`aiohttp.ClientResponse`, :class:`BufferedResponse`]
+        The response to read. Its body must not have been read yet.
+    limit: Optional[:class:`int`]
+        The maximum number of bytes to read. Defaults to ``None`` (no limit).
+    spool_size: :class:`int`
+        How many bytes are kept in memory before the body is moved to a temporary file. Defaults to 1 MiB.
+    chunk_size: :class:`int`
+        The size of the chunks read from the connection, in bytes. Defaults to 64 KiB.
+
+    Raises
+    ------
+    :class:`ResponseTooLargeError`
+        The body is larger than `limit`.
+
+    Returns
+    -------
+    :class:`io.BufferedIOBase`
+        The file object containing the body. It should be closed once it's no longer needed.
+    """
+    if isinstance(response, BufferedResponse):
+        body = await response.read()
+        if limit is not None and len(body) > limit:
+            raise ResponseTooLargeError(limit, len(body))
+        # BytesIO shares the buffer of the bytes object until it is written to
+        return io.BytesIO(body)
+
+    fp: IO[bytes] = io.BytesIO()
+    try:
+        async for chunk in iter_response_chunks(response, chunk_size=chunk_size, limit=limit):
+            if isinstance(fp, io.BytesIO) and fp.tell() + len(chunk) > spool_size:
+                spooled = tempfile.TemporaryFile()
+                spooled.write(fp.getbuffer())
+                fp.close()
+                fp = spooled
+            fp.write(chunk)
+    except BaseException:
+        fp.close()
+        raise
+
+    fp.seek(0)
+    # both BytesIO and the temporary file are buffered binary files
+    return cast(io.BufferedIOBase, fp)
+
+
+async def download_file(
+    url: str,
+    filename: str,
+    *,
+    ctx: Optional[commands.Context] = None,
+    interaction: Optional[discord.Interaction] = None,
+    guild: Optional[discord.Guild] = None,
+    limit: Optional[int] = None,
+    spool_size: int = 1024 * 1024,
+    spoiler: bool = False,
+    description: Optional[str] = None,
+    **kwargs: Any,
+) -> discord.File:
+    """|coro|
+    Downloads `url` straight into a :class:`discord.File`, without reading the whole body into memory first.
+
+    The download is aborted as soon as it is larger than `limit`, which defaults to the upload limit of the
+    guild (see :func:`get_max_file_upload_limit`), so files that couldn't be uploaded anyways aren't downloaded.
+
+    Parameters
+    ----------
+    url: :class:`str`
+        The URL to download.
+    filename: :class:`str`
+        The filename of the returned file.
+    ctx: Optional[:class:`discord.ext.commands.Context`]
+        The context used to find the upload limit.
+    interaction: Optional[:class:`discord.Interaction`]
+        The interaction used to find the upload limit.
+    guild: Optional[:class:`discord.Guild`]
+        The guild used to find the upload limit.
+    limit: Optional[:class:`int`]
+        The maximum size of the file, in bytes. Overrides the upload limit.
+    spool_size: :class:`int`
+        How many bytes are kept in memory before the file is moved to a temporary file on disk. Defaults to 1 MiB.
+    spoiler: :class:`bool`
+        Whether the file is a spoiler.
+    description: Optional[:class:`str`]
+        The description of the file.
+    **kwargs: Any
+        Passed to :func:`_request`.
+
+    Raises
+    ------
+    :class:`ResponseTooLargeError`
+        The file is larger than the limit.
+
+    Returns
+    -------
+    :class:`discord.File`
+        The downloaded file.
+    """
+    if limit is None:
+        limit = get_max_file_upload_limit(ctx, interaction=interaction, guild=guild)
+
+    response = await _request(RequestType.GET, url, **kwargs)
+    fp = await stream_response(response, limit=limit, spool_size=spool_size)
+    return discord.File(fp, filename, spoiler=spoiler, description=description)
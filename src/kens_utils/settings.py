@@ -0,0 +1,147 @@
+"""Process-wide settings that are read from files, only when something first needs them.
+
+Importing the package doesn't touch the filesystem: the API keys file is read the first time a key is
+looked up and ``requests.log`` is opened the first time something is logged to it. Call :func:`init`
+at startup to read them from somewhere else.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+import threading
+from typing import Any, Dict, Mapping, Optional, Union
+
+# fmt: off
+__all__ = (
+    'Settings',
+    'get_settings',
+    'init',
+)
+# fmt: on
+
+StrPath = Union[str, 'os.PathLike[str]']
+
+DEFAULT_CONFIG_PATH = 'apikeys.yml'
+DEFAULT_REQUESTS_LOG = 'requests.log'
+
+
+class Settings:
+    """The files the package reads its settings from, along with what was read from them.
+
+    Parameters
+    ----------
+    config: Optional[Union[:class:`str`, :class:`os.PathLike`, Mapping[:class:`str`, Any]]]
+        The YAML file with the API keys (``bloxlink_api``, ``rover_api``), or the keys themselves.
+        A relative path is resolved when the file is first read, a missing file counts as an empty one.
+    requests_log: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+        The file the ``requests_commands`` logger writes to, ``None`` to not write it anywhere.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Union[StrPath, Mapping[str, Any]]] = DEFAULT_CONFIG_PATH,
+        *,
+        requests_log: Optional[StrPath] = DEFAULT_REQUESTS_LOG,
+    ) -> None:
+        self.config_source: Optional[Union[StrPath, Mapping[str, Any]]] = config
+        self.requests_log: Optional[pathlib.Path] = pathlib.Path(requests_log) if requests_log is not None else None
+
+        self._lock = threading.Lock()
+        self._config: Optional[Dict[str, Any]] = None
+        self._requests_handler: Optional[logging.FileHandler] = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} config={self.config_source!r} requests_log={self.requests_log!r}>"
+
+    def _read_config(self) -> Dict[str, Any]:
+        source = self.config_source
+        if source is None:
+            return {}
+        if isinstance(source, Mapping):
+            return dict(source)
+
+        try:
+            with open(source, "r") as f:
+                # yaml is only imported by the processes that have a config file to read
+                import yaml
+
+                return dict(yaml.safe_load(f) or {})
+        except FileNotFoundError:
+            return {}
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Dict[:class:`str`, Any]: The settings from the config file, read the first time this is accessed."""
+        if self._config is None:
+            with self._lock:
+                if self._config is None:
+                    self._config = self._read_config()
+        return self._config
+
+    @property
+    def bloxlink_api_key(self) -> Optional[str]:
+        """Optional[:class:`str`]: The Bloxlink API key, the ``bloxlink_api`` setting."""
+        return self.config.get("bloxlink_api")
+
+    @property
+    def rover_api_key(self) -> Optional[str]:
+        """Optional[:class:`str`]: The RoVer API key, the ``rover_api`` setting."""
+        return self.config.get("rover_api")
+
+    @property
+    def requests_handler(self) -> Optional[logging.FileHandler]:
+        """Optional[:class:`logging.FileHandler`]: The handler writing to :attr:`requests_log`.
+
+        It is created the first time this is accessed, and opens the file when it writes its first record.
+        """
+        if self._requests_handler is None and self.requests_log is not None:
+            with self._lock:
+                if self._requests_handler is None:
+                    from .constants import formatter
+
+                    handler = logging.FileHandler(self.requests_log, "a", delay=True)
+                    handler.setFormatter(formatter)
+                    self._requests_handler = handler
+        return self._requests_handler
+
+    def reload(self) -> None:
+        """Forgets the settings that were read, so the config file is read again the next time it is needed."""
+        with self._lock:
+            self._config = None
+
+    def close(self) -> None:
+        """Closes the requests log, if it was opened."""
+        with self._lock:
+            handler, self._requests_handler = self._requests_handler, None
+        if handler is not None:
+            handler.close()
+
+
+_settings: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """Returns the settings passed to :func:`init`, or the default ones if it wasn't called."""
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
+
+
+def init(
+    config: Optional[Union[StrPath, Mapping[str, Any]]] = DEFAULT_CONFIG_PATH,
+    *,
+    requests_log: Optional[StrPath] = DEFAULT_REQUESTS_LOG,
+) -> Settings:
+    """Sets the settings the package uses, see :class:`Settings` for the parameters.
+
+    Nothing is read yet, files are only opened when something first needs them. Replacing settings
+    closes the previous ones' requests log.
+    """
+    global _settings
+    previous, _settings = _settings, Settings(config, requests_log=requests_log)
+    if previous is not None:
+        previous.close()
+    return _settings
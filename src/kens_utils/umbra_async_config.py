@@ -10,9 +10,48 @@ This file was sourced from [RoboDanny](https://github.com/Rapptz/RoboDanny).
 
 from __future__ import annotations
 import asyncio
-from typing import Any, Generic, TYPE_CHECKING, TypeVar, overload
+import atexit
+import contextlib
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Iterable,
+    Mapping,
+    TYPE_CHECKING,
+    Optional,
+    TypeGuard,
+    TypeVar,
+    cast,
+    overload,
+)
+
+from discord.utils import MISSING, _from_json as from_json, _to_json as to_json
+
+from .cache_backends import JSON_SERIALIZER, Serializer
+from .mysty_lru import LRUCache
 
-from discord.utils import _from_json as from_json, _to_json as to_json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 if TYPE_CHECKING:
     import pathlib
@@ -25,12 +64,89 @@ _defT = TypeVar("_defT")  # noqa: N816 # how typeshed does it
 
 # fmt: off
 __all__ = (
+    "BINARY_SERIALIZER",
     "Config",
+    "DEFAULT_SERIALIZER",
+    "MSGPACK_SERIALIZER",
+    "ORJSON_SERIALIZER",
+    "SQLiteConfig",
+    "ShardedConfig",
+    "flush_all",
 )
 # fmt: on
 
+_MISSING: Any = object()
+
+_log = logging.getLogger(__name__)
+
+ORJSON_SERIALIZER: Optional[Serializer] = Serializer(orjson.dumps, orjson.loads) if orjson is not None else None
+"""Serializes configs as JSON with ``orjson``, skipping the round trip through :class:`str`. ``None`` if it isn't installed."""
+
+# packb is untyped and inferred as possibly returning None, which it only does for a Packer with autoreset=False
+MSGPACK_SERIALIZER: Optional[Serializer] = (
+    Serializer(cast(Callable[[Any], bytes], msgpack.packb), functools.partial(msgpack.unpackb, strict_map_key=False))
+    if msgpack is not None
+    else None
+)
+"""Serializes configs with ``msgpack``. ``None`` if it isn't installed."""
+
+BINARY_SERIALIZER = Serializer(functools.partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads)
+"""Serializes configs as a compact binary ``pickle`` snapshot. Only load files written by the bot itself."""
+
+DEFAULT_SERIALIZER: Serializer = ORJSON_SERIALIZER or JSON_SERIALIZER
+"""The serializer used by :class:`Config` if none is given: ``orjson`` if it is installed, JSON files either way."""
+# cached for keys that aren't in a SQLiteConfig, so repeated lookups of missing keys don't hit the database
+_ABSENT: Any = object()
+
+def _fsync_directory(path: pathlib.Path) -> None:
+    # makes the files created or renamed in `path` durable, directories can't be opened on Windows
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# configs with changes that weren't written yet, flushed when the interpreter exits.
+# They are strongly referenced until then, so a dirty config dropped by its owner still gets written.
+_unsaved: set[Config[Any]] = set()
+
+
+@atexit.register
+def _flush_unsaved() -> None:
+    for config in list(_unsaved):
+        config._flush_sync()
+
+
+async def flush_all() -> None:
+    """Flushes the pending changes of every :class:`Config`, ex. before shutting down."""
+    for config in list(_unsaved):
+        await config.flush()
+
+
 class Config(Generic[T]):
-    """The "database" object. Internally based on ``json``."""
+    """The "database" object. Internally based on ``json``.
+
+    With `wal`, :meth:`put` and :meth:`remove` append a single record to a write-ahead log (the path with
+    a ``.wal`` suffix added) instead of rewriting the whole file. The log is replayed on load, stopping at the
+    first torn or corrupted record, and is compacted into the main file every `compact_threshold` records
+    (and by every :meth:`save`, which still writes everything, ex. after mutating a value in place).
+    A log left behind by a crash right after compacting is older than the main file and is discarded instead.
+
+    With `save_delay` and/or `save_every`, changes aren't written right away: they are flushed together
+    `save_delay` seconds after the first one, or once `save_every` of them are pending, whichever comes first.
+    Use :meth:`flush` to write them right away and :meth:`batch` to group changes into a single write.
+    Pending changes are flushed by :meth:`close` and, as a last resort, when the interpreter exits.
+
+    `serializer` controls the format of the main file, see :data:`DEFAULT_SERIALIZER`. The write-ahead log is always JSON.
+
+    Every write (a dump or an append to the log) is fsynced before it completes, so a written change survives a crash.
+    """
 
     def __init__(
         self,
@@ -38,11 +154,36 @@ class Config(Generic[T]):
         /,
         *,
         load_later: bool = False,
+        wal: bool = False,
+        compact_threshold: int = 10_000,
+        save_delay: Optional[float] = None,
+        save_every: Optional[int] = None,
+        serializer: Serializer = MISSING,
     ) -> None:
         self.path = path
         self.loop = asyncio.get_event_loop()
         self.lock = asyncio.Lock()
+        self.serializer: Serializer = serializer or DEFAULT_SERIALIZER
         self._db: dict[str, T] = {}
+        # the dict being dumped by the executor, if any
+        self._snapshot: Optional[dict[str, T]] = None
+
+        self.wal: bool = wal
+        self.compact_threshold: int = compact_threshold
+        self.wal_path: pathlib.Path = path.with_name(path.name + ".wal")
+        self._wal_file: Optional[IO[bytes]] = None
+        self._wal_records: int = 0
+        # the crc32 of the snapshot on disk, a new log starts with it so a log older than the snapshot is never replayed
+        self._snapshot_crc: int = 0
+
+        self.save_delay: Optional[float] = save_delay
+        self.save_every: Optional[int] = save_every
+        self._dirty: int = 0
+        # the WAL records of the changes that weren't flushed yet
+        self._pending: list[bytes] = []
+        self._batches: int = 0
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task[None]] = None
 
         if load_later:
             self.loop.create_task(self.load())
@@ -51,26 +192,227 @@ class Config(Generic[T]):
 
     def load_from_file(self) -> None:
         try:
-            with self.path.open() as f:
-                self._db = from_json(f.read())
+            data = self.path.read_bytes()
         except FileNotFoundError:
             self._db = {}
+            self._snapshot_crc = 0
+        else:
+            self._db = self.serializer.loads(data)
+            self._snapshot_crc = zlib.crc32(data)
+
+        if self.wal:
+            self._replay_wal()
+
+    def _replay_wal(self) -> None:
+        try:
+            with self.wal_path.open("rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+
+        records = 0
+        valid = 0
+        lines = data.splitlines(keepends=True)
+        if lines and lines[0].startswith(b"base "):
+            # the log extends the snapshot with that crc32. It is older than the snapshot if the process died
+            # between writing a new snapshot and deleting the log, the snapshot already has all of its records.
+            if lines[0] != b"base %08x\n" % self._snapshot_crc:
+                self.wal_path.unlink()
+                self._wal_records = 0
+                return
+            valid = len(lines.pop(0))
+
+        for line in lines:
+            # every record is "<crc32 of the json> <json>\n", a crash while appending leaves a torn last record
+            checksum, _, payload = line.rstrip(b"\n").partition(b" ")
+            if not line.endswith(b"\n") or checksum != b"%08x" % zlib.crc32(payload):
+                break
+
+            op, key, *value = from_json(payload)
+            if op == "p":
+                self._db[key] = value[0]
+            else:
+                self._db.pop(key, None)
+            records += 1
+            valid += len(line)
+
+        if valid != len(data):
+            # drop whatever follows the last valid record so new records aren't appended after garbage
+            with self.wal_path.open("r+b") as f:
+                f.truncate(valid)
+        self._wal_records = records
 
     async def load(self) -> None:
         async with self.lock:
             await self.loop.run_in_executor(None, self.load_from_file)
 
-    def _dump(self) -> None:
+    def _dump(self, snapshot: Optional[dict[str, T]] = None) -> None:
         temp = self.path.with_suffix(".tmp")
-        with temp.open("w", encoding="utf-8") as tmp:
-            tmp.write(to_json(self._db.copy()))
+        data = self.serializer.dumps(self._db if snapshot is None else snapshot)
+        with temp.open("wb") as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
 
         # atomically move the file
         temp.replace(self.path)
+        _fsync_directory(self.path.parent)
+        self._snapshot_crc = zlib.crc32(data)
+
+        if self.wal:
+            # the snapshot now includes every record. If the process dies before the log is deleted,
+            # its header no longer matches the snapshot and it is discarded on load instead of replayed.
+            self._close_wal()
+            self.wal_path.unlink(missing_ok=True)
+            self._wal_records = 0
 
     async def save(self) -> None:
+        """Writes the whole config, including the pending changes."""
+        async with self.lock:
+            self._clear_pending()
+            await self._write(None)
+
+    def _append(self, records: list[bytes]) -> None:
+        if self._wal_file is None:
+            self._wal_file = self.wal_path.open("ab")
+            if self._wal_file.tell() == 0:
+                self._wal_file.write(b"base %08x\n" % self._snapshot_crc)
+            _fsync_directory(self.wal_path.parent)
+        self._wal_file.write(b"".join(b"%08x %s\n" % (zlib.crc32(record), record) for record in records))
+        self._wal_file.flush()
+        os.fsync(self._wal_file.fileno())
+        self._wal_records += len(records)
+
+    def _should_append(self, records: Optional[list[bytes]]) -> TypeGuard[list[bytes]]:
+        # a full dump (which also compacts the write-ahead log) is needed otherwise
+        return records is not None and self.wal and self._wal_records + len(records) < self.compact_threshold
+
+    async def _write(self, records: Optional[list[bytes]]) -> None:
+        """Appends `records` to the write-ahead log, or dumps the whole config. Must be called with :attr:`lock` held."""
+        if self._should_append(records):
+            await self.loop.run_in_executor(None, self._append, records)
+            return
+
+        # the executor gets the dict itself, changes made while it is being dumped go to a copy of it
+        self._snapshot = self._db
+        try:
+            await self.loop.run_in_executor(None, self._dump, self._snapshot)
+        finally:
+            self._snapshot = None
+
+    def _write_sync(self, records: Optional[list[bytes]]) -> None:
+        if self._should_append(records):
+            self._append(records)
+        else:
+            self._dump()
+
+    def _mutable_db(self) -> dict[str, T]:
+        if self._db is self._snapshot:
+            self._db = dict(self._db)
+        return self._db
+
+    def _close_wal(self) -> None:
+        if self._wal_file is not None:
+            self._wal_file.close()
+            self._wal_file = None
+
+    @property
+    def _debounced(self) -> bool:
+        return self.save_delay is not None or self.save_every is not None or self._batches > 0
+
+    async def _changed(self, *record: Any) -> None:
+        # serialized right away, the value could be mutated before the executor gets to it
+        payload = to_json(record).encode() if self.wal else b""
+        if not self._debounced:
+            async with self.lock:
+                await self._write([payload])
+            return
+
+        if self.wal:
+            self._pending.append(payload)
+        self._dirty += 1
+        _unsaved.add(self)
+
+        if self._batches:
+            return
+        if self.save_every is not None and self._dirty >= self.save_every:
+            await self.flush()
+        elif self.save_delay is not None and self._flush_timer is None:
+            self._flush_timer = self.loop.call_later(self.save_delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_timer = None
+        self._flush_task = task = self.loop.create_task(self.flush())
+        task.add_done_callback(self._flushed)
+
+    def _flushed(self, task: asyncio.Task[None]) -> None:
+        if self._flush_task is task:
+            self._flush_task = None
+        if task.cancelled() or task.exception() is None:
+            return
+
+        # flush() kept the changes, try again later instead of waiting for the next change (or the exit)
+        delay = self.save_delay or 0.0
+        _log.error("Failed to flush %s, retrying in %.2f seconds", self.path, delay, exc_info=task.exception())
+        if self._dirty and self._flush_timer is None:
+            self._flush_timer = self.loop.call_later(delay, self._start_flush)
+
+    def _clear_pending(self) -> list[bytes]:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        records, self._pending = self._pending, []
+        self._dirty = 0
+        _unsaved.discard(self)
+        return records
+
+    async def flush(self) -> None:
+        """Writes the pending changes, if any."""
         async with self.lock:
-            await self.loop.run_in_executor(None, self._dump)
+            if not self._dirty:
+                return
+
+            dirty = self._dirty
+            records = self._clear_pending()
+            try:
+                await self._write(records)
+            except BaseException:
+                # keep the changes around for the next flush
+                self._pending[:0] = records
+                self._dirty += dirty
+                _unsaved.add(self)
+                raise
+
+    def _flush_sync(self) -> None:
+        if not self._dirty:
+            return
+
+        self._write_sync(self._clear_pending())
+
+    @contextlib.asynccontextmanager
+    async def batch(self) -> AsyncIterator[Config[T]]:
+        """Groups the changes made inside the block into a single write, made when it exits.
+
+        .. code-block:: python3
+
+            async with config.batch():
+                for guild_id in guild_ids:
+                    await config.put(guild_id, settings)
+        """
+        self._batches += 1
+        try:
+            yield self
+        finally:
+            self._batches -= 1
+            if not self._batches:
+                await self.flush()
+
+    async def close(self) -> None:
+        """Flushes the pending changes and closes the write-ahead log, if any."""
+        await self.flush()
+        async with self.lock:
+            self._close_wal()
 
     @overload
     def get(self, key: Any) -> T | None: ...
@@ -84,16 +426,22 @@ class Config(Generic[T]):
 
     async def put(self, key: Any, value: T) -> None:
         """Edits a config entry."""
-        self._db[str(key)] = value
-        await self.save()
+        self._mutable_db()[str(key)] = value
+        await self._changed("p", str(key), value)
+
+    async def put_many(self, items: Mapping[Any, T] | Iterable[tuple[Any, T]]) -> None:
+        """Edits several config entries, written together."""
+        async with self.batch():
+            for key, value in items.items() if isinstance(items, Mapping) else items:
+                await self.put(key, value)
 
     async def remove(self, key: Any) -> None:
         """Removes a config entry."""
         try:
-            del self._db[str(key)]
+            del self._mutable_db()[str(key)]
         except KeyError:
             return
-        await self.save()
+        await self._changed("d", str(key))
 
     def __contains__(self, item: Any) -> bool:
         return str(item) in self._db
@@ -105,4 +453,251 @@ class Config(Generic[T]):
         return len(self._db)
 
     def all(self) -> dict[str, T]:
-        return self._db
\ No newline at end of file
+        # a copy, the executor may be serializing _db while the caller iterates or changes it
+        return dict(self._db)
+
+class SQLiteConfig(Generic[T]):
+    """A :class:`Config` stored in a SQLite database instead of a single JSON file.
+
+    Opening it doesn't read anything, entries are read when they are first accessed and the most
+    recently used ones (including missing keys) are kept in an LRU cache of `cache_size` entries.
+    The database runs in WAL mode and writes run in the default executor, reads use a separate
+    connection so a cache miss never waits for a write transaction to finish.
+
+    Values are stored as JSON, like :class:`Config`. Unlike it, changing a value in place isn't
+    persisted (and :meth:`all` reads the whole table), use :meth:`put` with the new value instead.
+    """
+
+    def __init__(self, path: pathlib.Path, /, *, cache_size: int = 1024) -> None:
+        self.path = path
+        self.loop = asyncio.get_event_loop()
+        self.lock = asyncio.Lock()
+
+        self._cache: LRUCache[str, Any] = LRUCache(cache_size)
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS config (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        # Only used on the event loop, WAL mode lets it read while the executor holds `_db_lock`.
+        self._reader = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+
+    def _read(self, key: str) -> Any:
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            row = self._reader.execute("SELECT value FROM config WHERE key = ?", (key,)).fetchone()
+            value = from_json(row[0]) if row is not None else _ABSENT
+            self._cache[key] = value
+        return value
+
+    def _write(self, sql: str, rows: list[tuple[str, ...]]) -> None:
+        with self._db_lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(sql, rows)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    @overload
+    def get(self, key: Any) -> T | None: ...
+
+    @overload
+    def get(self, key: Any, default: _defT) -> T | _defT: ...
+
+    def get(self, key: Any, default: _defT | None = None) -> T | _defT | None:
+        """Retrieves a config entry."""
+        value = self._read(str(key))
+        return default if value is _ABSENT else value
+
+    async def put(self, key: Any, value: T) -> None:
+        """Edits a config entry."""
+        await self.put_many(((key, value),))
+
+    async def put_many(self, items: Mapping[Any, T] | Iterable[tuple[Any, T]]) -> None:
+        """Edits several config entries in a single transaction."""
+        pairs = [(str(key), value) for key, value in (items.items() if isinstance(items, Mapping) else items)]
+        rows = [(key, to_json(value)) for key, value in pairs]
+        async with self.lock:
+            await self.loop.run_in_executor(None, self._write, "INSERT OR REPLACE INTO config VALUES (?, ?)", rows)
+        for key, value in pairs:
+            self._cache[key] = value
+
+    async def remove(self, key: Any) -> None:
+        """Removes a config entry."""
+        key = str(key)
+        async with self.lock:
+            await self.loop.run_in_executor(None, self._write, "DELETE FROM config WHERE key = ?", [(key,)])
+        self._cache[key] = _ABSENT
+
+    async def close(self) -> None:
+        """Closes the database."""
+        async with self.lock:
+            self._reader.close()
+            with self._db_lock:
+                self._db.close()
+
+    def __contains__(self, item: Any) -> bool:
+        return self._read(str(item)) is not _ABSENT
+
+    def __getitem__(self, item: Any) -> T:
+        value = self._read(str(item))
+        if value is _ABSENT:
+            raise KeyError(item)
+        return value
+
+    def __len__(self) -> int:
+        return self._reader.execute("SELECT COUNT(*) FROM config").fetchone()[0]
+
+    def all(self) -> dict[str, T]:
+        rows = self._reader.execute("SELECT key, value FROM config").fetchall()
+        return {key: from_json(value) for key, value in rows}
+
+
+class ShardedConfig(Generic[T]):
+    """A :class:`Config` split across several files in `directory`, so each one stays small.
+
+    Keys are hashed into `shards` files, or each key gets its own file if `shards` is ``None``
+    (ex. one file per guild). A shard is only loaded when one of its keys is first accessed and is
+    unloaded once it hasn't been used for `idle_timeout` seconds. Each shard is a :class:`Config`
+    created with `config_options` (ex. ``wal=True`` or ``save_delay=5``), so changes only write
+    the shards they touch.
+
+    :meth:`all` and ``len()`` load every shard.
+    """
+
+    _SAFE_NAME = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+    def __init__(
+        self,
+        directory: pathlib.Path,
+        /,
+        *,
+        shards: Optional[int] = 16,
+        idle_timeout: float = 300.0,
+        **config_options: Any,
+    ) -> None:
+        self.directory = directory
+        self.shards: Optional[int] = shards
+        self.idle_timeout: float = idle_timeout
+        self.config_options: dict[str, Any] = config_options
+        directory.mkdir(parents=True, exist_ok=True)
+
+        self._loaded: dict[str, Config[T]] = {}
+        self._last_used: dict[str, float] = {}
+        self._next_sweep: float = time.monotonic() + idle_timeout
+        self._batches: int = 0
+        self._batched: set[Config[T]] = set()
+
+    def _shard_name(self, key: str) -> str:
+        if self.shards is not None:
+            return f"shard-{zlib.crc32(key.encode()) % self.shards}"
+        if self._SAFE_NAME.fullmatch(key):
+            return key
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def _shard(self, name: str) -> Config[T]:
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._evict_idle(now)
+
+        config = self._loaded.get(name)
+        if config is None:
+            config = self._loaded[name] = Config(self.directory / f"{name}.json", **self.config_options)
+        self._last_used[name] = now
+
+        if self._batches and config not in self._batched:
+            config._batches += 1
+            self._batched.add(config)
+        return config
+
+    def _evict_idle(self, now: float) -> None:
+        self._next_sweep = now + self.idle_timeout / 2
+        for name, last_used in list(self._last_used.items()):
+            config = self._loaded[name]
+            # shards with unsaved changes are kept until they are flushed
+            if now - last_used >= self.idle_timeout and not config._dirty and config not in self._batched:
+                del self._loaded[name], self._last_used[name]
+                config._close_wal()
+
+    def _shard_names(self) -> set[str]:
+        # a shard with a write-ahead log may not have been compacted into its .json file yet
+        names = {path.name[: -len(".json")] for path in self.directory.glob("*.json")}
+        names.update(path.name[: -len(".json.wal")] for path in self.directory.glob("*.json.wal"))
+        return names | self._loaded.keys()
+
+    @overload
+    def get(self, key: Any) -> T | None: ...
+
+    @overload
+    def get(self, key: Any, default: _defT) -> T | _defT: ...
+
+    def get(self, key: Any, default: _defT | None = None) -> T | _defT | None:
+        """Retrieves a config entry."""
+        key = str(key)
+        return self._shard(self._shard_name(key)).get(key, default)
+
+    async def put(self, key: Any, value: T) -> None:
+        """Edits a config entry."""
+        key = str(key)
+        await self._shard(self._shard_name(key)).put(key, value)
+
+    async def put_many(self, items: Mapping[Any, T] | Iterable[tuple[Any, T]]) -> None:
+        """Edits several config entries, each shard is written once."""
+        by_shard: dict[str, dict[str, T]] = {}
+        for key, value in items.items() if isinstance(items, Mapping) else items:
+            key = str(key)
+            by_shard.setdefault(self._shard_name(key), {})[key] = value
+
+        for name, shard_items in by_shard.items():
+            await self._shard(name).put_many(shard_items)
+
+    async def remove(self, key: Any) -> None:
+        """Removes a config entry."""
+        key = str(key)
+        await self._shard(self._shard_name(key)).remove(key)
+
+    async def flush(self) -> None:
+        """Writes the pending changes of every loaded shard."""
+        for config in list(self._loaded.values()):
+            await config.flush()
+
+    @contextlib.asynccontextmanager
+    async def batch(self) -> AsyncIterator[ShardedConfig[T]]:
+        """Groups the changes made inside the block into a single write per shard, made when it exits."""
+        self._batches += 1
+        try:
+            yield self
+        finally:
+            self._batches -= 1
+            if not self._batches:
+                batched, self._batched = self._batched, set()
+                for config in batched:
+                    config._batches -= 1
+                for config in batched:
+                    await config.flush()
+
+    async def close(self) -> None:
+        """Flushes and unloads every shard."""
+        for config in list(self._loaded.values()):
+            await config.close()
+        self._loaded.clear()
+        self._last_used.clear()
+
+    def __contains__(self, item: Any) -> bool:
+        key = str(item)
+        return key in self._shard(self._shard_name(key))
+
+    def __getitem__(self, item: Any) -> T:
+        key = str(item)
+        return self._shard(self._shard_name(key))[key]
+
+    def __len__(self) -> int:
+        return sum(len(self._shard(name)) for name in self._shard_names())
+
+    def all(self) -> dict[str, T]:
+        entries: dict[str, T] = {}
+        for name in self._shard_names():
+            entries.update(self._shard(name).all())
+        return entries
@@ -0,0 +1,156 @@
+import asyncio
+import pathlib
+import sys
+import textwrap
+
+import pytest
+
+from ..src.kens_utils import danny_caches
+from ..src.kens_utils.cache_backends import JSON_SERIALIZER, SQLiteBackend
+
+SRC = pathlib.Path(__file__).resolve().parent.parent / "src"
+
+# another process using the same backend, it prints what it gets and optionally invalidates guild 1
+CHILD = textwrap.dedent(
+    f"""
+    import asyncio, sys
+    sys.path.insert(0, {str(SRC)!r})
+    from kens_utils.cache_backends import SQLiteBackend
+    from kens_utils.danny_caches import cache
+
+    async def settings(guild_id):
+        print("computed")
+        return {{"guild_id": guild_id, "process": "child"}}
+
+    settings.__module__ = "shared"
+
+    async def main():
+        backend = SQLiteBackend(sys.argv[1])
+        cached = cache(backend=backend)(settings)
+        print(await cached(1))
+        if sys.argv[2] == "invalidate":
+            cached.invalidate_containing(repr(1))
+        await backend.close()
+
+    asyncio.run(main())
+    """
+)
+
+
+async def run_child(tmp_path: pathlib.Path, db: pathlib.Path, action: str) -> str:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", CHILD, str(db), action, cwd=tmp_path, stdout=asyncio.subprocess.PIPE
+    )
+    stdout, _ = await process.communicate()
+    assert process.returncode == 0
+    return stdout.decode()
+
+
+@pytest.mark.asyncio
+async def test_results_and_invalidations_are_shared_between_processes(tmp_path):
+    db = tmp_path / "cache.sqlite"
+    backend = SQLiteBackend(db, poll_interval=0.05)
+    calls = []
+
+    async def settings(guild_id):
+        calls.append(guild_id)
+        return {"guild_id": guild_id, "process": "parent"}
+
+    settings.__module__ = "shared"
+    cached = danny_caches.cache(backend=backend)(settings)
+
+    try:
+        assert (await cached(1))["process"] == "parent"
+
+        # the other process reads the result instead of computing it
+        output = await run_child(tmp_path, db, "read")
+        assert "computed" not in output
+        assert "'process': 'parent'" in output
+
+        # its invalidation reaches this process' in-process cache
+        await run_child(tmp_path, db, "invalidate")
+        for _ in range(50):
+            if not cached.cache:
+                break
+            await asyncio.sleep(0.05)
+        assert not cached.cache
+
+        await cached(1)
+        assert calls == [1, 1]
+    finally:
+        await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_ttl_tags_and_json(tmp_path):
+    backend = SQLiteBackend(tmp_path / "cache.sqlite", serializer=JSON_SERIALIZER)
+    try:
+        await backend.set("ns:a", {"a": 1}, ttl=60, tokens=[backend.tag_token("ns", "guild")])
+        await backend.set("ns:b", [1, 2], ttl=-1)
+        await backend.set("ns:c", "c", tokens=[backend.repr_token("ns", "'c'")])
+
+        assert await backend.get("ns:a") == {"a": 1}
+        with pytest.raises(KeyError):
+            await backend.get("ns:b")
+
+        backend.invalidate("ns", "tag", "guild")
+        with pytest.raises(KeyError):
+            await backend.get("ns:a")
+
+        backend.invalidate("ns", "containing", "'c")
+        with pytest.raises(KeyError):
+            await backend.get("ns:c")
+    finally:
+        await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_backend_failures_fall_back_to_calling_the_function(tmp_path):
+    backend = SQLiteBackend(tmp_path / "cache.sqlite", serializer=JSON_SERIALIZER)
+
+    @danny_caches.cache(backend=backend, hashable_keys=True)
+    async def unserializable(value: int) -> object:
+        return object()
+
+    try:
+        assert isinstance(await unserializable(1), object)
+        unserializable.invalidate(1)
+        assert isinstance(await unserializable(1), object)
+    finally:
+        await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_json_invalidations_reach_other_backends(tmp_path):
+    db = tmp_path / "cache.sqlite"
+    first = SQLiteBackend(db, serializer=JSON_SERIALIZER, poll_interval=0.05)
+    second = SQLiteBackend(db, serializer=JSON_SERIALIZER, poll_interval=0.05)
+
+    def make(backend: SQLiteBackend):
+        async def settings(guild_id: int, user_id: int) -> int:
+            return user_id
+
+        settings.__module__ = "shared"
+        return danny_caches.cache(backend=backend, hashable_keys=True, tags=lambda guild_id, user_id: [("guild", guild_id)])(
+            settings
+        )
+
+    cached, other = make(first), make(second)
+    try:
+        await cached(1, 10)
+        await other(1, 10)
+        assert len(other.cache) == 1
+
+        assert cached.invalidate_tag(("guild", 1)) == 1
+        with pytest.raises(KeyError):
+            await first.get(cached.get_key(1, 10))
+
+        # the tag comes back from JSON as a list
+        for _ in range(50):
+            if not other.cache:
+                break
+            await asyncio.sleep(0.05)
+        assert not other.cache
+    finally:
+        await first.close()
+        await second.close()
@@ -0,0 +1,77 @@
+import marshal
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from ..src.kens_utils import constants
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def test_artifact_is_up_to_date():
+    version, blobs = marshal.loads(constants._TABLES_ARTIFACT.read_bytes())
+    assert version == constants._TABLES_VERSION
+    assert {name: marshal.loads(blob) for name, blob in blobs.items()} == constants._tables_from_source(), (
+        "_constants_tables.py changed, bump constants._TABLES_VERSION and regenerate the artifact with"
+        " `python -m kens_utils._constants_tables` from src"
+    )
+
+
+def test_tables():
+    assert isinstance(constants.http_codes, types.MappingProxyType)
+    assert constants.http_codes[404] == "Not Found"
+    assert constants.HTTPCode(404).name == "Not Found"
+    with pytest.raises(TypeError):
+        constants.guild_features["NEW"] = "New"  # type: ignore
+
+    # emojidict can still be customized, unknown names default to a question mark
+    assert constants.emojidict["not an emoji"] == "❓"
+    assert constants.LOADING_EMOJI == constants.emojidict["thinking"]
+    assert "py" in constants.CODEBLOCK_LANGUAGES
+    assert constants.CodeblockLanguage.__args__ == tuple(constants.CODEBLOCK_LANGUAGES)
+    assert "http_codes" in dir(constants)
+
+
+def test_loaded_tables_are_read_without_the_lock(monkeypatch: pytest.MonkeyPatch):
+    constants.http_codes
+    monkeypatch.setattr(constants, "_tables_lock", None)
+    assert constants.HTTPCode(200).name == "OK"
+
+
+def test_outdated_artifact_falls_back_to_the_source(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, caplog: pytest.LogCaptureFixture
+):
+    artifact = tmp_path / "tables.marshal"
+    artifact.write_bytes(marshal.dumps((0, {"http_codes": marshal.dumps({200: "stale"})})))
+    monkeypatch.setattr(constants, "_TABLES_ARTIFACT", artifact)
+    monkeypatch.setattr(constants, "_table_blobs", None)
+    with caplog.at_level("DEBUG", logger=constants.__name__):
+        assert constants._load_table("http_codes")[200] == "OK"
+    assert "outdated" in caplog.text
+
+    monkeypatch.setattr(constants, "_TABLES_ARTIFACT", tmp_path / "missing.marshal")
+    monkeypatch.setattr(constants, "_table_blobs", None)
+    assert constants._load_table("http_codes")[200] == "OK"
+
+
+def test_tables_are_loaded_when_first_used(tmp_path: Path):
+    code = (
+        "import sys\n"
+        "import kens_utils.constants as constants\n"
+        "assert not set(constants._LAZY_CONSTANTS) & set(vars(constants))\n"
+        "assert constants.http_codes[200] == 'OK'\n"
+        "assert 'emojidict' not in vars(constants)\n"
+        "assert 'kens_utils._constants_tables' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(SRC)},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
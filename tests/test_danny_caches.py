@@ -0,0 +1,281 @@
+import asyncio
+import types
+
+import pytest
+
+from ..src.kens_utils import danny_caches
+from ..src.kens_utils.danny_caches import ExpiringCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = types.SimpleNamespace(now=0.0)
+    monkeypatch.setattr(danny_caches, "time", types.SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_expiring_cache_expires_entries(clock):
+    cache = ExpiringCache(10)
+    cache["a"] = 1
+    clock.now = 5
+    cache["b"] = 2
+
+    clock.now = 11
+    assert "a" not in cache
+    assert cache["b"] == 2
+    assert cache.get("a") is None
+
+    clock.now = 16
+    with pytest.raises(KeyError):
+        cache["b"]
+    assert len(cache) == 0
+
+
+def test_expiring_cache_resetting_a_key_restarts_its_ttl(clock):
+    cache = ExpiringCache(10)
+    cache["a"] = 1
+    clock.now = 8
+    cache["a"] = 2
+
+    clock.now = 12
+    assert cache["a"] == 2
+    clock.now = 19
+    assert "a" not in cache
+
+
+def test_expiring_cache_maxsize_evicts_oldest(clock):
+    cache = ExpiringCache(10, maxsize=2)
+    for i, key in enumerate("abc"):
+        clock.now = i
+        cache[key] = i
+
+    assert list(cache.items()) == [("b", 1), ("c", 2)]
+
+    clock.now = 3
+    cache["b"] = 10  # "b" is now the newest entry
+    cache["d"] = 3
+    assert sorted(cache.items()) == [("b", 10), ("d", 3)]
+
+
+def test_expiring_cache_keys_with_equal_timestamps_are_never_compared(clock):
+    # a coarse clock gives several entries the same timestamp, these keys can't be ordered
+    cache = ExpiringCache(10, maxsize=3)
+    keys = ["a", ("b", 1), frozenset({1}), None, ("b", 2)]
+    for i, key in enumerate(keys):
+        cache[key] = i
+    cache["a"] = 10
+
+    assert dict(cache.items()) == {None: 3, ("b", 2): 4, "a": 10}
+    clock.now = 11
+    assert len(list(cache.items())) == 3
+    assert ("b", 2) not in cache
+    assert len(cache) == 0
+
+
+def test_expiring_cache_heap_is_compacted(clock):
+    cache = ExpiringCache(10)
+    for i in range(1000):
+        cache["a"] = i
+    assert len(cache._ExpiringCache__heap) < 100
+    assert cache["a"] == 999
+
+
+@pytest.mark.asyncio
+async def test_timed_strategy_ttl_and_maxsize():
+    calls = []
+
+    @danny_caches.cache(maxsize=2, strategy=danny_caches.Strategy.timed, ttl=60)
+    async def fetch(value: int) -> int:
+        calls.append(value)
+        return value
+
+    for value in (1, 2, 1, 3, 1):
+        assert await fetch(value) == value
+
+    assert len(fetch.cache) == 2
+    assert calls == [1, 2, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_containing_and_tags_use_the_index():
+    @danny_caches.cache(tags=lambda guild_id, user_id: [("guild", guild_id)])
+    async def settings(guild_id: int, user_id: int) -> tuple:
+        return guild_id, user_id
+
+    for guild_id in (1, 2):
+        for user_id in (10, 20):
+            await settings(guild_id, user_id)
+    assert len(settings.cache) == 4
+
+    settings.invalidate_containing(repr(10))
+    assert sorted(settings.cache.keys()) == [settings.get_key(1, 20), settings.get_key(2, 20)]
+
+    assert settings.invalidate_tag(("guild", 1)) == 1
+    assert settings.invalidate_tag(("guild", 1)) == 0
+    assert list(settings.cache.keys()) == [settings.get_key(2, 20)]
+
+    # the reprs starting with the string
+    settings.invalidate_containing("2")
+    assert len(settings.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_invalidate_arg_and_containing():
+    class Guild:
+        def __init__(self, id: int):
+            self.id = id
+
+        def __repr__(self) -> str:
+            return f"<Guild id={self.id}>"
+
+    @danny_caches.cache()
+    async def fetch(value: object, other: object = None) -> object:
+        return value
+
+    values = [123, 1234, Guild(123), "foo", "food", ["foo"], "bar"]
+    for value in values:
+        await fetch(value)
+    await fetch("x", "foo")
+
+    # by the argument itself, strings aren't matched by their repr
+    assert fetch.invalidate_arg("foo") == 2
+    assert fetch.invalidate_arg("foo") == 0
+    assert fetch.invalidate_arg(["foo"]) == 0
+
+    # the argument, or the reprs starting with the string
+    fetch.invalidate_containing("123")
+    assert fetch.get_key(123) not in fetch.cache
+    assert fetch.get_key(1234) not in fetch.cache
+    fetch.invalidate_containing("<Guild")
+    fetch.invalidate_containing("['")
+    fetch.invalidate_containing("'fo")
+    assert list(fetch.cache.keys()) == [fetch.get_key("bar")]
+
+    assert fetch.invalidate_arg("bar") == 1
+    assert len(fetch.cache) == 0
+
+
+def test_refresh_ahead_needs_the_timed_strategy():
+    with pytest.raises(ValueError):
+
+        @danny_caches.cache(refresh_ahead=1)
+        async def fetch() -> None:
+            pass
+
+
+@pytest.mark.asyncio
+async def test_index_forgets_evicted_keys():
+    @danny_caches.cache(maxsize=4)
+    async def double(value: int) -> int:
+        return value * 2
+
+    for value in range(500):
+        await double(value)
+
+    (index,) = [
+        cell.cell_contents
+        for cell in double.__closure__
+        if isinstance(cell.cell_contents, danny_caches._KeyIndex)
+    ]
+    assert len(double.cache) == 4
+    assert len(index) <= 2 * 4 + 64 + 1
+    assert double.invalidate(499)
+    assert not double.invalidate(499)
+
+
+@pytest.mark.asyncio
+async def test_hashable_keys_and_key_function():
+    calls = []
+
+    @danny_caches.cache(hashable_keys=True)
+    async def fetch(*args, **kwargs):
+        calls.append((args, kwargs))
+        return args
+
+    await fetch(1, "a", connection=object())
+    await fetch(1, "a", connection=object())
+    await fetch(1, ["unhashable"])
+    await fetch(1, ["unhashable"])
+    assert len(calls) == 2
+    assert fetch.get_key(1, "a", x=2) == (1, "a", danny_caches._KWARGS_MARK, ("x", 2))
+    assert isinstance(fetch.get_key(1, ["unhashable"]), str)
+
+    fetch.invalidate_containing(1)
+    assert len(fetch.cache) == 0
+
+    @danny_caches.cache(key=lambda guild, user: guild)
+    async def by_guild(guild: int, user: int) -> int:
+        calls.append(guild)
+        return user
+
+    assert await by_guild(1, 10) == 10
+    assert await by_guild(1, 20) == 10
+    assert by_guild.invalidate(1, 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", list(danny_caches.Strategy))
+async def test_failed_and_cancelled_tasks_are_evicted(strategy):
+    attempts = []
+
+    @danny_caches.cache(strategy=strategy, maxsize=60)
+    async def flaky(value: int) -> int:
+        attempts.append(value)
+        if len(attempts) == 1:
+            raise ValueError("transient")
+        if value == 2:
+            await asyncio.sleep(10)
+        return value
+
+    with pytest.raises(ValueError):
+        await flaky(1)
+    await asyncio.sleep(0)
+    assert await flaky(1) == 1
+    assert attempts == [1, 1]
+
+    task = flaky(2)
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+    assert flaky.get_key(2) not in flaky.cache
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", [danny_caches.Strategy.raw, danny_caches.Strategy.timed])
+async def test_stats_for_raw_and_timed(strategy):
+    @danny_caches.cache(strategy=strategy, maxsize=60)
+    async def identity(value: int) -> int:
+        return value
+
+    for value in (1, 1, 2, 1):
+        await identity(value)
+    assert identity.get_stats() == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_refresh_ahead_serves_cached_value_while_refreshing(clock):
+    results = iter(["first", "second", "third"])
+    gate = asyncio.Event()
+    gate.set()
+
+    @danny_caches.cache(strategy=danny_caches.Strategy.timed, ttl=10, refresh_ahead=3)
+    async def fetch() -> str:
+        await gate.wait()
+        return next(results)
+
+    assert await fetch() == "first"
+    clock.now = 5
+    assert await fetch() == "first"  # too early to refresh
+
+    clock.now = 8
+    gate.clear()
+    assert await fetch() == "first"  # starts a refresh in the background
+    assert await fetch() == "first"  # a single refresh runs at a time
+    gate.set()
+    await asyncio.sleep(0.01)
+
+    assert await fetch() == "second"
+    clock.now = 12  # the refreshed entry was set at 8, so it is still fresh
+    assert await fetch() == "second"
@@ -0,0 +1,65 @@
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from ..src import kens_utils
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def run_isolated(code: str, tmp_path: Path) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(SRC)},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+@pytest.mark.parametrize("module", list(kens_utils._EXPORTS))
+def test_exports_match_the_submodules(module: str):
+    submodule = importlib.import_module(f".{module}", kens_utils.__name__)
+    exported = set(kens_utils._EXPORTS[module])
+    assert exported == set(submodule.__all__)
+    for name in exported:
+        assert getattr(kens_utils, name) is getattr(submodule, name)
+
+
+
+def test_all_matches_the_exports():
+    submodules = (name for name in kens_utils._EXPORTS if name not in kens_utils._LAZY_ATTRIBUTES)
+    assert kens_utils.__all__ == (*kens_utils._LAZY_ATTRIBUTES, *submodules)
+
+
+def test_importing_the_package_imports_no_submodules(tmp_path: Path):
+    out = run_isolated(
+        "import sys, kens_utils\n"
+        "print(sorted(name for name in sys.modules if name.startswith(('kens_utils.', 'discord'))))\n",
+        tmp_path,
+    )
+    assert out.strip() == "[]"
+    assert not (tmp_path / "requests.log").exists()
+
+
+def test_names_load_only_their_submodule(tmp_path: Path):
+    out = run_isolated(
+        "import sys\n"
+        "from kens_utils import LRUCache\n"
+        "print(sorted(name for name in sys.modules if name.startswith('kens_utils.')))\n",
+        tmp_path,
+    )
+    assert out.strip() == "['kens_utils.mysty_lru']"
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        kens_utils.not_a_name
+    assert set(kens_utils.__all__) <= set(dir(kens_utils))
+    assert kens_utils.constants is importlib.import_module(f"{kens_utils.__name__}.constants")
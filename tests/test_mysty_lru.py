@@ -0,0 +1,219 @@
+import asyncio
+
+import pytest
+
+from ..src.kens_utils.mysty_lru import LRUCache
+
+
+def test_evicts_least_recently_used():
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1  # "b" is now the least recently used
+
+    cache["c"] = 3
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_overwriting_refreshes_recency_without_evicting():
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["a"] = 10
+
+    assert len(cache) == 2
+    cache["c"] = 3
+    assert cache.get("b", "missing") == "missing"
+    assert cache["a"] == 10
+
+
+def test_delete_clear_and_missing_keys():
+    cache: LRUCache[str, int] = LRUCache(3)
+    cache["a"] = 1
+    cache["b"] = 2
+    del cache["a"]
+
+    with pytest.raises(KeyError):
+        cache["a"]
+    with pytest.raises(KeyError):
+        del cache["a"]
+
+    cache.clear()
+    assert len(cache) == 0
+    assert repr(cache) == "LRUCache(max_size=3, items=0)"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_expires_lazily_and_per_entry():
+    clock = FakeClock()
+    cache: LRUCache[str, int] = LRUCache(10, ttl=5)
+    cache._timer = clock
+    cache["a"] = 1
+    cache.set("b", 2, ttl=None)
+    cache.set("c", 3, ttl=20)
+
+    clock.now = 6
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+    clock.now = 21
+    with pytest.raises(KeyError):
+        cache["c"]
+    assert cache.stats()["expirations"] == 2
+
+
+def test_expired_entries_are_swept_on_write():
+    clock = FakeClock()
+    cache: LRUCache[int, int] = LRUCache(100, ttl=5)
+    cache._timer = clock
+    for i in range(10):
+        cache[i] = i
+
+    clock.now = 6
+    cache["new"] = 0  # sweeps the 10 expired entries without them being accessed
+    assert len(cache) == 1
+    assert cache.expirations == 10
+
+    clock.now = 12
+    assert cache.expire() == 1
+    assert len(cache) == 0
+
+
+def test_weigher_evicts_until_under_budget():
+    cache: LRUCache[str, bytes] = LRUCache(100, max_weight=10, weigher=lambda key, value: len(value))
+    cache["a"] = b"1234"
+    cache["b"] = b"1234"
+    cache["c"] = b"12"
+    assert cache.weight == 10
+
+    cache["d"] = b"123"  # evicts "a"
+    assert cache.get("a") is None
+    assert cache.weight == 9
+
+    cache["b"] = b"1"  # replacing an entry updates its weight
+    assert cache.weight == 6
+
+    cache["huge"] = b"x" * 11  # too heavy for the cache on its own
+    assert cache.get("huge") is None
+    assert cache.weight == 0
+
+
+def test_max_weight_without_weigher_counts_entries():
+    cache: LRUCache[int, int] = LRUCache(100, max_weight=3)
+    for i in range(10):
+        cache[i] = i
+
+    assert len(cache) == 3
+    assert cache.weight == 3
+    assert list(cache._cache) == [7, 8, 9]
+    assert cache.evictions == 7
+
+
+def test_stats_counts_hits_misses_and_evictions():
+    cache: LRUCache[str, int] = LRUCache(1)
+    cache["a"] = 1
+    cache.get("a")
+    cache.get("missing")
+    cache["b"] = 2
+
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 1, "expirations": 0, "entries": 1, "weight": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_shares_a_single_load():
+    cache: LRUCache[str, int] = LRUCache(10)
+    calls = []
+
+    async def loader() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(cache.get_or_load("a", loader) for _ in range(5)))
+    assert results == [42] * 5
+    assert len(calls) == 1
+    assert await cache.get_or_load("a", loader) == 42
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_caches_none_for_negative_ttl():
+    clock = FakeClock()
+    cache: LRUCache[str, int] = LRUCache(10, negative_ttl=5)
+    cache._timer = clock
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return None
+
+    assert await cache.get_or_load("a", loader) is None
+    assert await cache.get_or_load("a", loader) is None
+    assert len(calls) == 1
+
+    clock.now = 6
+    assert await cache.get_or_load("a", loader) is None
+    assert len(calls) == 2
+
+    assert await cache.get_or_load("b", loader, negative_ttl=None) is None
+    assert await cache.get_or_load("b", loader, negative_ttl=None) is None
+    assert len(calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_survives_cancelled_waiters_and_errors():
+    cache: LRUCache[str, int] = LRUCache(10)
+    release = asyncio.Event()
+
+    async def loader() -> int:
+        await release.wait()
+        return 1
+
+    first = asyncio.create_task(cache.get_or_load("a", loader))
+    second = asyncio.create_task(cache.get_or_load("a", loader))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == 1
+    assert first.cancelled()
+    assert cache["a"] == 1
+
+    async def failing() -> int:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await cache.get_or_load("b", failing)
+    assert cache.get("b") is None
+    assert await cache.get_or_load("b", loader) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_does_not_cache_keys_deleted_while_loading():
+    cache: LRUCache[str, int] = LRUCache(10)
+    release = asyncio.Event()
+
+    async def loader() -> int:
+        await release.wait()
+        return 1
+
+    task = asyncio.create_task(cache.get_or_load("a", loader))
+    await asyncio.sleep(0)
+    cache.clear()
+    release.set()
+
+    assert await task == 1
+    assert cache.get("a") is None
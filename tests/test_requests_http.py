@@ -0,0 +1,667 @@
+"""
+Tests for the outbound HTTP helpers in requests_http.
+
+Requests are made against a local aiohttp test server, no external network access is needed.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+import io
+import time
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import discord
+import pytest
+
+from ..src.kens_utils import requests_http, settings
+from ..src.kens_utils.enums import CircuitState
+
+
+@asynccontextmanager
+async def make_server(*routes: web.RouteDef):
+    app = web.Application()
+    app.add_routes(routes)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield server
+    finally:
+        await server.close()
+
+
+@pytest.fixture(autouse=True)
+def requests_log(tmp_path):
+    """Writes the requests log to a temporary directory instead of the working directory."""
+    previous = settings._settings
+    settings.init(None, requests_log=tmp_path / "requests.log")
+    yield
+    settings._settings.close()
+    settings._settings = previous
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state():
+    yield
+    requests_http.DEFAULT_RATE_LIMITER.clear()
+    requests_http.DEFAULT_CIRCUIT_BREAKER.reset()
+    requests_http.DEFAULT_HTTP_METRICS.reset()
+
+
+async def _ok(request: web.Request) -> web.Response:
+    return web.json_response({"ok": True})
+
+
+@pytest.mark.asyncio
+async def test_session_pool_reuses_session_per_host():
+    pool = requests_http.SessionPool()
+    try:
+        first = pool.get_session("http://127.0.0.1:1234/a")
+        second = pool.get_session("http://127.0.0.1:1234/b?c=d")
+        other = pool.get_session("http://127.0.0.1:4321/a")
+
+        assert first is second
+        assert first is not other
+    finally:
+        await pool.close()
+
+    assert pool.closed
+    assert first.closed and other.closed
+    with pytest.raises(RuntimeError):
+        pool.get_session("http://127.0.0.1:1234/a")
+
+
+@pytest.mark.asyncio
+async def test_request_uses_pooled_session():
+    async with make_server(web.get("/", _ok)) as server:
+        async with requests_http.SessionPool() as pool:
+            url = str(server.make_url("/"))
+
+            for _ in range(3):
+                response = await requests_http._get(url, pool=pool)
+                assert await response.json() == {"ok": True}
+
+            session = pool.get_session(url)
+            assert not session.closed
+            # every request went through the same session
+            assert len(pool._sessions) == 1
+
+
+def _flaky(*statuses: int, headers: dict = {}):
+    """Returns a handler (and its hit counter) that responds with `statuses` in order, then 200."""
+    hits = []
+
+    async def handler(request: web.Request) -> web.Response:
+        hits.append(request.path)
+        if len(hits) <= len(statuses):
+            return web.Response(status=statuses[len(hits) - 1], headers=headers)
+        return web.json_response({"ok": True})
+
+    return handler, hits
+
+
+def _fast_policy(**kwargs) -> requests_http.RetryPolicy:
+    kwargs.setdefault("base_delay", 0.01)
+    return requests_http.RetryPolicy(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_retries_5xx_then_succeeds():
+    handler, hits = _flaky(500, 503)
+    async with make_server(web.get("/", handler)) as server:
+        async with requests_http.SessionPool() as pool:
+            response = await requests_http._get(str(server.make_url("/")), pool=pool, retry_policy=_fast_policy())
+            assert response.status == 200
+    assert len(hits) == 3
+
+
+@pytest.mark.asyncio
+async def test_retries_429_with_retry_after():
+    handler, hits = _flaky(429, headers={"Retry-After": "0.05"})
+    async with make_server(web.get("/", handler)) as server:
+        async with requests_http.SessionPool() as pool:
+            response = await requests_http._get(str(server.make_url("/")), pool=pool, retry_policy=_fast_policy())
+            assert response.status == 200
+    assert len(hits) == 2
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_client_errors():
+    handler, hits = _flaky(404)
+    async with make_server(web.get("/", handler)) as server:
+        async with requests_http.SessionPool() as pool:
+            with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+                await requests_http._get(str(server.make_url("/")), pool=pool, retry_policy=_fast_policy())
+    assert exc_info.value.status == 404
+    assert len(hits) == 1
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts():
+    handler, hits = _flaky(*[502] * 10)
+    async with make_server(web.get("/", handler)) as server:
+        async with requests_http.SessionPool() as pool:
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await requests_http._get(
+                    str(server.make_url("/")), pool=pool, retry_policy=_fast_policy(max_attempts=4)
+                )
+    assert len(hits) == 4
+
+
+@pytest.mark.asyncio
+async def test_retry_after_longer_than_allowed_is_not_retried():
+    handler, hits = _flaky(429, headers={"Retry-After": "120"})
+    async with make_server(web.get("/", handler)) as server:
+        async with requests_http.SessionPool() as pool:
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await requests_http._get(str(server.make_url("/")), pool=pool, retry_policy=_fast_policy())
+    assert len(hits) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_limits_retries_per_host():
+    handler, hits = _flaky(*[503] * 100)
+    policy = _fast_policy(max_attempts=5, budget=requests_http.RetryBudget(ratio=0, min_retries=2))
+    async with make_server(web.get("/", handler)) as server:
+        async with requests_http.SessionPool() as pool:
+            for _ in range(3):
+                with pytest.raises(aiohttp.ClientConnectionError):
+                    await requests_http._get(str(server.make_url("/")), pool=pool, retry_policy=policy)
+    # 3 first attempts + the 2 retries the budget allows
+    assert len(hits) == 5
+
+
+@pytest.mark.asyncio
+async def test_timed_out_post_is_not_resent():
+    hits = []
+
+    async def slow(request: web.Request) -> web.Response:
+        hits.append(request.method)
+        await asyncio.sleep(0.5)
+        return web.json_response({"ok": True})
+
+    timeout = aiohttp.ClientTimeout(total=0.05)
+    async with make_server(web.get("/", slow), web.post("/", slow)) as server:
+        async with requests_http.SessionPool() as pool:
+            url = str(server.make_url("/"))
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await requests_http._post(url, pool=pool, retry_policy=_fast_policy(), timeout=timeout)
+            assert hits == ["POST"]
+
+            # GET is idempotent, so it is retried
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await requests_http._get(url, pool=pool, retry_policy=_fast_policy(max_attempts=2), timeout=timeout)
+            assert hits == ["POST", "GET", "GET"]
+
+    policy = requests_http.RetryPolicy(retry_non_idempotent=True)
+    assert policy.can_resend(requests_http.RequestType.POST)
+    assert not _fast_policy().can_resend(requests_http.RequestType.PATCH)
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"Retry-After": "3"}, 3.0),
+        ({"Retry-After": "1.5"}, 1.5),
+        ({"X-RateLimit-Reset-After": "2.25"}, 2.25),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+        ({"Retry-After": "soon"}, None),
+        ({}, None),
+    ],
+)
+def test_parse_retry_after(headers, expected):
+    assert requests_http.parse_retry_after(headers) == expected
+
+
+def test_retry_policy_backoff_is_capped():
+    policy = requests_http.RetryPolicy(base_delay=1, max_delay=5, jitter=False)
+    assert [policy.backoff(n) for n in range(1, 6)] == [1, 2, 4, 5, 5]
+    assert policy.is_retryable(503)
+    assert policy.is_retryable(429)
+    assert not policy.is_retryable(404)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_queues_before_limit():
+    remaining = [2]
+    statuses = []
+
+    async def handler(request: web.Request) -> web.Response:
+        if remaining[0] <= 0:
+            statuses.append(429)
+            return web.Response(status=429, headers={"Retry-After": "0.3"})
+        remaining[0] -= 1
+        statuses.append(200)
+        headers = {
+            "X-RateLimit-Limit": "2",
+            "X-RateLimit-Remaining": str(remaining[0]),
+            "X-RateLimit-Reset-After": "0.3",
+        }
+        if remaining[0] == 0:
+            # reset the window server-side once it is over
+            asyncio.get_running_loop().call_later(0.3, remaining.__setitem__, 0, 2)
+        return web.json_response({"ok": True}, headers=headers)
+
+    limiter = requests_http.RateLimiter()
+    async with make_server(web.get("/users/{id}", handler)) as server:
+        async with requests_http.SessionPool() as pool:
+            # learn the limits of the route
+            await requests_http._get(str(server.make_url("/users/1")), pool=pool, rate_limiter=limiter)
+
+            started = time.monotonic()
+            await asyncio.gather(
+                *(
+                    requests_http._get(str(server.make_url(f"/users/{i}")), pool=pool, rate_limiter=limiter)
+                    for i in range(2, 5)
+                )
+            )
+            elapsed = time.monotonic() - started
+
+    assert 429 not in statuses
+    assert elapsed >= 0.25
+
+
+def test_rate_limiter_route_key_templates_ids():
+    key = requests_http.RateLimiter.route_key("get", "https://api.blox.link/v4/public/guilds/123/discord-to-roblox/456")
+    assert key == "GET api.blox.link/v4/public/guilds/{id}/discord-to-roblox/{id}"
+
+
+def test_rate_limiter_shares_reported_buckets():
+    limiter = requests_http.RateLimiter()
+    first = limiter.route_key("GET", "https://example.com/a")
+    second = limiter.route_key("GET", "https://example.com/b")
+    limiter.update(first, {"X-RateLimit-Bucket": "abc", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "5"})
+    limiter.update(second, {"X-RateLimit-Bucket": "abc"})
+    assert limiter.get_bucket(first) is limiter.get_bucket(second)
+    assert limiter.get_bucket(second).delay(time.monotonic()) > 0
+
+
+@pytest.mark.asyncio
+async def test_coalesces_identical_in_flight_gets():
+    hits = []
+
+    async def handler(request: web.Request) -> web.Response:
+        hits.append(request.query_string)
+        await asyncio.sleep(0.1)
+        return web.json_response({"n": len(hits)})
+
+    async with make_server(web.get("/", handler)) as server:
+        async with requests_http.SessionPool() as pool:
+            url = str(server.make_url("/"))
+            responses = await asyncio.gather(
+                *(requests_http._get(url, pool=pool, params={"a": "1"}, coalesce=True) for _ in range(5)),
+                requests_http._get(url, pool=pool, params={"a": "2"}, coalesce=True),
+            )
+
+    assert len(hits) == 2
+    assert all(isinstance(r, requests_http.BufferedResponse) for r in responses)
+    # the body can be read by every caller
+    assert [await r.json() for r in responses[:5]] == [await responses[0].json()] * 5
+    assert not requests_http._in_flight
+
+
+@pytest.mark.asyncio
+async def test_coalesced_request_survives_cancelled_caller():
+    async def handler(request: web.Request) -> web.Response:
+        await asyncio.sleep(0.1)
+        return web.Response(text="done")
+
+    async with make_server(web.get("/", handler)) as server:
+        async with requests_http.SessionPool() as pool:
+            url = str(server.make_url("/"))
+            first = asyncio.ensure_future(requests_http._get(url, pool=pool, coalesce=True))
+            second = asyncio.ensure_future(requests_http._get(url, pool=pool, coalesce=True))
+            await asyncio.sleep(0.02)
+            first.cancel()
+
+            response = await second
+            assert await response.text() == "done"
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+
+def _versioned_handler(cache_control: str, hits: list):
+    """Returns a handler that serves an ETag'd body and answers conditional requests with 304."""
+
+    async def handler(request: web.Request) -> web.Response:
+        hits.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"', "Cache-Control": cache_control})
+        return web.json_response({"version": 1}, headers={"ETag": '"v1"', "Cache-Control": cache_control})
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_fresh_responses():
+    hits = []
+    cache = requests_http.HTTPCache()
+    async with make_server(web.get("/", _versioned_handler("max-age=60", hits))) as server:
+        async with requests_http.SessionPool() as pool:
+            url = str(server.make_url("/"))
+            for _ in range(3):
+                response = await requests_http._get(url, pool=pool, cache=cache)
+                assert await response.json() == {"version": 1}
+
+    assert hits == [None]
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_revalidates_with_etag():
+    hits = []
+    cache = requests_http.HTTPCache()
+    async with make_server(web.get("/", _versioned_handler("no-cache", hits))) as server:
+        async with requests_http.SessionPool() as pool:
+            url = str(server.make_url("/"))
+            first = await requests_http._get(url, pool=pool, cache=cache)
+            second = await requests_http._get(url, pool=pool, cache=cache)
+
+    assert hits == [None, '"v1"']
+    assert second.status == 200
+    assert await second.read() == await first.read()
+    assert cache.stats()["revalidations_unchanged"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_skips_no_store():
+    hits = []
+    cache = requests_http.HTTPCache()
+    async with make_server(web.get("/", _versioned_handler("no-store", hits))) as server:
+        async with requests_http.SessionPool() as pool:
+            url = str(server.make_url("/"))
+            await requests_http._get(url, pool=pool, cache=cache)
+            await requests_http._get(url, pool=pool, cache=cache)
+
+    assert hits == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_stale_while_revalidating():
+    hits = []
+    cache = requests_http.HTTPCache()
+    async with make_server(web.get("/", _versioned_handler("max-age=0, stale-while-revalidate=60", hits))) as server:
+        async with requests_http.SessionPool() as pool:
+            url = str(server.make_url("/"))
+            await requests_http._get(url, pool=pool, cache=cache)
+            stale = await requests_http._get(url, pool=pool, cache=cache)
+            assert await stale.json() == {"version": 1}
+
+            # the revalidation happens in the background
+            await asyncio.gather(*cache._revalidating.values())
+
+    assert hits == [None, '"v1"']
+    assert cache.stats()["stale_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_persists_to_disk(tmp_path):
+    hits = []
+    async with make_server(web.get("/", _versioned_handler("max-age=60", hits))) as server:
+        async with requests_http.SessionPool() as pool:
+            url = str(server.make_url("/"))
+            await requests_http._get(url, pool=pool, cache=requests_http.HTTPCache(path=tmp_path))
+
+            # a new cache (ex. after a restart) finds the response on disk
+            cache = requests_http.HTTPCache(path=tmp_path)
+            response = await requests_http._get(url, pool=pool, cache=cache)
+            assert await response.json() == {"version": 1}
+
+    assert hits == [None]
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_and_recovers():
+    failing = [True]
+    hits = []
+
+    async def handler(request: web.Request) -> web.Response:
+        hits.append(request.path)
+        return web.Response(status=500 if failing[0] else 200)
+
+    breaker = requests_http.CircuitBreaker(minimum_calls=2, failure_threshold=0.5, cooldown=0.2)
+    policy = _fast_policy(max_attempts=1)
+    async with make_server(web.get("/", handler)) as server:
+        async with requests_http.SessionPool() as pool:
+            url = str(server.make_url("/"))
+            host = f"{server.host}:{server.port}"
+
+            for _ in range(2):
+                with pytest.raises(aiohttp.ClientConnectionError):
+                    await requests_http._get(url, pool=pool, retry_policy=policy, circuit_breaker=breaker)
+            assert breaker.state(host) is CircuitState.open
+
+            # the request isn't even made
+            with pytest.raises(requests_http.CircuitOpenError) as exc_info:
+                await requests_http._get(url, pool=pool, retry_policy=policy, circuit_breaker=breaker)
+            assert exc_info.value.host == host
+            assert 0 < exc_info.value.retry_after <= 0.2
+            assert len(hits) == 2
+            assert breaker.snapshot()[host]["state"] == "open"
+
+            # nor does it wait for an exhausted rate limit bucket first
+            limiter = requests_http.RateLimiter()
+            bucket = limiter.get_bucket(requests_http.RateLimiter.route_key("GET", url))
+            bucket.limit, bucket.remaining, bucket.reset_at = 1, 0, time.monotonic() + 60
+            with pytest.raises(requests_http.CircuitOpenError):
+                await asyncio.wait_for(
+                    requests_http._get(url, pool=pool, retry_policy=policy, circuit_breaker=breaker, rate_limiter=limiter),
+                    1,
+                )
+            assert bucket.remaining == 0
+
+            await asyncio.sleep(0.25)
+            assert breaker.state(host) is CircuitState.half_open
+
+            failing[0] = False
+            response = await requests_http._get(url, pool=pool, retry_policy=policy, circuit_breaker=breaker)
+            assert response.status == 200
+            assert breaker.state(host) is CircuitState.closed
+
+
+def test_circuit_breaker_half_open_limits_trial_calls():
+    breaker = requests_http.CircuitBreaker(minimum_calls=1, cooldown=0)
+    breaker.record_failure("example.com")
+    assert breaker.state("example.com") is CircuitState.half_open
+
+    breaker.before_request("example.com")
+    with pytest.raises(requests_http.CircuitOpenError):
+        breaker.before_request("example.com")
+
+    # the trial request failed, so the circuit opens again
+    breaker.record_failure("example.com")
+    assert breaker._circuits["example.com"].state is CircuitState.open
+
+
+async def _large(request: web.Request) -> web.StreamResponse:
+    size = int(request.query.get("size", "0"))
+    response = web.StreamResponse()
+    if request.query.get("chunked"):
+        response.enable_chunked_encoding()
+    else:
+        response.content_length = size
+    await response.prepare(request)
+    for start in range(0, size, 1000):
+        await response.write(b"x" * min(1000, size - start))
+    await response.write_eof()
+    return response
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("size", "spooled"), [(500, False), (50_000, True)])
+async def test_stream_response_spools_large_bodies(size, spooled):
+    async with make_server(web.get("/", _large)) as server:
+        async with requests_http.SessionPool() as pool:
+            response = await requests_http._get(str(server.make_url("/")), pool=pool, params={"size": size})
+            fp = await requests_http.stream_response(response, spool_size=10_000)
+
+    try:
+        assert isinstance(fp, io.BytesIO) is not spooled
+        assert fp.read() == b"x" * size
+    finally:
+        fp.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunked", [False, True])
+async def test_stream_response_aborts_over_limit(chunked):
+    async with make_server(web.get("/", _large)) as server:
+        async with requests_http.SessionPool() as pool:
+            params = {"size": 50_000}
+            if chunked:
+                params["chunked"] = 1
+            response = await requests_http._get(str(server.make_url("/")), pool=pool, params=params)
+            with pytest.raises(requests_http.ResponseTooLargeError) as exc_info:
+                await requests_http.stream_response(response, limit=10_000)
+
+    assert exc_info.value.limit == 10_000
+    assert exc_info.value.size == (None if chunked else 50_000)
+
+
+@pytest.mark.asyncio
+async def test_download_file_returns_discord_file():
+    async with make_server(web.get("/", _large)) as server:
+        async with requests_http.SessionPool() as pool:
+            file = await requests_http.download_file(
+                str(server.make_url("/")), "test.txt", pool=pool, params={"size": 2_000}
+            )
+
+    assert isinstance(file, discord.File)
+    assert file.filename == "test.txt"
+    assert file.fp.read() == b"x" * 2_000
+    file.close()
+
+
+@pytest.mark.asyncio
+async def test_gather_requests_bounds_concurrency_and_captures_errors():
+    in_flight = [0]
+    peak = [0]
+
+    async def handler(request: web.Request) -> web.Response:
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.02)
+        in_flight[0] -= 1
+        if request.match_info["id"] == "7":
+            return web.Response(status=404)
+        return web.json_response({"id": int(request.match_info["id"])})
+
+    async with make_server(web.get("/users/{id}", handler)) as server:
+        async with requests_http.SessionPool() as pool:
+            urls = (str(server.make_url(f"/users/{i}")) for i in range(20))
+            results = [
+                result
+                async for result in requests_http.gather_requests(
+                    urls, concurrency=6, per_host_concurrency=3, pool=pool, rate_limiter=None
+                )
+            ]
+
+    assert peak[0] <= 3
+    assert sorted(r.index for r in results) == list(range(20))
+
+    failed = [r for r in results if not r.ok]
+    assert [r.index for r in failed] == [7]
+    assert isinstance(failed[0].error, aiohttp.ClientResponseError)
+    with pytest.raises(aiohttp.ClientResponseError):
+        failed[0].unwrap()
+
+    for result in results:
+        if result.ok:
+            assert await result.unwrap().json() == {"id": result.index}
+
+
+@pytest.mark.asyncio
+async def test_gather_requests_accepts_methods_and_cancels_on_early_exit():
+    methods = []
+
+    async def handler(request: web.Request) -> web.Response:
+        methods.append(request.method)
+        await asyncio.sleep(0.05 if request.method == "GET" else 0)
+        return web.Response(text=request.method)
+
+    async with make_server(web.route("*", "/", handler)) as server:
+        async with requests_http.SessionPool() as pool:
+            url = str(server.make_url("/"))
+            requests = [url, ("post", url, {"json": {"a": 1}}), ("DELETE", url)]
+            async for result in requests_http.gather_requests(requests, pool=pool):
+                # the POST/DELETE finish first, stop before the GET does
+                assert await result.unwrap().text() in ("POST", "DELETE")
+                break
+
+    assert sorted(methods) == ["DELETE", "GET", "POST"]
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = requests_http.Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+    assert histogram.to_dict() == {"count": 4, "sum": 2.65, "buckets": {"0.1": 2, "1.0": 3, "+Inf": 4}}
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_latency_status_retries_and_bytes():
+    metrics = requests_http.HTTPMetrics()
+    handler, hits = _flaky(503)
+    async with make_server(web.post("/items/{id}", handler)) as server:
+        async with requests_http.SessionPool(metrics=metrics) as pool:
+            url = str(server.make_url("/items/42"))
+            response = await requests_http._post(url, pool=pool, retry_policy=_fast_policy(), data=b"x" * 10)
+            assert response.status == 200
+            await response.read()
+
+    host = requests_http._host_of(url)
+    route = requests_http.RateLimiter.route_key("POST", url)
+    snapshot = metrics.snapshot()
+
+    assert snapshot["latency"][route]["count"] == 2
+    assert snapshot["responses"][host] == {"5xx": 1, "2xx": 1}
+    assert snapshot["retries"] == {host: 1}
+    assert snapshot["bytes_out"][host] == 20
+    assert snapshot["bytes_in"][host] > 0
+    assert snapshot["connections"][host]["created"] >= 1
+    assert snapshot["connect"][host]["count"] >= 1
+
+    exposition = metrics.to_prometheus()
+    assert f'kens_utils_http_retries_total{{host="{host}"}} 1' in exposition
+    assert f'kens_utils_http_request_duration_seconds_count{{route="{route}"}} 2' in exposition
+
+
+@pytest.mark.asyncio
+async def test_metrics_default_to_the_process_wide_pool():
+    metrics = requests_http.HTTPMetrics()
+    async with make_server(web.get("/", _ok)) as server:
+        url = str(server.make_url("/"))
+        async with requests_http.SessionPool(metrics=metrics) as pool:
+            requests_http.set_session_pool(pool)
+            try:
+                response = await requests_http._get(url)
+                await response.read()
+            finally:
+                requests_http.set_session_pool(None)
+
+    host = requests_http._host_of(url)
+    assert metrics.snapshot()["responses"][host] == {"2xx": 1}
+    assert host not in requests_http.DEFAULT_HTTP_METRICS.snapshot()["responses"]
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_errors_and_can_be_disabled():
+    metrics = requests_http.HTTPMetrics()
+    async with requests_http.SessionPool(metrics=metrics) as pool:
+        url = "http://127.0.0.1:1/"
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await requests_http._get(url, pool=pool, retry_policy=_fast_policy(max_attempts=2), circuit_breaker=None)
+
+    assert metrics.errors == {("127.0.0.1:1", "ClientConnectorError"): 2}
+    assert metrics.retries == {"127.0.0.1:1": 1}
+
+    async with make_server(web.get("/", _ok)) as server:
+        async with requests_http.SessionPool(metrics=metrics) as pool:
+            await requests_http._get(str(server.make_url("/")), pool=pool, metrics=None)
+
+    assert not metrics.latency.keys() - {requests_http.RateLimiter.route_key("GET", url)}
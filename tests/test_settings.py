@@ -0,0 +1,94 @@
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from ..src.kens_utils import constants, settings
+from ..src.kens_utils.logger import requests_logger
+from ..src.kens_utils.settings import Settings, get_settings, init
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+@pytest.fixture(autouse=True)
+def restore_settings():
+    previous = settings._settings
+    # nothing is written to the working directory, even if a test logs a request
+    init(None, requests_log=None)
+    yield
+    if settings._settings is not previous:
+        settings._settings.close()
+    settings._settings = previous
+
+
+def test_config_is_read_when_first_needed(tmp_path: Path):
+    path = tmp_path / "apikeys.yml"
+    config = Settings(path)
+    path.write_text("bloxlink_api: first\nrover_api: rover\n")
+    assert config.bloxlink_api_key == "first"
+    assert config.rover_api_key == "rover"
+
+    path.write_text("bloxlink_api: second\n")
+    assert config.bloxlink_api_key == "first"
+    config.reload()
+    assert config.bloxlink_api_key == "second"
+    assert config.rover_api_key is None
+
+
+def test_config_sources(tmp_path: Path):
+    assert Settings(tmp_path / "missing.yml").config == {}
+    assert Settings(None).config == {}
+    assert Settings({"rover_api": "key"}).rover_api_key == "key"
+
+    (tmp_path / "empty.yml").write_text("")
+    assert Settings(tmp_path / "empty.yml").config == {}
+
+
+def test_init_replaces_the_settings(tmp_path: Path):
+    init({"bloxlink_api": "key"}, requests_log=None)
+    assert get_settings().bloxlink_api_key == "key"
+    assert constants.BLOXLINK_API_KEY == "key"
+    assert get_settings().requests_handler is None
+
+    with pytest.raises(AttributeError):
+        constants.NOT_A_CONSTANT
+
+
+def test_requests_log_is_opened_on_first_record(tmp_path: Path):
+    log = tmp_path / "requests.log"
+    first = init(None, requests_log=log)
+    assert not log.exists()
+
+    requests_logger.info("first record")
+    assert "first record" in log.read_text()
+
+    # the old log is closed, records now go to the new one
+    other = tmp_path / "other.log"
+    init(None, requests_log=other)
+    assert first._requests_handler is None
+    requests_logger.log(logging.WARNING, "second record")
+    assert "second record" in other.read_text()
+    assert "second record" not in log.read_text()
+
+
+def test_imports_have_no_side_effects(tmp_path: Path):
+    (tmp_path / "apikeys.yml").write_text("bloxlink_api: key\n")
+    code = (
+        "import sys\n"
+        "import kens_utils.constants, kens_utils.logger, kens_utils.requests_http\n"
+        "assert 'yaml' not in sys.modules\n"
+        "print(kens_utils.constants.BLOXLINK_API_KEY)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(SRC)},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "key"
+    assert not (tmp_path / "requests.log").exists()
@@ -0,0 +1,400 @@
+import asyncio
+import gc
+import json
+import os
+import threading
+import types
+
+import pytest
+
+from ..src.kens_utils import umbra_async_config
+from ..src.kens_utils.umbra_async_config import Config, ShardedConfig, SQLiteConfig
+
+
+@pytest.mark.asyncio
+async def test_json_mode_rewrites_the_file(tmp_path):
+    path = tmp_path / "config.json"
+    config = Config(path)
+    await config.put(1, {"prefix": "!"})
+    await config.put(2, {"prefix": "?"})
+    await config.remove(2)
+
+    assert json.loads(path.read_text()) == {"1": {"prefix": "!"}}
+    assert Config(path).all() == {"1": {"prefix": "!"}}
+
+    config.all().clear()
+    assert config.get(1) == {"prefix": "!"}
+
+
+@pytest.mark.asyncio
+async def test_wal_appends_records_and_replays_them(tmp_path):
+    path = tmp_path / "config.json"
+    config = Config(path, wal=True)
+    await config.put(1, "a")
+    await config.put(2, "b")
+    await config.remove(1)
+    await config.put(2, "c")
+    await config.close()
+
+    assert not path.exists()
+    # the header (the snapshot the log extends), then one line per record
+    assert config.wal_path.read_bytes().splitlines()[0] == b"base 00000000"
+    assert len(config.wal_path.read_bytes().splitlines()) == 5
+    assert Config(path, wal=True).all() == {"2": "c"}
+
+
+@pytest.mark.asyncio
+async def test_wal_recovers_from_a_torn_record(tmp_path):
+    path = tmp_path / "config.json"
+    config = Config(path, wal=True)
+    await config.put("a", 1)
+    await config.put("b", 2)
+    await config.close()
+
+    # simulate a crash while appending a third record
+    with config.wal_path.open("ab") as f:
+        f.write(b'0badc0de ["p","c",')
+    good_size = config.wal_path.stat().st_size - len(b'0badc0de ["p","c",')
+
+    recovered = Config(path, wal=True)
+    assert recovered.all() == {"a": 1, "b": 2}
+    assert recovered.wal_path.stat().st_size == good_size
+
+    await recovered.put("c", 3)
+    await recovered.close()
+    assert Config(path, wal=True).all() == {"a": 1, "b": 2, "c": 3}
+
+
+@pytest.mark.asyncio
+async def test_log_older_than_the_snapshot_is_not_replayed(tmp_path, monkeypatch):
+    path = tmp_path / "config.bin"
+    config = Config(path, wal=True, serializer=umbra_async_config.BINARY_SERIALIZER)
+    await config.put("a", {"n": 1})
+    await config.put("t", (1, 2))
+    config.get("a")["n"] = 2
+
+    # the process dies after the new snapshot replaced the old one, before the log is deleted
+    def crash() -> None:
+        raise RuntimeError("crash")
+
+    monkeypatch.setattr(config, "_close_wal", crash)
+    with pytest.raises(RuntimeError):
+        await config.save()
+    assert config.wal_path.exists()
+
+    # the stale (JSON) records would have turned the tuple into a list and undone the change made in place
+    recovered = Config(path, wal=True, serializer=umbra_async_config.BINARY_SERIALIZER)
+    assert recovered.all() == {"a": {"n": 2}, "t": (1, 2)}
+    assert not recovered.wal_path.exists()
+
+    await recovered.put("b", 3)
+    await recovered.close()
+    assert Config(path, wal=True, serializer=umbra_async_config.BINARY_SERIALIZER).all() == {
+        "a": {"n": 2},
+        "t": (1, 2),
+        "b": 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_writes_are_fsynced(tmp_path, monkeypatch):
+    # whether each synced file descriptor is a directory
+    synced = []
+    fsync = lambda fd: synced.append(os.path.isdir(f"/proc/self/fd/{fd}"))
+    fake_os = types.SimpleNamespace(open=os.open, close=os.close, O_RDONLY=os.O_RDONLY, fsync=fsync)
+    monkeypatch.setattr(umbra_async_config, "os", fake_os)
+
+    # the temporary file, then the directory it was renamed in
+    await Config(tmp_path / "config.json").put(1, "a")
+    assert synced == [False, True]
+
+    # the directory the log was created in, then every append
+    synced.clear()
+    config = Config(tmp_path / "wal.json", wal=True)
+    await config.put(1, "a")
+    await config.put(2, "b")
+    await config.close()
+    assert synced == [True, False, False]
+
+
+@pytest.mark.asyncio
+async def test_wal_is_compacted_into_the_snapshot(tmp_path):
+    path = tmp_path / "config.json"
+    config = Config(path, wal=True, compact_threshold=3)
+    for i in range(4):
+        await config.put(i, i)
+
+    assert json.loads(path.read_text()) == {"0": 0, "1": 1, "2": 2}
+    assert len(config.wal_path.read_bytes().splitlines()) == 2
+
+    # values changed in place need a full save
+    await config.put("d", {"n": 1})
+    config.get("d")["n"] = 2
+    await config.save()
+    assert not config.wal_path.exists()
+    assert Config(path, wal=True).all() == {"0": 0, "1": 1, "2": 2, "3": 3, "d": {"n": 2}}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("wal", [False, True])
+async def test_changes_are_flushed_after_a_delay(tmp_path, wal):
+    path = tmp_path / "config.json"
+    config = Config(path, wal=wal, save_delay=0.05)
+    for i in range(10):
+        await config.put(i, i)
+
+    assert Config(path, wal=wal).all() == {}
+    await asyncio.sleep(0.1)
+    assert Config(path, wal=wal).all() == {str(i): i for i in range(10)}
+    if wal:
+        assert len(config.wal_path.read_bytes().splitlines()) == 11
+    await config.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_delayed_flush_is_logged_and_retried(tmp_path, monkeypatch, caplog):
+    path = tmp_path / "config.json"
+    config = Config(path, save_delay=0.05)
+    dump = config._dump
+    failures = [OSError("disk full")]
+
+    def flaky_dump(*args):
+        if failures:
+            raise failures.pop()
+        dump(*args)
+
+    monkeypatch.setattr(config, "_dump", flaky_dump)
+    await config.put("a", 1)
+
+    await asyncio.sleep(0.08)
+    assert "Failed to flush" in caplog.text
+    assert "disk full" in caplog.text
+    assert config in umbra_async_config._unsaved
+
+    await asyncio.sleep(0.1)
+    assert Config(path).all() == {"a": 1}
+    assert config not in umbra_async_config._unsaved
+    await config.close()
+
+
+@pytest.mark.asyncio
+async def test_changes_are_flushed_every_n_changes(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    config = Config(path, save_every=3)
+    dumps = []
+    dump = config._dump
+    monkeypatch.setattr(config, "_dump", lambda *args: (dumps.append(1), dump(*args)))
+
+    for i in range(7):
+        await config.put(i, i)
+    assert len(dumps) == 2
+    assert len(Config(path)) == 6
+
+    await config.flush()
+    await config.flush()
+    assert len(dumps) == 3
+    assert len(Config(path)) == 7
+
+
+@pytest.mark.asyncio
+async def test_batch_writes_once(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    config = Config(path)
+    dumps = []
+    dump = config._dump
+    monkeypatch.setattr(config, "_dump", lambda *args: (dumps.append(1), dump(*args)))
+
+    async with config.batch():
+        for i in range(5):
+            await config.put(i, i)
+        await config.remove(0)
+        assert dumps == []
+
+    assert dumps == [1]
+    assert Config(path).all() == {"1": 1, "2": 2, "3": 3, "4": 4}
+
+    await config.put(5, 5)  # back to saving every change
+    assert dumps == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_pending_changes_are_flushed_at_exit(tmp_path):
+    path = tmp_path / "config.json"
+    config = Config(path, wal=True, save_delay=60)
+    await config.put("a", 1)
+    assert config in umbra_async_config._unsaved
+
+    umbra_async_config._flush_unsaved()
+    assert config not in umbra_async_config._unsaved
+    assert Config(path, wal=True).all() == {"a": 1}
+    await config.close()
+
+
+@pytest.mark.asyncio
+async def test_dropped_configs_are_still_flushed_at_exit(tmp_path):
+    path = tmp_path / "config.json"
+    config = Config(path, save_every=10)
+    await config.put("a", 1)
+    del config
+    gc.collect()
+
+    umbra_async_config._flush_unsaved()
+    assert Config(path).all() == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_sqlite_config_api(tmp_path):
+    path = tmp_path / "config.sqlite"
+    config = SQLiteConfig(path, cache_size=2)
+    assert config.get(1) is None
+    assert 1 not in config
+
+    await config.put(1, {"prefix": "!"})
+    await config.put_many({2: "b", 3: "c"})
+    await config.put_many([(4, "d")])
+    await config.remove(3)
+    await config.remove("missing")
+
+    assert config.get(1) == {"prefix": "!"}
+    assert config[2] == "b"
+    assert config.get(3, "default") == "default"
+    with pytest.raises(KeyError):
+        config[3]
+    assert len(config) == 3
+    assert config.all() == {"1": {"prefix": "!"}, "2": "b", "4": "d"}
+    await config.close()
+
+    reopened = SQLiteConfig(path)
+    assert 4 in reopened
+    assert reopened.all() == {"1": {"prefix": "!"}, "2": "b", "4": "d"}
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_config_reads_during_a_write(tmp_path):
+    config = SQLiteConfig(tmp_path / "config.sqlite")
+    await config.put("a", 1)
+
+    with config._db_lock:
+        config._db.execute("BEGIN")
+        config._db.execute("INSERT INTO config VALUES ('b', '2')")
+        assert config.get("b") is None
+        assert config.all() == {"a": 1}
+        config._db.execute("COMMIT")
+
+    assert len(config) == 2
+    await config.close()
+
+
+@pytest.mark.asyncio
+async def test_put_many_writes_once(tmp_path, monkeypatch):
+    config = Config(tmp_path / "config.json")
+    dumps = []
+    dump = config._dump
+    monkeypatch.setattr(config, "_dump", lambda *args: (dumps.append(1), dump(*args)))
+
+    await config.put_many({i: i for i in range(10)})
+    assert dumps == [1]
+    assert len(Config(tmp_path / "config.json")) == 10
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shards", [4, None])
+async def test_sharded_config_only_writes_touched_shards(tmp_path, shards):
+    config = ShardedConfig(tmp_path, shards=shards)
+    await config.put_many({guild_id: {"prefix": "!"} for guild_id in range(20)})
+    files = sorted(tmp_path.glob("*.json"))
+    assert len(files) == (4 if shards else 20)
+
+    mtimes = {path: path.stat().st_mtime_ns for path in files}
+    await config.put(3, {"prefix": "?"})
+    changed = [path for path in files if path.stat().st_mtime_ns != mtimes[path]]
+    assert len(changed) == 1
+
+    await config.remove(4)
+    assert config.get(3) == {"prefix": "?"}
+    assert 4 not in config
+    await config.close()
+
+    reopened = ShardedConfig(tmp_path, shards=shards)
+    assert not reopened._loaded
+    assert reopened[3] == {"prefix": "?"}
+    assert len(reopened._loaded) == 1
+    assert len(reopened) == 19
+    assert reopened.all() == {str(i): {"prefix": "?" if i == 3 else "!"} for i in range(20) if i != 4}
+
+
+@pytest.mark.asyncio
+async def test_sharded_config_evicts_idle_shards(tmp_path, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(umbra_async_config, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    config = ShardedConfig(tmp_path, shards=None, idle_timeout=10, wal=True, save_delay=60)
+
+    await config.put("a", 1)
+    await config.put("b", 2)
+    await config.flush()
+    await config.put("b", 3)  # left pending
+
+    now[0] = 20
+    assert config.get("c") is None
+    assert set(config._loaded) == {"b", "c"}
+
+    async with config.batch():
+        await config.put("a", 4)
+        await config.put("a", 5)
+    assert ShardedConfig(tmp_path, shards=None, wal=True).get("a") == 5
+    await config.close()
+    assert ShardedConfig(tmp_path, shards=None, wal=True).all() == {"a": 5, "b": 3}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "serializer",
+    [
+        umbra_async_config.JSON_SERIALIZER,
+        umbra_async_config.ORJSON_SERIALIZER,
+        umbra_async_config.MSGPACK_SERIALIZER,
+        umbra_async_config.BINARY_SERIALIZER,
+    ],
+)
+async def test_serializers_round_trip(tmp_path, serializer):
+    if serializer is None:
+        pytest.skip("serializer dependency not installed")
+
+    path = tmp_path / "config.bin"
+    config = Config(path, serializer=serializer)
+    await config.put(1, {"prefix": "!", "roles": [1, 2], "ratio": 0.5, "enabled": True, "channel": None})
+
+    assert serializer.loads(path.read_bytes()) == config.all()
+    assert Config(path, serializer=serializer).all() == config.all()
+
+
+@pytest.mark.asyncio
+async def test_changes_during_a_dump_go_to_a_copy(tmp_path, monkeypatch):
+    config = Config(tmp_path / "config.json")
+    await config.put("a", 1)
+
+    started, release = threading.Event(), threading.Event()
+    dump = config._dump
+
+    def slow_dump(snapshot):
+        started.set()
+        release.wait(5)
+        dumped.append(dict(snapshot))
+        dump(snapshot)
+
+    dumped = []
+    monkeypatch.setattr(config, "_dump", slow_dump)
+    save = asyncio.create_task(config.save())
+    await asyncio.to_thread(started.wait, 5)
+
+    snapshot = config._snapshot
+    config_put = asyncio.create_task(config.put("b", 2))
+    await asyncio.sleep(0)
+    assert snapshot == {"a": 1}  # the dict being dumped wasn't touched
+    assert config.all() == {"a": 1, "b": 2}
+
+    release.set()
+    await save
+    await config_put
+    assert dumped == [{"a": 1}, {"a": 1, "b": 2}]